@@ -0,0 +1,186 @@
+"""Decode time of large `get_mods` and `get_fingerprints_matches` bodies.
+
+Compares the former path, parsing the body into dicts and passing them to the response
+model, with the `ResponseDecoder` backends validating the raw bytes, and with a `get_mods`
+projection only parsing a handful of `Mod` fields.
+
+    python benchmarks/bench_decode.py [--count 1000] [--repeat 5]
+"""
+
+import argparse
+import json
+import time
+from functools import partial
+from typing import Any, Callable
+
+from pydantic import BaseModel
+
+from cursedforged.api.decode import ResponseDecoder, orjson
+from cursedforged.types import (
+    GetFingerprintMatchesResponse,
+    GetModsResponse,
+    Mod,
+    project_response,
+)
+
+SUMMARY_FIELDS = ["id", "name", "slug", "download_count", "latest_files_indexes"]
+
+
+def file_json(file_id: int, mod_id: int) -> dict[str, Any]:
+    return {
+        "id": file_id,
+        "gameId": 432,
+        "modId": mod_id,
+        "isAvailable": True,
+        "displayName": "Example {}".format(file_id),
+        "fileName": "example-{}.jar".format(file_id),
+        "releaseType": 1,
+        "fileStatus": 4,
+        "hashes": [
+            {"value": "{:040x}".format(file_id), "algo": 1},
+            {"value": "{:032x}".format(file_id), "algo": 2},
+        ],
+        "fileDate": "2024-01-01T00:00:00Z",
+        "fileLength": 123456,
+        "downloadCount": 1000,
+        "downloadUrl": "https://edge.forgecdn.net/files/{}/example.jar".format(file_id),
+        "gameVersions": ["1.20.1", "1.20.2", "Forge", "Client", "Server"],
+        "sortableGameVersions": [
+            {
+                "gameVersionName": version,
+                "gameVersionPadded": "0000000001.0000000020.000000000{}".format(i),
+                "gameVersion": version,
+                "gameVersionReleaseDate": "2023-06-12T14:26:38.477Z",
+                "gameVersionTypeId": 75125,
+            }
+            for i, version in enumerate(["1.20.1", "1.20.2"], start=1)
+        ],
+        "dependencies": [{"modId": mod_id + i, "relationType": 3} for i in range(1, 4)],
+        "fileFingerprint": file_id * 7919,
+        "modules": [{"name": "META-INF", "fingerprint": file_id}],
+    }
+
+
+def mod_json(mod_id: int) -> dict[str, Any]:
+    return {
+        "id": mod_id,
+        "gameId": 432,
+        "name": "Example Mod {}".format(mod_id),
+        "slug": "example-mod-{}".format(mod_id),
+        "links": {"websiteUrl": "https://example.com", "wikiUrl": None, "issuesUrl": None, "sourceUrl": None},
+        "summary": "An example mod used to measure decoding.",
+        "status": 4,
+        "downloadCount": mod_id * 1000,
+        "isFeatured": False,
+        "primaryCategoryId": 406,
+        "categories": [
+            {
+                "id": 406,
+                "gameId": 432,
+                "name": "World Gen",
+                "slug": "world-gen",
+                "url": "https://www.curseforge.com/minecraft/mc-mods/world-gen",
+                "iconUrl": "https://media.forgecdn.net/avatars/6/470/635351497437388438.png",
+                "dateModified": "2014-05-08T17:42:23.74Z",
+                "classId": 6,
+                "parentCategoryId": 6,
+            }
+        ],
+        "classId": 6,
+        "authors": [{"id": 1, "name": "author", "url": "https://www.curseforge.com/members/author"}],
+        "screenshots": [],
+        "mainFileId": mod_id * 100,
+        "latestFiles": [file_json(mod_id * 100 + i, mod_id) for i in range(3)],
+        "latestFilesIndexes": [
+            {
+                "gameVersion": "1.20.{}".format(i),
+                "fileId": mod_id * 100 + i,
+                "filename": "example-{}.jar".format(i),
+                "releaseType": 1,
+                "gameVersionTypeId": 75125,
+                "modLoader": 1,
+            }
+            for i in range(10)
+        ],
+        "latestEarlyAccessFilesIndexes": [],
+        "dateCreated": "2020-01-01T00:00:00Z",
+        "dateModified": "2024-01-01T00:00:00Z",
+        "dateReleased": "2024-01-01T00:00:00Z",
+        "allowModDistribution": True,
+        "gamePopularityRank": 1,
+        "isAvailable": True,
+        "thumbsUpCount": 0,
+    }
+
+
+def fingerprint_matches_json(count: int) -> dict[str, Any]:
+    matches: list[dict[str, Any]] = [
+        {"id": i, "file": file_json(i * 100, i), "latestFiles": [file_json(i * 100 + 1, i)]}
+        for i in range(1, count + 1)
+    ]
+    return {
+        "data": {
+            "isCacheBuilt": True,
+            "exactMatches": matches,
+            "exactFingerprints": [match["file"]["fileFingerprint"] for match in matches],
+            "partialMatches": [],
+            "partialMatchFingerprints": {},
+            "additionalProperties": [],
+            "installedFingerprints": [],
+            "unmatchedFingerprints": [],
+        }
+    }
+
+
+def best_of(repeat: int, function: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    bodies: list[tuple[str, type[BaseModel], bytes]] = [
+        (
+            "get_mods",
+            GetModsResponse,
+            json.dumps({"data": [mod_json(i) for i in range(1, args.count + 1)]}).encode(),
+        ),
+        (
+            "get_fingerprints_matches",
+            GetFingerprintMatchesResponse,
+            json.dumps(fingerprint_matches_json(args.count)).encode(),
+        ),
+    ]
+
+    decoders = [("pydantic", ResponseDecoder("pydantic"))]
+    if orjson is not None:
+        decoders.append(("orjson", ResponseDecoder("orjson")))
+
+    for name, model, raw in bodies:
+        print("{} ({:.1f} MB)".format(name, len(raw) / 1e6))
+
+        def decode_dicts(model: type[BaseModel] = model, raw: bytes = raw) -> object:
+            return model(**json.loads(raw))
+
+        print("  {:<24} {:8.1f} ms".format("json.loads + Model(**)", best_of(args.repeat, decode_dicts)))
+        for backend, decoder in decoders:
+            elapsed = best_of(args.repeat, partial(decoder.decode, raw, model))
+            print("  {:<24} {:8.1f} ms".format(backend, elapsed))
+
+        if model is GetModsResponse:
+            projection = project_response(GetModsResponse, Mod, SUMMARY_FIELDS)
+            decoder = ResponseDecoder("pydantic")
+            elapsed = best_of(args.repeat, partial(decoder.decode, raw, projection))
+            print("  {:<24} {:8.1f} ms".format("pydantic + projection", elapsed))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Read time of mods served by the entity store and the response cache.
+
+Compares parsing the stored JSON again with reusing the instances validated when the
+data was first received.
+
+    python benchmarks/bench_store.py [--count 1000] [--repeat 5]
+"""
+
+import argparse
+import json
+import os
+import tempfile
+import time
+from typing import Callable
+
+from bench_decode import mod_json
+
+from cursedforged.api.cache import CacheEntry
+from cursedforged.api.store import EntityStore
+from cursedforged.types import GetModsResponse, Mod
+
+
+def best_of(repeat: int, function: Callable[[], object]) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function()
+        best = min(best, time.perf_counter() - start)
+    return best * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--count", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+
+    body = {"data": [mod_json(i) for i in range(1, args.count + 1)]}
+    mods = [Mod.model_validate(data) for data in body["data"]]
+    ids = [mod.id for mod in mods]
+
+    with tempfile.TemporaryDirectory() as directory:
+        path = os.path.join(directory, "entities.db")
+        EntityStore(path).put_mods(mods)
+        cold = EntityStore(path, memory_size=0)
+        warm = EntityStore(path)
+        warm.get_mods(ids)
+
+        print("EntityStore.get_mods ({} mods)".format(args.count))
+        print("  {:<24} {:8.2f} ms".format("parse stored JSON", best_of(args.repeat, lambda: cold.get_mods(ids))))
+        print("  {:<24} {:8.2f} ms".format("reuse instances", best_of(args.repeat, lambda: warm.get_mods(ids))))
+        cold.close()
+        warm.close()
+
+    entry = CacheEntry(data=json.loads(json.dumps(body)), expires_at=float("inf"))
+    entry.to_model(GetModsResponse)
+
+    print("cached get_mods response ({} mods)".format(args.count))
+    print(
+        "  {:<24} {:8.2f} ms".format(
+            "validate cached data", best_of(args.repeat, lambda: GetModsResponse.model_validate(entry.data))
+        )
+    )
+    print(
+        "  {:<24} {:8.2f} ms".format(
+            "reuse instance", best_of(args.repeat, lambda: entry.to_model(GetModsResponse))
+        )
+    )
+
+
+if __name__ == "__main__":
+    main()
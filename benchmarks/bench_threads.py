@@ -0,0 +1,89 @@
+"""Requests per second of a shared `APIClient` as the number of threads grows.
+
+A local HTTP/1.1 server answers every request with the same gzip compressed JSON body,
+so the numbers reflect the client side: connection reuse, decompression and decoding.
+Each cell shows the requests per second and, in parentheses, the connections opened.
+
+    python benchmarks/bench_threads.py [--requests 2000] [--threads 1 4 16 64]
+"""
+
+import argparse
+import gzip
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from cursedforged.api.client import APIClient
+
+BODY = json.dumps(
+    {"data": [{"id": i, "name": "Game {}".format(i), "slug": "game-{}".format(i)} for i in range(200)]}
+).encode()
+GZIP_BODY = gzip.compress(BODY)
+
+
+class Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+    connections = 0
+
+    def setup(self) -> None:
+        super().setup()
+        Handler.connections += 1
+
+    def log_message(self, *args: object) -> None:
+        pass
+
+    def do_GET(self) -> None:
+        gzipped = "gzip" in self.headers.get("Accept-Encoding", "")
+        body = GZIP_BODY if gzipped else BODY
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        if gzipped:
+            self.send_header("Content-Encoding", "gzip")
+        if self.headers.get("Connection") == "close":
+            self.send_header("Connection", "close")
+            self.close_connection = True
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def run(base_url: str, threads: int, requests: int, **kwargs: object) -> str:
+    Handler.connections = 0
+    client = APIClient("benchmark", base_url, **kwargs)  # type: ignore[arg-type]
+    with ThreadPoolExecutor(max_workers=threads) as executor:
+        start = time.perf_counter()
+        list(executor.map(lambda _: client.get("v1/games"), range(requests)))
+        elapsed = time.perf_counter() - start
+    client.client.close()
+    return "{:.0f} ({})".format(requests / elapsed, Handler.connections)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--threads", type=int, nargs="+", default=[1, 4, 16, 64])
+    args = parser.parse_args()
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = "http://127.0.0.1:{}".format(server.server_address[1])
+
+    print("{:>8} {:>16} {:>16} {:>16}".format("threads", "no keep-alive", "pool=10", "pool=threads"))
+    for threads in args.threads:
+        print(
+            "{:>8} {:>16} {:>16} {:>16}".format(
+                threads,
+                run(base_url, threads, args.requests, keep_alive=False),
+                run(base_url, threads, args.requests, pool_maxsize=10),
+                run(base_url, threads, args.requests, pool_maxsize=threads),
+            )
+        )
+    server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,354 @@
+import asyncio
+import json
+from typing import Any, Self
+
+from .base import BaseAPIClient
+from .cache import CacheEntry, ResponseCache
+from .coalesce import AsyncSingleflight
+from .decode import JSONBackend, ModelT, ResponseDecoder
+from .errors import error_for_status, parse_retry_after
+from .ratelimit import RateLimiter, RetryPolicy
+from .store import EntityStore
+from .v1.aio import AsyncAPI_v1
+from .v2.aio import AsyncAPI_v2
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None  # type: ignore[assignment]
+
+
+class AsyncAPIClient(BaseAPIClient):
+    """asyncio counterpart of `APIClient` backed by an `aiohttp.ClientSession`.
+
+    The session is created lazily inside the running event loop, so the client can be
+    constructed outside of a coroutine. Close it with `await client.close()` or use it
+    as an async context manager.
+
+    The session opens at most `pool_maxsize` concurrent connections and negotiates gzip
+    (and brotli, when the `brotli` package is installed) compression. A client must only
+    be used from the event loop it was first used in. Response bodies are validated
+    straight from the raw bytes, see `ResponseDecoder` for the available `json_backend`
+    values. Identical concurrent GET requests share a single request, see `APIClient`.
+    The cache is read and written on worker threads, so a `FileCacheBackend` does not
+    block the event loop.
+    """
+
+    client: "aiohttp.ClientSession | None"  # type: ignore[assignment]
+
+    def __init__(
+        self,
+        api_key: str,
+        base_url: str = "https://api.curseforge.com",
+        client: "aiohttp.ClientSession | None" = None,
+        cache: ResponseCache | None = None,
+        store: EntityStore | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+        pool_maxsize: int = 100,
+        keep_alive: bool = True,
+        json_backend: JSONBackend = "pydantic",
+        coalesce: bool = True,
+    ):
+        if aiohttp is None:
+            raise ImportError(
+                "AsyncAPIClient requires aiohttp, install it with `pip install cursedforged[async]`"
+            )
+
+        self.api_key = api_key
+        self.base_url = base_url
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
+        self.client = client
+        self._owns_client = client is None
+        self.cache = cache
+        self.store = store
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.decoder = ResponseDecoder(json_backend)
+        self.inflight = AsyncSingleflight() if coalesce else None
+
+        self.v1 = AsyncAPI_v1(self)
+        self.v2 = AsyncAPI_v2(self)
+
+    async def __aenter__(self) -> Self:
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.close()
+
+    def _init_client(self) -> "aiohttp.ClientSession":
+        """Return the underlying session, creating it on first use and after it was closed.
+
+        Returns:
+            aiohttp.ClientSession: The initialized client.
+        """
+        if self.client is None or self.client.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.pool_maxsize, force_close=not self.keep_alive
+            )
+            self.client = aiohttp.ClientSession(connector=connector)
+            self._owns_client = True
+        return self.client
+
+    def _build_request_uri(self, endpoint: str) -> str:
+        """Build the request URI for the specified endpoint.
+
+        Args:
+            endpoint (str): The endpoint to build the URI for.
+
+        Returns:
+            str: The built URI.
+        """
+        return "{}/{}".format(self.base_url, endpoint.strip("/"))
+
+    def _build_headers(self) -> dict[str, str]:
+        """Build the headers sent with every request.
+
+        Returns:
+            dict[str, str]: The request headers.
+        """
+        return {
+            "x-api-key": self.api_key,
+            "Accept": "application/json",
+        }
+
+    @staticmethod
+    def _build_params(params: dict[str, Any] | None) -> list[tuple[str, str]]:
+        """Encode query parameters the same way `requests` does.
+
+        `None` values are dropped, lists are expanded into repeated keys and every value
+        is converted with `str`, e.g. `True` is sent as "True", since aiohttp only accepts
+        string and number values.
+
+        Args:
+            params (dict[str, Any] | None): The parameters to encode.
+
+        Returns:
+            list[tuple[str, str]]: The encoded parameters.
+        """
+        encoded: list[tuple[str, str]] = []
+        for key, value in (params or {}).items():
+            values = value if isinstance(value, (list, tuple)) else [value]
+            for item in values:
+                if item is None:
+                    continue
+                encoded.append((key, str(item)))
+        return encoded
+
+    @staticmethod
+    def _error_body(body: bytes) -> Any:
+        """Decode the body of an error response, falling back to its text.
+
+        Args:
+            body (bytes): The raw response body.
+
+        Returns:
+            Any: The decoded body.
+        """
+        try:
+            return json.loads(body)
+        except ValueError:
+            return body.decode(errors="replace")
+
+    async def _send(
+        self, method: str, endpoint: str, **kwargs: Any
+    ) -> tuple["aiohttp.ClientResponse", bytes]:
+        """Send a request through the rate limiter, retrying it according to the retry policy.
+
+        The body is read before the connection is released and returned along with the
+        response.
+
+        Args:
+            method (str): The HTTP method.
+            endpoint (str): The endpoint to send the request to.
+            **kwargs (Any): The arguments passed to `aiohttp.ClientSession.request`.
+
+        Raises:
+            RateLimitError: The API answered 429 and the retries are exhausted.
+            APIError: The API answered with another error status.
+
+        Returns:
+            tuple[aiohttp.ClientResponse, bytes]: The successful (or `304 Not Modified`) response and its body.
+        """
+        url = self._build_request_uri(endpoint)
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire_async()
+            try:
+                async with self._init_client().request(method, url, **kwargs) as response:
+                    body = await response.read()
+            except (aiohttp.ClientConnectionError, TimeoutError):
+                if self.retry is None or not self.retry.should_retry(attempt, None):
+                    raise
+                await asyncio.sleep(self.retry.delay(attempt))
+                attempt += 1
+                continue
+
+            if response.status < 400:
+                return response, body
+
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if self.retry is None or not self.retry.should_retry(
+                attempt, response.status, retry_after
+            ):
+                raise error_for_status(response.status, url, self._error_body(body), retry_after)
+
+            delay = self.retry.delay(attempt, retry_after)
+            if response.status == 429 and self.rate_limiter is not None:
+                # Holding back the shared bucket makes every other task wait too.
+                self.rate_limiter.pause(delay)
+            else:
+                await asyncio.sleep(delay)
+            attempt += 1
+
+    async def get(self, endpoint: str, params: dict[str, Any] | None = None) -> Any:
+        """Send a GET request to the specified endpoint.
+
+        Args:
+            endpoint (str): The endpoint to send the request to.
+            params (dict[str, Any] | None, optional): The parameters to send with the request. Defaults to None.
+
+        Raises:
+            APIError: The API answered with an error status.
+
+        Returns:
+            Any: The response data.
+        """
+        if self.inflight is None:
+            return await self._get(endpoint, params)
+        return await self.inflight.do(
+            (None, ResponseCache.build_key(endpoint, params)), lambda: self._get(endpoint, params)
+        )
+
+    async def _get(self, endpoint: str, params: dict[str, Any] | None) -> Any:
+        if self.cache is None:
+            _, body = await self._send(
+                "GET", endpoint, params=self._build_params(params), headers=self._build_headers()
+            )
+            return self.decoder.loads(body)
+
+        return (await self._get_entry(self.cache, endpoint, params)).data
+
+    async def _get_entry(
+        self, cache: ResponseCache, endpoint: str, params: dict[str, Any] | None
+    ) -> CacheEntry:
+        """Send a GET request through the cache.
+
+        A fresh entry is returned as is, a stale one is revalidated and a missing one is
+        requested and stored. The backend is only accessed from worker threads, since a
+        `FileCacheBackend` does blocking file operations.
+
+        Args:
+            cache (ResponseCache): The client's cache.
+            endpoint (str): The endpoint to send the request to.
+            params (dict[str, Any] | None): The parameters to send with the request.
+
+        Raises:
+            APIError: The API answered with an error status.
+
+        Returns:
+            CacheEntry: The cache entry of the response.
+        """
+        key = cache.build_key(endpoint, params)
+        entry = await asyncio.to_thread(cache.lookup, key)
+        if entry is not None and entry.is_fresh():
+            cache.stats.record("hits")
+            return entry
+
+        headers = self._build_headers()
+        if entry is not None:
+            headers.update(entry.validators())
+        response, body = await self._send(
+            "GET", endpoint, params=self._build_params(params), headers=headers
+        )
+        if entry is not None and response.status == 304:
+            cache.stats.record("revalidations")
+            return await asyncio.to_thread(cache.refresh, key, endpoint, entry, response.headers)
+
+        cache.stats.record("misses")
+        data = self.decoder.loads(body)
+        return await asyncio.to_thread(cache.store, key, endpoint, data, response.headers)
+
+    async def post(self, endpoint: str, data: dict[str, Any] | None = None) -> Any:
+        """Send a POST request to the specified endpoint.
+
+        Args:
+            endpoint (str): The endpoint to send the request to.
+            data (dict[str, Any] | None, optional): The data to send with the request. Defaults to None.
+
+        Raises:
+            APIError: The API answered with an error status.
+
+        Returns:
+            Any: The response data.
+        """
+        _, body = await self._send(
+            "POST", endpoint, json=data or {}, headers=self._build_headers()
+        )
+        return self.decoder.loads(body)
+
+    async def get_model(  # type: ignore[override]
+        self, endpoint: str, model: type[ModelT], params: dict[str, Any] | None = None
+    ) -> ModelT:
+        """Send a GET request to the specified endpoint and validate the response body.
+
+        Without a cache, the raw body is validated directly, without building the
+        intermediate JSON data. With a cache, the model validated from a cached response
+        is reused as long as the response is, see `CacheEntry.to_model`.
+
+        Args:
+            endpoint (str): The endpoint to send the request to.
+            model (type[ModelT]): The response model.
+            params (dict[str, Any] | None, optional): The parameters to send with the request. Defaults to None.
+
+        Raises:
+            APIError: The API answered with an error status.
+
+        Returns:
+            ModelT: The validated response.
+        """
+        if self.inflight is None:
+            return await self._get_model(endpoint, model, params)
+        return await self.inflight.do(
+            (model, ResponseCache.build_key(endpoint, params)),
+            lambda: self._get_model(endpoint, model, params),
+        )
+
+    async def _get_model(
+        self, endpoint: str, model: type[ModelT], params: dict[str, Any] | None
+    ) -> ModelT:
+        if self.cache is not None:
+            return (await self._get_entry(self.cache, endpoint, params)).to_model(model)
+
+        _, body = await self._send(
+            "GET", endpoint, params=self._build_params(params), headers=self._build_headers()
+        )
+        return self.decoder.decode(body, model)
+
+    async def post_model(  # type: ignore[override]
+        self, endpoint: str, model: type[ModelT], data: dict[str, Any] | None = None
+    ) -> ModelT:
+        """Send a POST request to the specified endpoint and validate the response body.
+
+        Args:
+            endpoint (str): The endpoint to send the request to.
+            model (type[ModelT]): The response model.
+            data (dict[str, Any] | None, optional): The data to send with the request. Defaults to None.
+
+        Raises:
+            APIError: The API answered with an error status.
+
+        Returns:
+            ModelT: The validated response.
+        """
+        _, body = await self._send(
+            "POST", endpoint, json=data or {}, headers=self._build_headers()
+        )
+        return self.decoder.decode(body, model)
+
+    async def close(self) -> None:
+        """Close the underlying session if it was created by this client."""
+        if self.client is not None and self._owns_client and not self.client.closed:
+            await self.client.close()
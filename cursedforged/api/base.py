@@ -3,8 +3,14 @@ from typing import Any
 
 from abc import ABC, abstractmethod
 
+from .decode import ModelT, ResponseDecoder
+from .store import EntityStore
+
 
 class BaseAPIClient(ABC):
+    store: EntityStore | None = None
+    decoder: ResponseDecoder = ResponseDecoder()
+
     def __init__(
         self,
         api_key: str,
@@ -40,3 +46,35 @@ class BaseAPIClient(ABC):
             Any: The response data.
         """
         pass
+
+    @abstractmethod
+    def get_model(
+        self, endpoint: str, model: type[ModelT], params: dict[str, Any] | None = None
+    ) -> ModelT:
+        """Send a GET request to the specified endpoint and validate the response body.
+
+        Args:
+            endpoint (str): The endpoint to send the request to.
+            model (type[ModelT]): The response model.
+            params (dict[str, Any] | None, optional): The parameters to send with the request. Defaults to None.
+
+        Returns:
+            ModelT: The validated response.
+        """
+        pass
+
+    @abstractmethod
+    def post_model(
+        self, endpoint: str, model: type[ModelT], data: dict[str, Any] | None = None
+    ) -> ModelT:
+        """Send a POST request to the specified endpoint and validate the response body.
+
+        Args:
+            endpoint (str): The endpoint to send the request to.
+            model (type[ModelT]): The response model.
+            data (dict[str, Any] | None, optional): The data to send with the request. Defaults to None.
+
+        Returns:
+            ModelT: The validated response.
+        """
+        pass
@@ -0,0 +1,130 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from typing import Awaitable, Callable, Iterable, TypeVar
+
+from .errors import REQUEST_ERRORS
+
+T = TypeVar("T")
+
+DEFAULT_CHUNK_SIZE = 500
+"""The default number of ids sent in a single batch request."""
+
+
+def chunk_ids(ids: Iterable[int], chunk_size: int = DEFAULT_CHUNK_SIZE) -> list[list[int]]:
+    """Deduplicate ids, keeping their first occurrence, and split them into chunks.
+
+    Args:
+        ids (Iterable[int]): The ids to split.
+        chunk_size (int, optional): The maximum number of ids per chunk. Defaults to 500.
+
+    Returns:
+        list[list[int]]: The chunks in order.
+    """
+    unique = list(dict.fromkeys(ids))
+    size = max(1, chunk_size)
+    return [unique[i : i + size] for i in range(0, len(unique), size)]
+
+
+def in_id_order(ids: Iterable[int], items: dict[int, T]) -> list[T]:
+    """Order items by the ids they were requested with, keeping each id once.
+
+    Args:
+        ids (Iterable[int]): The requested ids.
+        items (dict[int, T]): The items found, by id.
+
+    Returns:
+        list[T]: The items in the order of their first requested id, the ids without an item are skipped.
+    """
+    return [items[item_id] for item_id in dict.fromkeys(ids) if item_id in items]
+
+
+def fetch_chunks(
+    fetch_chunk: Callable[[list[int]], list[T]],
+    ids: Iterable[int],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_concurrency: int = 8,
+) -> tuple[list[T], dict[int, Exception]]:
+    """Fetch the items for a list of ids in parallel chunks.
+
+    A chunk failing with one of the `REQUEST_ERRORS` does not abort the others, the error
+    is reported for each of its ids. Any other exception is a bug and propagates.
+
+    Args:
+        fetch_chunk (Callable[[list[int]], list[T]]): Fetches the items for a chunk of ids.
+        ids (Iterable[int]): The ids to fetch.
+        chunk_size (int, optional): The maximum number of ids per chunk. Defaults to 500.
+        max_concurrency (int, optional): The maximum number of chunks requested at once. Defaults to 8.
+
+    Returns:
+        tuple[list[T], dict[int, Exception]]: The items in chunk order and the errors by id.
+    """
+    chunks = chunk_ids(ids, chunk_size)
+
+    def fetch(chunk: list[int]) -> list[T] | Exception:
+        try:
+            return fetch_chunk(chunk)
+        except REQUEST_ERRORS as e:
+            return e
+
+    if len(chunks) <= 1:
+        results = [fetch(chunk) for chunk in chunks]
+    else:
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+            results = list(executor.map(fetch, chunks))
+
+    return merge_chunk_results(chunks, results)
+
+
+async def afetch_chunks(
+    fetch_chunk: Callable[[list[int]], Awaitable[list[T]]],
+    ids: Iterable[int],
+    chunk_size: int = DEFAULT_CHUNK_SIZE,
+    max_concurrency: int = 8,
+) -> tuple[list[T], dict[int, Exception]]:
+    """Asynchronously fetch the items for a list of ids in concurrent chunks.
+
+    See `fetch_chunks`, the chunks are requested as concurrent tasks.
+
+    Args:
+        fetch_chunk (Callable[[list[int]], Awaitable[list[T]]]): Fetches the items for a chunk of ids.
+        ids (Iterable[int]): The ids to fetch.
+        chunk_size (int, optional): The maximum number of ids per chunk. Defaults to 500.
+        max_concurrency (int, optional): The maximum number of chunks requested at once. Defaults to 8.
+
+    Returns:
+        tuple[list[T], dict[int, Exception]]: The items in chunk order and the errors by id.
+    """
+    chunks = chunk_ids(ids, chunk_size)
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def fetch(chunk: list[int]) -> list[T] | Exception:
+        async with semaphore:
+            try:
+                return await fetch_chunk(chunk)
+            except REQUEST_ERRORS as e:
+                return e
+
+    results = await asyncio.gather(*(fetch(chunk) for chunk in chunks))
+    return merge_chunk_results(chunks, list(results))
+
+
+def merge_chunk_results(
+    chunks: list[list[int]], results: list[list[T] | Exception]
+) -> tuple[list[T], dict[int, Exception]]:
+    """Flatten chunk results, collecting the error of each failed chunk by id.
+
+    Args:
+        chunks (list[list[int]]): The requested chunks.
+        results (list[list[T] | Exception]): The items or the error of each chunk.
+
+    Returns:
+        tuple[list[T], dict[int, Exception]]: The items in chunk order and the errors by id.
+    """
+    items: list[T] = []
+    errors: dict[int, Exception] = {}
+    for chunk, result in zip(chunks, results):
+        if isinstance(result, Exception):
+            errors.update(dict.fromkeys(chunk, result))
+        else:
+            items.extend(result)
+    return items, errors
@@ -0,0 +1,415 @@
+import hashlib
+import json
+import os
+import threading
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from fnmatch import fnmatchcase
+from typing import Any, TypeVar
+
+from pydantic import BaseModel
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+DEFAULT_TTLS: dict[str, float] = {
+    "v1/games": 3600,
+    "v1/games/*": 3600,
+    "v2/games/*": 3600,
+    "v1/categories": 3600,
+    "v1/minecraft/*": 3600,
+}
+"""Time to live in seconds of the endpoints whose data rarely changes, keyed by endpoint pattern."""
+
+
+@dataclass
+class CacheEntry:
+    data: Any
+    expires_at: float
+    etag: str | None = None
+    last_modified: str | None = None
+    models: dict[type, Any] = field(default_factory=dict, repr=False, compare=False)
+    """The response models already validated from `data`, by model class."""
+
+    def is_fresh(self) -> bool:
+        return time.time() < self.expires_at
+
+    def to_model(self, model: type[ModelT]) -> ModelT:
+        """Get the data as a response model, validating it only the first time.
+
+        The cached data was validated when the response was received, so later calls
+        trust the memoized instance and return a shallow copy of it instead of validating
+        the data again. The nested objects are shared between the copies and must be
+        treated as read-only. The memoized instances live as long as the entry object
+        does: every entry of a `MemoryCacheBackend`, the recently used entries of a
+        `FileCacheBackend`.
+
+        Args:
+            model (type[ModelT]): The response model.
+
+        Returns:
+            ModelT: The response.
+        """
+        instance = self.models.get(model)
+        if instance is None:
+            instance = self.models[model] = model.model_validate(self.data)
+        return instance.model_copy()
+
+    def validators(self) -> dict[str, str]:
+        """Build the conditional request headers used to revalidate the entry.
+
+        Returns:
+            dict[str, str]: The `If-None-Match` and `If-Modified-Since` headers that apply.
+        """
+        headers = {}
+        if self.etag is not None:
+            headers["If-None-Match"] = self.etag
+        if self.last_modified is not None:
+            headers["If-Modified-Since"] = self.last_modified
+        return headers
+
+
+@dataclass
+class CacheStats:
+    hits: int = 0
+    misses: int = 0
+    revalidations: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False, compare=False)
+
+    def record(self, name: str) -> None:
+        with self._lock:
+            setattr(self, name, getattr(self, name) + 1)
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.revalidations + self.misses
+        return (self.hits + self.revalidations) / total if total else 0.0
+
+
+class BaseCacheBackend(ABC):
+    @abstractmethod
+    def get(self, key: str) -> CacheEntry | None:
+        """Get the entry stored under the specified key.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            CacheEntry | None: The entry, or None if there is none.
+        """
+
+    @abstractmethod
+    def set(self, key: str, entry: CacheEntry) -> None:
+        """Store an entry under the specified key, evicting older entries if needed.
+
+        Args:
+            key (str): The cache key.
+            entry (CacheEntry): The entry to store.
+        """
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove the entry stored under the specified key, if any.
+
+        Args:
+            key (str): The cache key.
+        """
+
+    @abstractmethod
+    def clear(self) -> None:
+        """Remove every entry."""
+
+
+class MemoryCacheBackend(BaseCacheBackend):
+    """A thread-safe in-memory backend evicting the least recently used entries."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: OrderedDict[str, CacheEntry] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> CacheEntry | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+            return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+class FileCacheBackend(BaseCacheBackend):
+    """An on-disk backend storing one JSON document per entry.
+
+    Entries are evicted by least recent access (file modification time) once more than
+    `max_entries` are stored, so the cache survives process restarts.
+
+    The last `memory_entries` entries read or written are also kept decoded in memory,
+    along with the response models validated from them, and reused as long as their file
+    is unchanged. A hit on one of them costs a `stat` instead of parsing the document and
+    validating the response again.
+
+    Args:
+        directory (str | os.PathLike[str]): The directory the documents are stored in.
+        max_entries (int, optional): The maximum number of stored entries. Defaults to 10000.
+        memory_entries (int, optional): The maximum number of entries kept decoded in memory. Defaults to 128.
+    """
+
+    def __init__(
+        self,
+        directory: str | os.PathLike[str],
+        max_entries: int = 10_000,
+        memory_entries: int = 128,
+    ):
+        self.directory = os.fspath(directory)
+        self.max_entries = max_entries
+        self.memory_entries = memory_entries
+        self._lock = threading.Lock()
+        self._decoded: OrderedDict[str, tuple[tuple[int, int], CacheEntry]] = OrderedDict()
+        os.makedirs(self.directory, exist_ok=True)
+        self._count = len(self._paths())
+
+    def _paths(self) -> list[str]:
+        return [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.endswith(".json")
+        ]
+
+    def _path(self, key: str) -> str:
+        digest = hashlib.sha256(key.encode()).hexdigest()
+        return os.path.join(self.directory, "{}.json".format(digest))
+
+    def _remember(self, key: str, path: str, entry: CacheEntry) -> None:
+        """Keep a decoded entry along with the state of its file, must be called with the lock held."""
+        try:
+            st = os.stat(path)
+        except OSError:
+            self._decoded.pop(key, None)
+            return
+        self._decoded[key] = ((st.st_mtime_ns, st.st_size), entry)
+        self._decoded.move_to_end(key)
+        while len(self._decoded) > self.memory_entries:
+            self._decoded.popitem(last=False)
+
+    def get(self, key: str) -> CacheEntry | None:
+        path = self._path(key)
+        try:
+            st = os.stat(path)
+            os.utime(path)
+        except OSError:
+            with self._lock:
+                self._decoded.pop(key, None)
+            return None
+
+        with self._lock:
+            remembered = self._decoded.get(key)
+            if remembered is not None and remembered[0] == (st.st_mtime_ns, st.st_size):
+                self._remember(key, path, remembered[1])
+                return remembered[1]
+
+        try:
+            with open(path, "rb") as f:
+                document = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if document.get("key") != key:
+            return None
+        entry = CacheEntry(
+            data=document["data"],
+            expires_at=document["expires_at"],
+            etag=document.get("etag"),
+            last_modified=document.get("last_modified"),
+        )
+        with self._lock:
+            self._remember(key, path, entry)
+        return entry
+
+    def set(self, key: str, entry: CacheEntry) -> None:
+        path = self._path(key)
+        document = {
+            "key": key,
+            "data": entry.data,
+            "expires_at": entry.expires_at,
+            "etag": entry.etag,
+            "last_modified": entry.last_modified,
+        }
+        tmp_path = "{}.{}.tmp".format(path, threading.get_ident())
+        with self._lock:
+            existed = os.path.exists(path)
+            with open(tmp_path, "w", encoding="utf-8") as f:
+                json.dump(document, f)
+            os.replace(tmp_path, path)
+            self._remember(key, path, entry)
+            if not existed:
+                self._count += 1
+            if self._count > self.max_entries:
+                self._evict()
+
+    def _evict(self) -> None:
+        paths = sorted(self._paths(), key=lambda p: os.stat(p).st_mtime)
+        for path in paths[: max(0, len(paths) - self.max_entries)]:
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+        self._count = len(self._paths())
+
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._decoded.pop(key, None)
+            try:
+                os.remove(self._path(key))
+                self._count -= 1
+            except OSError:
+                pass
+
+    def clear(self) -> None:
+        with self._lock:
+            self._decoded.clear()
+            for path in self._paths():
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._count = 0
+
+
+class ResponseCache:
+    """Caches GET responses by endpoint and parameters.
+
+    Fresh entries are returned without touching the network. Stale entries that carry an
+    `ETag` or `Last-Modified` validator are revalidated with a conditional request, so an
+    unchanged resource costs a `304 Not Modified` instead of a full body.
+
+    Args:
+        backend (BaseCacheBackend | None, optional): Where entries are stored. Defaults to a `MemoryCacheBackend`.
+        ttls (dict[str, float] | None, optional): Time to live in seconds by endpoint pattern (`fnmatch` syntax). Defaults to `DEFAULT_TTLS`.
+        default_ttl (float, optional): Time to live of the endpoints matching no pattern. Defaults to 0, i.e. always revalidate.
+    """
+
+    def __init__(
+        self,
+        backend: BaseCacheBackend | None = None,
+        ttls: dict[str, float] | None = None,
+        default_ttl: float = 0,
+    ):
+        self.backend = backend if backend is not None else MemoryCacheBackend()
+        self.ttls = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.default_ttl = default_ttl
+        self.stats = CacheStats()
+
+    @staticmethod
+    def build_key(endpoint: str, params: dict[str, Any] | None = None) -> str:
+        """Build the canonical cache key of a request.
+
+        `None` parameters are dropped and the remaining ones are sorted, so equivalent
+        requests share a key regardless of how they were built.
+
+        Args:
+            endpoint (str): The requested endpoint.
+            params (dict[str, Any] | None, optional): The request parameters. Defaults to None.
+
+        Returns:
+            str: The cache key.
+        """
+        canonical = sorted(
+            (key, [str(v) for v in value] if isinstance(value, (list, tuple)) else str(value))
+            for key, value in (params or {}).items()
+            if value is not None
+        )
+        return "{}?{}".format(endpoint.strip("/"), json.dumps(canonical, separators=(",", ":")))
+
+    def ttl_for(self, endpoint: str) -> float:
+        """Get the time to live of an endpoint.
+
+        Args:
+            endpoint (str): The requested endpoint.
+
+        Returns:
+            float: The time to live in seconds.
+        """
+        endpoint = endpoint.strip("/")
+        for pattern, ttl in self.ttls.items():
+            if fnmatchcase(endpoint, pattern):
+                return ttl
+        return self.default_ttl
+
+    def lookup(self, key: str) -> CacheEntry | None:
+        """Get the entry stored for a request, fresh or stale.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            CacheEntry | None: The entry, or None if nothing is cached.
+        """
+        return self.backend.get(key)
+
+    def store(
+        self, key: str, endpoint: str, data: Any, headers: Any
+    ) -> CacheEntry:
+        """Store a successful response.
+
+        Responses that have neither a time to live nor a validator are not stored since
+        they could never be reused.
+
+        Args:
+            key (str): The cache key.
+            endpoint (str): The requested endpoint.
+            data (Any): The decoded response data.
+            headers (Any): The response headers.
+
+        Returns:
+            CacheEntry: The entry built for the response, stored or not.
+        """
+        entry = CacheEntry(
+            data=data,
+            expires_at=time.time() + self.ttl_for(endpoint),
+            etag=headers.get("ETag"),
+            last_modified=headers.get("Last-Modified"),
+        )
+        if entry.is_fresh() or entry.etag is not None or entry.last_modified is not None:
+            self.backend.set(key, entry)
+        return entry
+
+    def refresh(
+        self, key: str, endpoint: str, entry: CacheEntry, headers: Any
+    ) -> CacheEntry:
+        """Extend a stale entry after the server confirmed it with a `304 Not Modified`.
+
+        Args:
+            key (str): The cache key.
+            endpoint (str): The requested endpoint.
+            entry (CacheEntry): The revalidated entry.
+            headers (Any): The `304` response headers.
+
+        Returns:
+            CacheEntry: The refreshed entry.
+        """
+        entry.expires_at = time.time() + self.ttl_for(endpoint)
+        entry.etag = headers.get("ETag", entry.etag)
+        entry.last_modified = headers.get("Last-Modified", entry.last_modified)
+        self.backend.set(key, entry)
+        return entry
+
+    def clear(self) -> None:
+        """Remove every cached response."""
+        self.backend.clear()
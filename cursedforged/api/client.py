@@ -1,21 +1,63 @@
+import time
 import requests
+from requests.adapters import HTTPAdapter
 from typing import Any
+from urllib3.util.request import ACCEPT_ENCODING
 
 from .base import BaseAPIClient
+from .cache import CacheEntry, ResponseCache
+from .coalesce import Singleflight
+from .decode import JSONBackend, ModelT, ResponseDecoder
+from .errors import error_for_status, parse_retry_after
+from .ratelimit import RateLimiter, RetryPolicy
+from .store import EntityStore
 from .v1 import API_v1
 from .v2 import API_v2
 
 
 class APIClient(BaseAPIClient):
+    """Synchronous CurseForge API client backed by a `requests.Session`.
+
+    A single client, and its `v1`/`v2` namespaces, can be shared by many threads: the
+    session only carries immutable default headers, the connection pool is sized by
+    `pool_maxsize`, and the cache, entity store, rate limiter and cache statistics are
+    guarded by their own locks. Size the pool to the number of worker threads, otherwise
+    connections beyond the pool size are opened and discarded on every request.
+
+    Responses are requested gzip compressed, and brotli compressed as well when the
+    `brotli` package is installed. Response bodies are validated straight from the raw
+    bytes, see `ResponseDecoder` for the available `json_backend` values.
+
+    Identical GET requests sent at the same time by several threads, i.e. with the same
+    endpoint, parameters and response model, share a single request unless `coalesce` is
+    False: every caller receives the same result object, so treat it as read-only.
+    """
+
     def __init__(
         self,
         api_key: str,
         base_url: str = "https://api.curseforge.com",
         client: requests.Session | None = None,
+        cache: ResponseCache | None = None,
+        store: EntityStore | None = None,
+        rate_limiter: RateLimiter | None = None,
+        retry: RetryPolicy | None = None,
+        pool_maxsize: int = 10,
+        keep_alive: bool = True,
+        json_backend: JSONBackend = "pydantic",
+        coalesce: bool = True,
     ):
         self.api_key = api_key
         self.base_url = base_url
+        self.pool_maxsize = pool_maxsize
+        self.keep_alive = keep_alive
         self.client = self._init_client(client)
+        self.cache = cache
+        self.store = store
+        self.rate_limiter = rate_limiter
+        self.retry = retry
+        self.decoder = ResponseDecoder(json_backend)
+        self.inflight = Singleflight() if coalesce else None
 
         self.v1 = API_v1(self)
         self.v2 = API_v2(self)
@@ -23,17 +65,28 @@ class APIClient(BaseAPIClient):
     def _init_client(self, client: requests.Session | None) -> requests.Session:
         """Initialize the client with the specified client or create a new one if none is provided.
 
+        A new session gets a connection pool of `pool_maxsize` connections, a provided
+        session keeps its own adapters.
+
         Args:
             client (requests.Session | None, optional): The client to use. Defaults to None.
 
         Returns:
             requests.Session: The initialized client.
         """
-        _client = client or requests.Session()
+        if client is not None:
+            _client = client
+        else:
+            _client = requests.Session()
+            adapter = HTTPAdapter(pool_maxsize=self.pool_maxsize)
+            _client.mount("https://", adapter)
+            _client.mount("http://", adapter)
         _client.headers.update(
             {
                 "x-api-key": self.api_key,
                 "Accept": "application/json",
+                "Accept-Encoding": ACCEPT_ENCODING.replace(",", ", "),
+                "Connection": "keep-alive" if self.keep_alive else "close",
             }
         )
         return _client
@@ -49,6 +102,69 @@ class APIClient(BaseAPIClient):
         """
         return "{}/{}".format(self.base_url, endpoint.strip("/"))
 
+    @staticmethod
+    def _error_body(response: requests.Response) -> Any:
+        """Decode the body of an error response, falling back to its text.
+
+        Args:
+            response (requests.Response): The error response.
+
+        Returns:
+            Any: The decoded body.
+        """
+        try:
+            return response.json()
+        except ValueError:
+            return response.text
+
+    def _send(self, method: str, endpoint: str, **kwargs: Any) -> requests.Response:
+        """Send a request through the rate limiter, retrying it according to the retry policy.
+
+        Args:
+            method (str): The HTTP method.
+            endpoint (str): The endpoint to send the request to.
+            **kwargs (Any): The arguments passed to `requests.Session.request`.
+
+        Raises:
+            RateLimitError: The API answered 429 and the retries are exhausted.
+            APIError: The API answered with another error status.
+
+        Returns:
+            requests.Response: The successful (or `304 Not Modified`) response.
+        """
+        url = self._build_request_uri(endpoint)
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            try:
+                response = self.client.request(method, url, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                if self.retry is None or not self.retry.should_retry(attempt, None):
+                    raise
+                time.sleep(self.retry.delay(attempt))
+                attempt += 1
+                continue
+
+            if response.status_code < 400:
+                return response
+
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if self.retry is None or not self.retry.should_retry(
+                attempt, response.status_code, retry_after
+            ):
+                raise error_for_status(
+                    response.status_code, url, self._error_body(response), retry_after
+                )
+
+            delay = self.retry.delay(attempt, retry_after)
+            if response.status_code == 429 and self.rate_limiter is not None:
+                # Holding back the shared bucket makes every other thread wait too.
+                self.rate_limiter.pause(delay)
+            else:
+                time.sleep(delay)
+            attempt += 1
+
     def get(self, endpoint: str, params: dict[str, Any] | None = None) -> Any:
         """Send a GET request to the specified endpoint.
 
@@ -56,15 +172,63 @@ class APIClient(BaseAPIClient):
             endpoint (str): The endpoint to send the request to.
             params (dict[str, Any] | None, optional): The parameters to send with the request. Defaults to None.
 
+        Raises:
+            APIError: The API answered with an error status.
+
         Returns:
             Any: The response data.
         """
-        response = self.client.get(
-            url=self._build_request_uri(endpoint),
+        if self.inflight is None:
+            return self._get(endpoint, params)
+        return self.inflight.do(
+            (None, ResponseCache.build_key(endpoint, params)), lambda: self._get(endpoint, params)
+        )
+
+    def _get(self, endpoint: str, params: dict[str, Any] | None) -> Any:
+        if self.cache is None:
+            response = self._send("GET", endpoint, params=params or {})
+            return self.decoder.loads(response.content)
+
+        return self._get_entry(self.cache, endpoint, params).data
+
+    def _get_entry(
+        self, cache: ResponseCache, endpoint: str, params: dict[str, Any] | None
+    ) -> CacheEntry:
+        """Send a GET request through the cache.
+
+        A fresh entry is returned as is, a stale one is revalidated and a missing one is
+        requested and stored.
+
+        Args:
+            cache (ResponseCache): The client's cache.
+            endpoint (str): The endpoint to send the request to.
+            params (dict[str, Any] | None): The parameters to send with the request.
+
+        Raises:
+            APIError: The API answered with an error status.
+
+        Returns:
+            CacheEntry: The cache entry of the response.
+        """
+        key = cache.build_key(endpoint, params)
+        entry = cache.lookup(key)
+        if entry is not None and entry.is_fresh():
+            cache.stats.record("hits")
+            return entry
+
+        response = self._send(
+            "GET",
+            endpoint,
             params=params or {},
+            headers=entry.validators() if entry is not None else None,
         )
+        if entry is not None and response.status_code == 304:
+            cache.stats.record("revalidations")
+            return cache.refresh(key, endpoint, entry, response.headers)
 
-        return response.json()
+        cache.stats.record("misses")
+        data = self.decoder.loads(response.content)
+        return cache.store(key, endpoint, data, response.headers)
 
     def post(self, endpoint: str, data: dict[str, Any] | None = None) -> Any:
         """Send a POST request to the specified endpoint.
@@ -73,12 +237,67 @@ class APIClient(BaseAPIClient):
             endpoint (str): The endpoint to send the request to.
             data (dict[str, Any] | None, optional): The data to send with the request. Defaults to None.
 
+        Raises:
+            APIError: The API answered with an error status.
+
         Returns:
             Any: The response data.
         """
-        response = self.client.post(
-            url=self._build_request_uri(endpoint),
-            data=data or {},
+        response = self._send("POST", endpoint, json=data or {})
+
+        return self.decoder.loads(response.content)
+
+    def get_model(
+        self, endpoint: str, model: type[ModelT], params: dict[str, Any] | None = None
+    ) -> ModelT:
+        """Send a GET request to the specified endpoint and validate the response body.
+
+        Without a cache, the raw body is validated directly, without building the
+        intermediate JSON data. With a cache, the model validated from a cached response
+        is reused as long as the response is, see `CacheEntry.to_model`.
+
+        Args:
+            endpoint (str): The endpoint to send the request to.
+            model (type[ModelT]): The response model.
+            params (dict[str, Any] | None, optional): The parameters to send with the request. Defaults to None.
+
+        Raises:
+            APIError: The API answered with an error status.
+
+        Returns:
+            ModelT: The validated response.
+        """
+        if self.inflight is None:
+            return self._get_model(endpoint, model, params)
+        return self.inflight.do(
+            (model, ResponseCache.build_key(endpoint, params)),
+            lambda: self._get_model(endpoint, model, params),
         )
 
-        return response.json()
+    def _get_model(
+        self, endpoint: str, model: type[ModelT], params: dict[str, Any] | None
+    ) -> ModelT:
+        if self.cache is not None:
+            return self._get_entry(self.cache, endpoint, params).to_model(model)
+
+        response = self._send("GET", endpoint, params=params or {})
+        return self.decoder.decode(response.content, model)
+
+    def post_model(
+        self, endpoint: str, model: type[ModelT], data: dict[str, Any] | None = None
+    ) -> ModelT:
+        """Send a POST request to the specified endpoint and validate the response body.
+
+        Args:
+            endpoint (str): The endpoint to send the request to.
+            model (type[ModelT]): The response model.
+            data (dict[str, Any] | None, optional): The data to send with the request. Defaults to None.
+
+        Raises:
+            APIError: The API answered with an error status.
+
+        Returns:
+            ModelT: The validated response.
+        """
+        response = self._send("POST", endpoint, json=data or {})
+        return self.decoder.decode(response.content, model)
@@ -0,0 +1,97 @@
+import asyncio
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+@dataclass
+class _Call:
+    done: threading.Event = field(default_factory=threading.Event)
+    """Set once the call returned or raised."""
+    result: Any = None
+    """The value returned by the call."""
+    error: BaseException | None = None
+    """The exception raised by the call, if any."""
+
+
+class Singleflight:
+    """Shares a single in-flight call between the threads asking for the same key.
+
+    The first caller of a key runs the call, the callers arriving while it is running
+    wait for it and receive the same result, or the same exception. Once the call has
+    finished, the next caller of the key runs it again: nothing is cached.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._calls: dict[Hashable, _Call] = {}
+        self.shared = 0
+        """The number of callers that received the result of another caller's call."""
+
+    def do(self, key: Hashable, fn: Callable[[], T]) -> T:
+        """Run `fn`, or wait for the running call of the same key.
+
+        Args:
+            key (Hashable): The key identifying equivalent calls.
+            fn (Callable[[], T]): The call.
+
+        Returns:
+            T: The result of the call.
+        """
+        with self._lock:
+            call = self._calls.get(key)
+            leader = call is None
+            if call is None:
+                call = self._calls[key] = _Call()
+            else:
+                self.shared += 1
+
+        if not leader:
+            call.done.wait()
+            if call.error is not None:
+                raise call.error
+            return call.result
+
+        try:
+            call.result = fn()
+        except BaseException as e:
+            call.error = e
+            raise
+        finally:
+            with self._lock:
+                del self._calls[key]
+            call.done.set()
+        return call.result
+
+
+class AsyncSingleflight:
+    """asyncio counterpart of `Singleflight`, for the coroutines of a single event loop.
+
+    The call runs as a task of its own, so a caller being cancelled does not cancel the
+    call the other callers are waiting for.
+    """
+
+    def __init__(self) -> None:
+        self._calls: dict[Hashable, asyncio.Future[Any]] = {}
+        self.shared = 0
+        """The number of callers that received the result of another caller's call."""
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run `fn`, or wait for the running call of the same key.
+
+        Args:
+            key (Hashable): The key identifying equivalent calls.
+            fn (Callable[[], Awaitable[T]]): The call.
+
+        Returns:
+            T: The result of the call.
+        """
+        call = self._calls.get(key)
+        if call is None:
+            call = self._calls[key] = asyncio.ensure_future(fn())
+            call.add_done_callback(lambda _: self._calls.pop(key, None))
+        else:
+            self.shared += 1
+        return await asyncio.shield(call)
@@ -0,0 +1,63 @@
+import json
+from typing import Any, Literal, TypeVar
+
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+JSONBackend = Literal["pydantic", "orjson"]
+
+
+class ResponseDecoder:
+    """Turns raw response bodies into Python objects and response models.
+
+    With the "pydantic" backend, the raw bytes are handed to the validator pydantic
+    builds once per model class, which parses and validates them in a single pass without
+    allocating an intermediate dict tree. The "orjson" backend parses the bytes with orjson
+    first and validates the resulting objects, it also speeds up the untyped
+    `get`/`post` calls that return plain JSON data.
+
+    Args:
+        backend (JSONBackend, optional): The JSON backend, "pydantic" or "orjson". Defaults to "pydantic".
+    """
+
+    def __init__(self, backend: JSONBackend = "pydantic"):
+        if backend not in ("pydantic", "orjson"):
+            raise ValueError("Unknown JSON backend: {}".format(backend))
+        if backend == "orjson" and orjson is None:
+            raise ImportError(
+                "The orjson backend requires orjson, install it with `pip install cursedforged[orjson]`"
+            )
+        self.backend = backend
+
+    def loads(self, raw: bytes) -> Any:
+        """Parse a raw body into plain JSON data.
+
+        Args:
+            raw (bytes): The raw response body.
+
+        Returns:
+            Any: The parsed data.
+        """
+        if self.backend == "orjson":
+            return orjson.loads(raw)
+        return json.loads(raw)
+
+    def decode(self, raw: bytes, model: type[ModelT]) -> ModelT:
+        """Parse and validate a raw body into a response model.
+
+        Args:
+            raw (bytes): The raw response body.
+            model (type[ModelT]): The response model.
+
+        Returns:
+            ModelT: The validated response.
+        """
+        if self.backend == "orjson":
+            return model.model_validate(orjson.loads(raw))
+        return model.model_validate_json(raw)
@@ -0,0 +1,91 @@
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+try:
+    import aiohttp
+except ImportError:  # pragma: no cover - optional dependency
+    aiohttp = None  # type: ignore[assignment]
+
+
+class APIError(Exception):
+    """Raised when the API answers a request with an error status.
+
+    Args:
+        status_code (int): The HTTP status code.
+        url (str): The requested URL.
+        body (Any, optional): The response body, decoded from JSON when possible. Defaults to None.
+        retry_after (float | None, optional): The delay requested by a `Retry-After` header, in seconds. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        status_code: int,
+        url: str,
+        body: Any = None,
+        retry_after: float | None = None,
+    ):
+        super().__init__("{} returned HTTP {}: {}".format(url, status_code, body))
+        self.status_code = status_code
+        self.url = url
+        self.body = body
+        self.retry_after = retry_after
+
+
+class RateLimitError(APIError):
+    """Raised when the API keeps answering `429 Too Many Requests`."""
+
+
+REQUEST_ERRORS: tuple[type[Exception], ...] = (APIError, OSError, ValueError)
+"""The exceptions a request is expected to fail with.
+
+`APIError` for error statuses, `OSError` for the transport errors (the `requests`
+exceptions derive from it), `ValueError` for undecodable or invalid bodies (including
+pydantic's `ValidationError`) and, when aiohttp is installed, `aiohttp.ClientError`.
+"""
+if aiohttp is not None:
+    REQUEST_ERRORS += (aiohttp.ClientError,)
+
+
+def parse_retry_after(value: str | None) -> float | None:
+    """Parse a `Retry-After` header given in seconds or as an HTTP date.
+
+    Args:
+        value (str | None): The header value.
+
+    Returns:
+        float | None: The delay in seconds, or None if the header is missing or invalid.
+    """
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+
+    try:
+        date = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if date.tzinfo is None:
+        date = date.replace(tzinfo=timezone.utc)
+    return max(0.0, (date - datetime.now(timezone.utc)).total_seconds())
+
+
+def error_for_status(
+    status_code: int, url: str, body: Any, retry_after: float | None
+) -> APIError:
+    """Build the error matching an error status code.
+
+    Args:
+        status_code (int): The HTTP status code.
+        url (str): The requested URL.
+        body (Any): The response body.
+        retry_after (float | None): The delay requested by a `Retry-After` header, in seconds.
+
+    Returns:
+        APIError: A `RateLimitError` for 429, an `APIError` otherwise.
+    """
+    if status_code == 429:
+        return RateLimitError(status_code, url, body, retry_after)
+    return APIError(status_code, url, body, retry_after)
@@ -0,0 +1,323 @@
+"""Micro-batching of single mod and file lookups.
+
+`BatchLoader` and `AsyncBatchLoader` expose `get_mod` and `get_mod_file` like the v1
+namespaces, but queue the ids requested within a short window and fetch them with a
+single `get_mods` or `get_files` request, handing each caller its own result.
+"""
+
+import asyncio
+import threading
+from concurrent.futures import Future
+from typing import TYPE_CHECKING, Awaitable, Callable, Generic, Hashable, TypeVar
+
+from cursedforged.types import File, GetModFileResponse, GetModResponse, Mod
+
+from .errors import REQUEST_ERRORS, APIError
+
+if TYPE_CHECKING:
+    from .v1 import API_v1
+    from .v1.aio import AsyncAPI_v1
+
+KeyT = TypeVar("KeyT", bound=Hashable)
+ItemT = TypeVar("ItemT")
+
+
+class _Batcher(Generic[KeyT, ItemT]):
+    """Collects keys from many threads and resolves them with one call per batch."""
+
+    def __init__(
+        self,
+        fetch: Callable[[list[KeyT]], dict[KeyT, ItemT]],
+        missing: Callable[[KeyT], Exception],
+        window: float,
+        max_batch_size: int,
+    ):
+        self.fetch = fetch
+        self.missing = missing
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._lock = threading.Lock()
+        self._pending: dict[KeyT, Future[ItemT]] = {}
+        self._timer: threading.Timer | None = None
+
+    def load(self, key: KeyT) -> "Future[ItemT]":
+        batch = None
+        with self._lock:
+            future = self._pending.get(key)
+            if future is not None:
+                return future
+            future = self._pending[key] = Future()
+            if len(self._pending) >= self.max_batch_size:
+                # Taken while the lock is held, so no other key joins the full batch.
+                batch = self._take()
+            elif self._timer is None:
+                self._timer = threading.Timer(self.window, self.flush)
+                self._timer.daemon = True
+                self._timer.start()
+        if batch is not None:
+            self._resolve(batch)
+        return future
+
+    def flush(self) -> None:
+        with self._lock:
+            batch = self._take()
+        self._resolve(batch)
+
+    def _take(self) -> dict[KeyT, "Future[ItemT]"]:
+        """Take the pending batch and stop its timer, must be called with the lock held."""
+        batch, self._pending = self._pending, {}
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        return batch
+
+    def _resolve(self, batch: dict[KeyT, "Future[ItemT]"]) -> None:
+        if not batch:
+            return
+
+        try:
+            found = self.fetch(list(batch))
+        except BaseException as e:
+            # Every caller waits on its future, so they all receive the error.
+            for future in batch.values():
+                future.set_exception(e)
+            if not isinstance(e, REQUEST_ERRORS):
+                raise
+            return
+        for key, future in batch.items():
+            if key in found:
+                future.set_result(found[key])
+            else:
+                future.set_exception(self.missing(key))
+
+
+class _AsyncBatcher(Generic[KeyT, ItemT]):
+    """asyncio counterpart of `_Batcher`, for the coroutines of a single event loop."""
+
+    def __init__(
+        self,
+        fetch: Callable[[list[KeyT]], Awaitable[dict[KeyT, ItemT]]],
+        missing: Callable[[KeyT], Exception],
+        window: float,
+        max_batch_size: int,
+    ):
+        self.fetch = fetch
+        self.missing = missing
+        self.window = window
+        self.max_batch_size = max_batch_size
+        self._pending: dict[KeyT, asyncio.Future[ItemT]] = {}
+        self._handle: asyncio.TimerHandle | None = None
+        self._tasks: set[asyncio.Task[None]] = set()
+
+    def load(self, key: KeyT) -> "asyncio.Future[ItemT]":
+        future = self._pending.get(key)
+        if future is not None:
+            return future
+        loop = asyncio.get_running_loop()
+        future = self._pending[key] = loop.create_future()
+        if len(self._pending) >= self.max_batch_size:
+            self.flush()
+        elif self._handle is None:
+            self._handle = loop.call_later(self.window, self.flush)
+        return future
+
+    def flush(self) -> None:
+        batch, self._pending = self._pending, {}
+        if self._handle is not None:
+            self._handle.cancel()
+            self._handle = None
+        if batch:
+            # Keep a reference to the task, the event loop only holds a weak one.
+            task = asyncio.ensure_future(self._resolve(batch))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+    async def _resolve(self, batch: dict[KeyT, "asyncio.Future[ItemT]"]) -> None:
+        try:
+            found = await self.fetch(list(batch))
+        except asyncio.CancelledError:
+            for future in batch.values():
+                future.cancel()
+            raise
+        except BaseException as e:
+            for future in batch.values():
+                if not future.done():
+                    future.set_exception(e)
+            if not isinstance(e, REQUEST_ERRORS):
+                raise
+            return
+        for key, future in batch.items():
+            if future.done():
+                continue
+            if key in found:
+                future.set_result(found[key])
+            else:
+                future.set_exception(self.missing(key))
+
+
+class BatchLoader:
+    """Batches the single mod and file lookups of many threads into bulk requests.
+
+    Every id requested through `get_mod` or `get_mod_file` is queued for `window`
+    seconds, or until `max_batch_size` ids are queued, then the whole queue is fetched
+    with one `get_mods` or `get_files` request and each caller receives its own result.
+    Ids requested again while queued share the pending lookup. An id missing from the
+    bulk response raises the `APIError` 404 a direct lookup would have raised.
+
+    A caller blocks until its batch is fetched, so batching pays off when lookups come
+    from many threads at once, or when futures from `load_mod`/`load_mod_file` are
+    collected before their results are needed.
+
+    Args:
+        api (API_v1): The API used for the bulk requests, e.g. `client.v1`.
+        window (float, optional): How long the first queued id waits for others, in seconds. Defaults to 0.005.
+        max_batch_size (int, optional): The number of queued ids that triggers a request right away. Defaults to 500.
+    """
+
+    def __init__(self, api: "API_v1", window: float = 0.005, max_batch_size: int = 500):
+        self.api = api
+        self._mods: _Batcher[int, Mod] = _Batcher(
+            self._fetch_mods, self._mod_missing, window, max_batch_size
+        )
+        self._files: _Batcher[tuple[int, int], File] = _Batcher(
+            self._fetch_files, self._file_missing, window, max_batch_size
+        )
+
+    def _fetch_mods(self, mod_ids: list[int]) -> dict[int, Mod]:
+        return {mod.id: mod for mod in self.api.get_mods(mod_ids).data}
+
+    def _fetch_files(self, keys: list[tuple[int, int]]) -> dict[tuple[int, int], File]:
+        files = self.api.get_files(list({file_id for _, file_id in keys})).data
+        return {(file.mod_id, file.id): file for file in files}
+
+    def _mod_missing(self, mod_id: int) -> Exception:
+        return APIError(404, "{}/v1/mods/{}".format(self.api.client.base_url, mod_id))
+
+    def _file_missing(self, key: tuple[int, int]) -> Exception:
+        return APIError(404, "{}/v1/mods/{}/files/{}".format(self.api.client.base_url, *key))
+
+    def load_mod(self, mod_id: int) -> "Future[Mod]":
+        """Queue a mod lookup.
+
+        Args:
+            mod_id (int): The mod id
+
+        Returns:
+            Future[Mod]: The future mod.
+        """
+        return self._mods.load(mod_id)
+
+    def load_mod_file(self, mod_id: int, file_id: int) -> "Future[File]":
+        """Queue a file lookup.
+
+        Args:
+            mod_id (int): The mod id the file belongs to
+            file_id (int): The file id
+
+        Returns:
+            Future[File]: The future file.
+        """
+        return self._files.load((mod_id, file_id))
+
+    def get_mod(self, mod_id: int) -> GetModResponse:
+        """Get a single mod through the next batch.
+
+        Args:
+            mod_id (int): The mod id
+
+        Raises:
+            APIError: The mod does not exist or the bulk request failed.
+
+        Returns:
+            GetModResponse: A response object
+        """
+        return GetModResponse(data=self.load_mod(mod_id).result())
+
+    def get_mod_file(self, mod_id: int, file_id: int) -> GetModFileResponse:
+        """Get a single file of the specified mod through the next batch.
+
+        Args:
+            mod_id (int): The mod id the file belongs to
+            file_id (int): The file id
+
+        Raises:
+            APIError: The file does not exist or the bulk request failed.
+
+        Returns:
+            GetModFileResponse: The mod file
+        """
+        return GetModFileResponse(data=self.load_mod_file(mod_id, file_id).result())
+
+    def flush(self) -> None:
+        """Fetch the queued lookups now instead of waiting for the window to end."""
+        self._mods.flush()
+        self._files.flush()
+
+
+class AsyncBatchLoader:
+    """asyncio counterpart of `BatchLoader`, batching the lookups of concurrent coroutines.
+
+    A loader must only be used from a single event loop.
+
+    Args:
+        api (AsyncAPI_v1): The API used for the bulk requests, e.g. `client.v1`.
+        window (float, optional): How long the first queued id waits for others, in seconds. Defaults to 0.005.
+        max_batch_size (int, optional): The number of queued ids that triggers a request right away. Defaults to 500.
+    """
+
+    def __init__(self, api: "AsyncAPI_v1", window: float = 0.005, max_batch_size: int = 500):
+        self.api = api
+        self._mods: _AsyncBatcher[int, Mod] = _AsyncBatcher(
+            self._fetch_mods, self._mod_missing, window, max_batch_size
+        )
+        self._files: _AsyncBatcher[tuple[int, int], File] = _AsyncBatcher(
+            self._fetch_files, self._file_missing, window, max_batch_size
+        )
+
+    async def _fetch_mods(self, mod_ids: list[int]) -> dict[int, Mod]:
+        return {mod.id: mod for mod in (await self.api.get_mods(mod_ids)).data}
+
+    async def _fetch_files(self, keys: list[tuple[int, int]]) -> dict[tuple[int, int], File]:
+        files = (await self.api.get_files(list({file_id for _, file_id in keys}))).data
+        return {(file.mod_id, file.id): file for file in files}
+
+    def _mod_missing(self, mod_id: int) -> Exception:
+        return APIError(404, "{}/v1/mods/{}".format(self.api.client.base_url, mod_id))
+
+    def _file_missing(self, key: tuple[int, int]) -> Exception:
+        return APIError(404, "{}/v1/mods/{}/files/{}".format(self.api.client.base_url, *key))
+
+    async def get_mod(self, mod_id: int) -> GetModResponse:
+        """Get a single mod through the next batch.
+
+        Args:
+            mod_id (int): The mod id
+
+        Raises:
+            APIError: The mod does not exist or the bulk request failed.
+
+        Returns:
+            GetModResponse: A response object
+        """
+        return GetModResponse(data=await asyncio.shield(self._mods.load(mod_id)))
+
+    async def get_mod_file(self, mod_id: int, file_id: int) -> GetModFileResponse:
+        """Get a single file of the specified mod through the next batch.
+
+        Args:
+            mod_id (int): The mod id the file belongs to
+            file_id (int): The file id
+
+        Raises:
+            APIError: The file does not exist or the bulk request failed.
+
+        Returns:
+            GetModFileResponse: The mod file
+        """
+        file = await asyncio.shield(self._files.load((mod_id, file_id)))
+        return GetModFileResponse(data=file)
+
+    def flush(self) -> None:
+        """Fetch the queued lookups now instead of waiting for the window to end."""
+        self._mods.flush()
+        self._files.flush()
@@ -0,0 +1,246 @@
+import asyncio
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterator, Protocol, Self, TypeVar
+
+from cursedforged.types import Pagination
+
+MAX_PAGE_SIZE = 50
+"""The maximum `pageSize` accepted by the paginated endpoints."""
+
+MAX_RESULT_WINDOW = 10_000
+"""The paginated endpoints reject requests where `index + pageSize > 10,000`."""
+
+
+class PaginatedResponse(Protocol):
+    data: list[Any]
+    pagination: Pagination
+
+    def model_copy(self, *, update: dict[str, Any] | None = None, deep: bool = False) -> Self: ...
+
+
+PageT = TypeVar("PageT", bound=PaginatedResponse)
+
+
+def clamp_page_size(index: int, page_size: int) -> int:
+    """Clamp a page size so the request stays inside the result window.
+
+    Args:
+        index (int): The zero based index of the first item of the page.
+        page_size (int): The requested page size.
+
+    Returns:
+        int: The page size to request, 0 when the index is outside of the window.
+    """
+    return max(0, min(page_size, MAX_PAGE_SIZE, MAX_RESULT_WINDOW - index))
+
+
+def next_page_index(page: PaginatedResponse, index: int, page_size: int) -> int | None:
+    """Compute the index of the page following `page`.
+
+    Args:
+        page (PaginatedResponse): The page that was just received.
+        index (int): The index `page` was requested with.
+        page_size (int): The page size `page` was requested with.
+
+    Returns:
+        int | None: The next index, or None if `page` was the last reachable page.
+    """
+    next_index = index + page_size
+    if page.pagination.result_count == 0:
+        return None
+    if next_index >= min(page.pagination.total_count, MAX_RESULT_WINDOW):
+        return None
+    return next_index
+
+
+def remaining_page_indexes(first_page: PaginatedResponse, page_size: int) -> list[int]:
+    """List the indexes of the pages following the first page of a result set.
+
+    Args:
+        first_page (PaginatedResponse): The first page, requested at index 0.
+        page_size (int): The page size the first page was requested with.
+
+    Returns:
+        list[int]: The index of every remaining page inside the result window.
+    """
+    if first_page.pagination.result_count == 0:
+        return []
+    end = min(first_page.pagination.total_count, MAX_RESULT_WINDOW)
+    return list(range(page_size, end, page_size))
+
+
+def merge_pages(pages: list[PageT]) -> PageT:
+    """Merge consecutive pages into a single response covering all of their items.
+
+    Args:
+        pages (list[PageT]): The pages in order, starting with the first one.
+
+    Returns:
+        PageT: A copy of the first page holding the items of every page.
+    """
+    first = pages[0]
+    data = [item for page in pages for item in page.data]
+    pagination = first.pagination.model_copy(
+        update={"page_size": len(data), "result_count": len(data)}
+    )
+    return first.model_copy(update={"data": data, "pagination": pagination})
+
+
+def fetch_all_pages(
+    fetch_page: Callable[[int, int], PageT],
+    page_size: int = MAX_PAGE_SIZE,
+    max_concurrency: int = 8,
+) -> PageT:
+    """Fetch every page of a paginated endpoint and merge them into one response.
+
+    The first page is requested on its own to learn `total_count`, the remaining pages are
+    then requested in parallel on up to `max_concurrency` threads.
+
+    Args:
+        fetch_page (Callable[[int, int], PageT]): Fetches the page for an `(index, page_size)` pair.
+        page_size (int, optional): The number of items per page. Defaults to 50.
+        max_concurrency (int, optional): The maximum number of pages requested at once. Defaults to 8.
+
+    Returns:
+        PageT: The merged response.
+    """
+    size = clamp_page_size(0, page_size)
+    first = fetch_page(0, size)
+    indexes = remaining_page_indexes(first, size)
+    if not indexes:
+        return first
+
+    with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+        rest = list(
+            executor.map(lambda index: fetch_page(index, clamp_page_size(index, size)), indexes)
+        )
+    return merge_pages([first, *rest])
+
+
+async def afetch_all_pages(
+    fetch_page: Callable[[int, int], Awaitable[PageT]],
+    page_size: int = MAX_PAGE_SIZE,
+    max_concurrency: int = 8,
+) -> PageT:
+    """Asynchronously fetch every page of a paginated endpoint and merge them into one response.
+
+    See `fetch_all_pages`, the remaining pages are requested as concurrent tasks.
+
+    Args:
+        fetch_page (Callable[[int, int], Awaitable[PageT]]): Fetches the page for an `(index, page_size)` pair.
+        page_size (int, optional): The number of items per page. Defaults to 50.
+        max_concurrency (int, optional): The maximum number of pages requested at once. Defaults to 8.
+
+    Returns:
+        PageT: The merged response.
+    """
+    size = clamp_page_size(0, page_size)
+    first = await fetch_page(0, size)
+    indexes = remaining_page_indexes(first, size)
+    if not indexes:
+        return first
+
+    semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+    async def fetch(index: int) -> PageT:
+        async with semaphore:
+            return await fetch_page(index, clamp_page_size(index, size))
+
+    rest = await asyncio.gather(*(fetch(index) for index in indexes))
+    return merge_pages([first, *rest])
+
+
+def iter_pages(
+    fetch_page: Callable[[int, int], PageT],
+    page_size: int = MAX_PAGE_SIZE,
+    start_index: int = 0,
+    prefetch: bool = True,
+) -> Iterator[PageT]:
+    """Iterate over every page of a paginated endpoint.
+
+    While a page is being consumed the following one is already requested on a
+    background thread, so at most two pages are held in memory at any time.
+
+    Args:
+        fetch_page (Callable[[int, int], PageT]): Fetches the page for an `(index, page_size)` pair.
+        page_size (int, optional): The number of items per page. Defaults to 50.
+        start_index (int, optional): The index of the first item. Defaults to 0.
+        prefetch (bool, optional): Whether to request the next page in the background. Defaults to True.
+
+    Yields:
+        PageT: The pages in order.
+    """
+    index = start_index
+    size = clamp_page_size(start_index, page_size)
+    if size == 0:
+        return
+
+    executor = ThreadPoolExecutor(max_workers=1) if prefetch else None
+    try:
+        page = fetch_page(start_index, size)
+        while True:
+            next_index = next_page_index(page, index, size)
+            next_size = clamp_page_size(next_index, page_size) if next_index is not None else 0
+            upcoming: Future[PageT] | None = None
+            if next_index is not None and executor is not None:
+                upcoming = executor.submit(fetch_page, next_index, next_size)
+
+            yield page
+
+            if next_index is None:
+                break
+            if upcoming is not None:
+                page = upcoming.result()
+            else:
+                page = fetch_page(next_index, next_size)
+            index, size = next_index, next_size
+    finally:
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+
+
+async def aiter_pages(
+    fetch_page: Callable[[int, int], Awaitable[PageT]],
+    page_size: int = MAX_PAGE_SIZE,
+    start_index: int = 0,
+    prefetch: bool = True,
+) -> AsyncIterator[PageT]:
+    """Asynchronously iterate over every page of a paginated endpoint.
+
+    See `iter_pages`, the next page is requested in a background task instead of a thread.
+
+    Args:
+        fetch_page (Callable[[int, int], Awaitable[PageT]]): Fetches the page for an `(index, page_size)` pair.
+        page_size (int, optional): The number of items per page. Defaults to 50.
+        start_index (int, optional): The index of the first item. Defaults to 0.
+        prefetch (bool, optional): Whether to request the next page in the background. Defaults to True.
+
+    Yields:
+        PageT: The pages in order.
+    """
+    index = start_index
+    size = clamp_page_size(start_index, page_size)
+    if size == 0:
+        return
+
+    upcoming: asyncio.Future[PageT] | None = None
+    try:
+        page = await fetch_page(start_index, size)
+        while True:
+            next_index = next_page_index(page, index, size)
+            next_size = clamp_page_size(next_index, page_size) if next_index is not None else 0
+            if next_index is not None and prefetch:
+                upcoming = asyncio.ensure_future(fetch_page(next_index, next_size))
+
+            yield page
+
+            if next_index is None:
+                break
+            if upcoming is not None:
+                page, upcoming = await upcoming, None
+            else:
+                page = await fetch_page(next_index, next_size)
+            index, size = next_index, next_size
+    finally:
+        if upcoming is not None:
+            upcoming.cancel()
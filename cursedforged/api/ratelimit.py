@@ -0,0 +1,122 @@
+import asyncio
+import random
+import threading
+import time
+
+
+class RateLimiter:
+    """A token bucket shared by every thread and asyncio task of a client.
+
+    Tokens are refilled at `rate` per second up to `burst`. Each request reserves a token
+    and waits until it becomes available, so concurrent callers are spread out evenly
+    instead of all retrying at the same instant.
+
+    Args:
+        rate (float): The sustained number of requests per second.
+        burst (float | None, optional): The number of requests that can be sent at once after an idle period. Defaults to `rate`.
+    """
+
+    def __init__(self, rate: float, burst: float | None = None):
+        self.rate = rate
+        self.burst = burst if burst is not None else max(1.0, rate)
+        self._tokens = self.burst
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self) -> float:
+        """Reserve a token.
+
+        Returns:
+            float: The number of seconds to wait before the token can be used.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens -= 1
+            return -self._tokens / self.rate if self._tokens < 0 else 0.0
+
+    def acquire(self) -> None:
+        """Block until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            time.sleep(delay)
+
+    async def acquire_async(self) -> None:
+        """Wait, without blocking the event loop, until a request may be sent."""
+        delay = self._reserve()
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    def pause(self, seconds: float) -> None:
+        """Hold back every caller for a while, e.g. after the server asked to slow down.
+
+        Args:
+            seconds (float): The time during which no new token is handed out.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+            self._updated = now
+            self._tokens = min(self._tokens, -seconds * self.rate)
+
+
+class RetryPolicy:
+    """Decides whether and when a failed request is retried.
+
+    Delays grow exponentially with "full jitter", i.e. a random delay between 0 and
+    `backoff_factor * 2 ** attempt`, capped at `max_backoff`. A `Retry-After` header sent
+    by the server takes precedence and is waited in full. When it asks to wait longer
+    than `max_backoff`, the request is not retried and its error is raised instead.
+
+    Args:
+        max_retries (int, optional): The maximum number of retries of a request. Defaults to 5.
+        backoff_factor (float, optional): The base delay in seconds. Defaults to 0.5.
+        max_backoff (float, optional): The maximum delay in seconds. Defaults to 60.
+        statuses (frozenset[int], optional): The status codes that are retried. Defaults to 429 and the transient 5xx codes.
+    """
+
+    def __init__(
+        self,
+        max_retries: int = 5,
+        backoff_factor: float = 0.5,
+        max_backoff: float = 60,
+        statuses: frozenset[int] = frozenset({429, 500, 502, 503, 504}),
+    ):
+        self.max_retries = max_retries
+        self.backoff_factor = backoff_factor
+        self.max_backoff = max_backoff
+        self.statuses = statuses
+
+    def should_retry(
+        self, attempt: int, status_code: int | None, retry_after: float | None = None
+    ) -> bool:
+        """Tell whether a failed attempt is retried.
+
+        Args:
+            attempt (int): The zero based number of the attempt that failed.
+            status_code (int | None): The response status code, None for a connection error.
+            retry_after (float | None, optional): The delay requested by the server, in seconds. Defaults to None.
+
+        Returns:
+            bool: Whether to retry.
+        """
+        if attempt >= self.max_retries:
+            return False
+        if retry_after is not None and retry_after > self.max_backoff:
+            return False
+        return status_code is None or status_code in self.statuses
+
+    def delay(self, attempt: int, retry_after: float | None = None) -> float:
+        """Compute the delay before the next attempt.
+
+        Args:
+            attempt (int): The zero based number of the attempt that failed.
+            retry_after (float | None, optional): The delay requested by the server, in seconds. Defaults to None.
+
+        Returns:
+            float: The delay in seconds.
+        """
+        if retry_after is not None:
+            return retry_after + random.uniform(0, self.backoff_factor)
+        return random.uniform(0, min(self.max_backoff, self.backoff_factor * 2**attempt))
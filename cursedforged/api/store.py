@@ -0,0 +1,248 @@
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Iterable, TypeVar
+
+from pydantic import BaseModel
+
+from cursedforged.types import File, Mod
+
+EntityT = TypeVar("EntityT", bound=BaseModel)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS mods (
+    id INTEGER PRIMARY KEY,
+    data TEXT NOT NULL,
+    stored_at REAL NOT NULL
+);
+CREATE TABLE IF NOT EXISTS files (
+    id INTEGER PRIMARY KEY,
+    mod_id INTEGER NOT NULL,
+    data TEXT NOT NULL,
+    stored_at REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS files_mod_id ON files (mod_id);
+CREATE TABLE IF NOT EXISTS checkpoints (
+    name TEXT PRIMARY KEY,
+    value TEXT NOT NULL,
+    stored_at REAL NOT NULL
+);
+"""
+
+_SQLITE_MAX_VARIABLES = 900
+
+
+class EntityStore:
+    """A persistent SQLite store of the `Mod` and `File` objects parsed by the client.
+
+    Attach it to a client with `APIClient(..., store=EntityStore("entities.db"))`. Every mod
+    and file the client parses is written through to the store, and the lookup methods
+    accepting a `max_age` answer from it when the stored copy is recent enough. The
+    database is opened in WAL mode so several worker processes can share it.
+
+    The most recently stored or read objects are also kept in memory. They were validated
+    when they were first parsed, so reading them again returns the same instances without
+    parsing or validating anything. Treat the returned objects as read-only.
+
+    Args:
+        path (str | os.PathLike[str]): The database file, or ":memory:".
+        memory_size (int, optional): The number of objects kept in memory, 0 disables it. Defaults to 10,000.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] = ":memory:", memory_size: int = 10_000):
+        self.path = os.fspath(path)
+        self.memory_size = memory_size
+        self._memory: OrderedDict[tuple[str, int], tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.execute("PRAGMA synchronous=NORMAL")
+        self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
+            self._memory.clear()
+
+    def _remember(self, table: str, entities: Iterable[tuple[int, float, Any]]) -> None:
+        """Keep parsed objects in memory, evicting the least recently used ones.
+
+        Must be called with the lock held.
+
+        Args:
+            table (str): The table the objects belong to.
+            entities (Iterable[tuple[int, float, Any]]): The `(id, stored_at, object)` triples.
+        """
+        if self.memory_size <= 0:
+            return
+        for entity_id, stored_at, entity in entities:
+            self._memory[(table, entity_id)] = (stored_at, entity)
+            self._memory.move_to_end((table, entity_id))
+        while len(self._memory) > self.memory_size:
+            self._memory.popitem(last=False)
+
+    def put_mods(self, mods: Iterable[Mod]) -> None:
+        """Store mods, replacing older copies.
+
+        The latest files of each mod are stored as well.
+
+        Args:
+            mods (Iterable[Mod]): The mods to store.
+        """
+        now = time.time()
+        mods = list(mods)
+        rows = [(mod.id, mod.model_dump_json(by_alias=True), now) for mod in mods]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO mods (id, data, stored_at) VALUES (?, ?, ?)", rows
+            )
+            self._remember("mods", ((mod.id, now, mod) for mod in mods))
+        self.put_files(file for mod in mods for file in mod.latest_files)
+
+    def put_files(self, files: Iterable[File]) -> None:
+        """Store files, replacing older copies.
+
+        Args:
+            files (Iterable[File]): The files to store.
+        """
+        now = time.time()
+        files = list(files)
+        rows = [
+            (file.id, file.mod_id, file.model_dump_json(by_alias=True), now)
+            for file in files
+        ]
+        if not rows:
+            return
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO files (id, mod_id, data, stored_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            self._remember("files", ((file.id, now, file) for file in files))
+
+    def _get(
+        self, table: str, model: type[EntityT], ids: Iterable[int], max_age: float | None
+    ) -> dict[int, EntityT]:
+        """Get stored objects, from memory when possible and from the database otherwise.
+
+        Args:
+            table (str): The table to read from.
+            model (type[EntityT]): The model the rows are parsed into.
+            ids (Iterable[int]): The ids to look up.
+            max_age (float | None): Ignore copies stored more than this many seconds ago.
+
+        Returns:
+            dict[int, EntityT]: The stored objects by id, in the order of `ids`.
+        """
+        wanted = list(dict.fromkeys(ids))
+        oldest = time.time() - max_age if max_age is not None else float("-inf")
+        found: dict[int, EntityT] = {}
+        missing: list[int] = []
+        rows: list[tuple[int, str, float]] = []
+        with self._lock:
+            for entity_id in wanted:
+                remembered = self._memory.get((table, entity_id))
+                if remembered is not None and remembered[0] >= oldest:
+                    self._memory.move_to_end((table, entity_id))
+                    found[entity_id] = remembered[1]
+                else:
+                    missing.append(entity_id)
+
+            for i in range(0, len(missing), _SQLITE_MAX_VARIABLES):
+                chunk = missing[i : i + _SQLITE_MAX_VARIABLES]
+                rows.extend(
+                    self._connection.execute(
+                        "SELECT id, data, stored_at FROM {} WHERE stored_at >= ? AND id IN ({})".format(
+                            table, ",".join("?" * len(chunk))
+                        ),
+                        [oldest, *chunk],
+                    )
+                )
+
+        parsed = [
+            (entity_id, stored_at, model.model_validate_json(data))
+            for entity_id, data, stored_at in rows
+        ]
+        with self._lock:
+            self._remember(table, parsed)
+        found.update((entity_id, entity) for entity_id, _, entity in parsed)
+        return {entity_id: found[entity_id] for entity_id in wanted if entity_id in found}
+
+    def get_mods(self, mod_ids: Iterable[int], max_age: float | None = None) -> dict[int, Mod]:
+        """Get the stored mods among the specified ids.
+
+        Args:
+            mod_ids (Iterable[int]): The mod ids to look up.
+            max_age (float | None, optional): Ignore copies stored more than this many seconds ago. Defaults to None.
+
+        Returns:
+            dict[int, Mod]: The stored mods by id, missing and expired ids are left out.
+        """
+        return self._get("mods", Mod, mod_ids, max_age)
+
+    def get_mod(self, mod_id: int, max_age: float | None = None) -> Mod | None:
+        """Get a stored mod.
+
+        Args:
+            mod_id (int): The mod id.
+            max_age (float | None, optional): Ignore a copy stored more than this many seconds ago. Defaults to None.
+
+        Returns:
+            Mod | None: The mod, or None if it is missing or expired.
+        """
+        return self.get_mods([mod_id], max_age).get(mod_id)
+
+    def get_files(self, file_ids: Iterable[int], max_age: float | None = None) -> dict[int, File]:
+        """Get the stored files among the specified ids.
+
+        Args:
+            file_ids (Iterable[int]): The file ids to look up.
+            max_age (float | None, optional): Ignore copies stored more than this many seconds ago. Defaults to None.
+
+        Returns:
+            dict[int, File]: The stored files by id, missing and expired ids are left out.
+        """
+        return self._get("files", File, file_ids, max_age)
+
+    def get_file(self, file_id: int, max_age: float | None = None) -> File | None:
+        """Get a stored file.
+
+        Args:
+            file_id (int): The file id.
+            max_age (float | None, optional): Ignore a copy stored more than this many seconds ago. Defaults to None.
+
+        Returns:
+            File | None: The file, or None if it is missing or expired.
+        """
+        return self.get_files([file_id], max_age).get(file_id)
+
+    def get_checkpoint(self, name: str) -> str | None:
+        """Get a checkpoint saved by a long running job, e.g. `CatalogSync`.
+
+        Args:
+            name (str): The checkpoint name.
+
+        Returns:
+            str | None: The saved value, or None if there is none.
+        """
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT value FROM checkpoints WHERE name = ?", (name,)
+            ).fetchone()
+        return row[0] if row is not None else None
+
+    def set_checkpoint(self, name: str, value: str) -> None:
+        """Save a checkpoint, replacing the previous value.
+
+        Args:
+            name (str): The checkpoint name.
+            value (str): The value to save.
+        """
+        with self._lock, self._connection:
+            self._connection.execute(
+                "INSERT OR REPLACE INTO checkpoints (name, value, stored_at) VALUES (?, ?, ?)",
+                (name, value, time.time()),
+            )
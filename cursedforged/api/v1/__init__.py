@@ -1,21 +1,32 @@
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterator
+
 from ..base import BaseAPIClient
+from ..batching import fetch_chunks, in_id_order
+from ..pagination import fetch_all_pages, iter_pages
 
+from cursedforged.fingerprint import batch_folder_fingerprints
 from cursedforged.types import (
+    File,
     Game,
+    Mod,
     ModsSearchSortField,
     SortOrder,
     ModLoaderType,
+    GetGameResponse,
     GetGamesResponse,
     GetVersionsResponse,
     GetVersionTypesResponse,
     GetCategoriesResponse,
     GetModResponse,
     GetModsResponse,
+    GetModsBatchResponse,
     GetFeaturedModsResponse,
     StringResponse,
     GetModFileResponse,
     GetModFilesResponse,
     GetFilesResponse,
+    GetFilesBatchResponse,
     ApiResponseOfListOfMinecraftGameVersion,
     ApiResponseOfMinecraftGameVersion,
     ApiResponseOfListOfMinecraftModLoaderIndex,
@@ -23,13 +34,40 @@ from cursedforged.types import (
     GetFingerprintMatchesResponse,
     FolderFingerprint,
     GetFingerprintsFuzzyMatchesResponse,
+    SearchModsResponse,
+    project_instance,
+    project_response,
 )
 
 
 class API_v1:
+    """The v1 endpoints of the CurseForge API.
+
+    The namespace holds no state besides its client, so its methods can be called from
+    many threads at once when the client is thread-safe, as `APIClient` is.
+    """
+
     def __init__(self, client: BaseAPIClient):
         self.client = client
 
+    def _store_mods(self, mods: list[Mod]) -> None:
+        """Write mods through to the client's entity store, if any.
+
+        Args:
+            mods (list[Mod]): The parsed mods.
+        """
+        if self.client.store is not None and mods:
+            self.client.store.put_mods(mods)
+
+    def _store_files(self, files: list[File]) -> None:
+        """Write files through to the client's entity store, if any.
+
+        Args:
+            files (list[File]): The parsed files.
+        """
+        if self.client.store is not None and files:
+            self.client.store.put_files(files)
+
     def get_games(self, index: int = 0, page_size: int = 50) -> GetGamesResponse:
         """Get all games
 
@@ -42,15 +80,55 @@ class API_v1:
         Returns:
             GetGamesResponse: A response object
         """
-        response = self.client.get(
+        return self.client.get_model(
             "v1/games",
+            GetGamesResponse,
             params={
                 "index": index,
                 "pageSize": page_size,
             },
         )
 
-        return GetGamesResponse(**response)
+    def iter_games(
+        self, page_size: int = 50, prefetch: bool = True
+    ) -> Iterator[Game]:
+        """Iterate over all games, requesting pages as they are consumed.
+
+        The iteration stops at the end of the results or at the (index + pageSize <= 10,000) limit.
+
+        Args:
+            page_size (int, optional): The number of items to request per page, the default/maximum value is 50.
+            prefetch (bool, optional): Whether to request the next page while the current one is consumed. Defaults to True.
+
+        Yields:
+            Game: A game object
+        """
+
+        def fetch_page(index: int, size: int) -> GetGamesResponse:
+            return self.get_games(index=index, page_size=size)
+
+        for page in iter_pages(fetch_page, page_size, prefetch=prefetch):
+            yield from page.data
+
+    def get_games_all(
+        self, page_size: int = 50, max_concurrency: int = 8
+    ) -> GetGamesResponse:
+        """Get all games in a single response.
+
+        Once the first page reports the total count, the remaining pages are requested in parallel.
+
+        Args:
+            page_size (int, optional): The number of items to request per page, the default/maximum value is 50.
+            max_concurrency (int, optional): The maximum number of pages requested at once. Defaults to 8.
+
+        Returns:
+            GetGamesResponse: A response object holding every game
+        """
+
+        def fetch_page(index: int, size: int) -> GetGamesResponse:
+            return self.get_games(index=index, page_size=size)
+
+        return fetch_all_pages(fetch_page, page_size, max_concurrency)
 
     def get_game(self, game_id: int) -> Game:
         """Get a game
@@ -63,10 +141,10 @@ class API_v1:
         Returns:
             Game: A game object
         """
-        response = self.client.get(
+        return self.client.get_model(
             "v1/games/{}".format(game_id),
-        )
-        return Game(**dict(response).get("data", {}))
+            GetGameResponse,
+        ).data
 
     def get_game_versions(self, game_id: int) -> GetVersionsResponse:
         """Get all available versions for each known version type of the specified game. A private game is only accessible to its respective API key.
@@ -79,12 +157,11 @@ class API_v1:
         Returns:
             GetVersionsResponse: A response object
         """
-        response = self.client.get(
+        return self.client.get_model(
             "v1/games/{}/versions".format(game_id),
+            GetVersionsResponse,
         )
 
-        return GetVersionsResponse(**response)
-
     def get_game_version_types(self, game_id: int) -> GetVersionTypesResponse:
         """Get all available version types of the specified game.
 
@@ -100,10 +177,10 @@ class API_v1:
         Returns:
             GetVersionTypesResponse: A response object
         """
-        response = self.client.get(
+        return self.client.get_model(
             "v1/games/{}/version-types".format(game_id),
+            GetVersionTypesResponse,
         )
-        return GetVersionTypesResponse(**response)
 
     def get_categories(
         self, game_id: int, class_id: int | None = None, classes_only: bool = False
@@ -121,15 +198,15 @@ class API_v1:
             GetCategoriesResponse: A response object
         """
 
-        response = self.client.get(
+        return self.client.get_model(
             "v1/categories",
+            GetCategoriesResponse,
             params={
                 "gameId": game_id,
                 "classId": class_id,
                 "classesOnly": classes_only,
             },
         )
-        return GetCategoriesResponse(**response)
 
     def search_mods(
         self,
@@ -150,7 +227,8 @@ class API_v1:
         slug: str | None = None,
         index: int | None = 0,
         page_size: int | None = 50,
-    ):
+        fields: list[str] | None = None,
+    ) -> SearchModsResponse:
         """Get all mods that match the search criteria.
 
         https://docs.curseforge.com/#search-mods
@@ -173,12 +251,14 @@ class API_v1:
             slug (str | None, optional): Filter by slug (coupled with classId will result in a unique result).
             index (int | None, optional): A zero based index of the first item to include in the response, the limit is: (index + pageSize <= 10,000).
             page_size (int | None, optional): The number of items to include in the response, the default/maximum value is 50.
+            fields (list[str] | None, optional): Only parse these `Mod` fields, the others are None, see `project`. Defaults to None.
 
         Returns:
-            GetCategoriesResponse: A response object
+            SearchModsResponse: A response object
         """
-        response = self.client.get(
+        result = self.client.get_model(
             "v1/mods/search",
+            project_response(SearchModsResponse, Mod, fields),
             params={
                 "gameId": game_id,
                 "classId": class_id,
@@ -199,26 +279,195 @@ class API_v1:
                 "pageSize": page_size,
             },
         )
-        return GetCategoriesResponse(**response)
+        if fields is None:
+            self._store_mods(result.data)
+        return result
 
-    def get_mod(self, mod_id: int) -> GetModResponse:
+    def iter_search_mods(
+        self,
+        game_id: int,
+        class_id: int | None = None,
+        category_id: int | None = None,
+        category_ids: list[int] | None = None,
+        game_version: str | None = None,
+        game_versions: list[str] | None = None,
+        search_filter: str | None = None,
+        sort_field: ModsSearchSortField | None = None,
+        sort_order: SortOrder | None = None,
+        mod_loader_type: ModLoaderType | None = None,
+        mod_loader_types: list[ModLoaderType] | None = None,
+        game_version_type_id: int | None = None,
+        author_id: int | None = None,
+        primary_author_id: int | None = None,
+        slug: str | None = None,
+        page_size: int = 50,
+        fields: list[str] | None = None,
+        prefetch: bool = True,
+    ) -> Iterator[Mod]:
+        """Iterate over all mods that match the search criteria, requesting pages as they are consumed.
+
+        The iteration stops at the end of the results or at the (index + pageSize <= 10,000) limit.
+
+        Args:
+            game_id (int): A game unique id
+            class_id (int | None, optional): Filter by section id (discoverable via Categories)
+            category_id (int | None, optional): Filter by category id
+            category_ids (list[int] | None, optional): Filter by a list of category ids - this will override categoryId
+            game_version (str | None, optional): Filter by game version string
+            game_versions (list[str] | None, optional): Filter by a list of game version strings - this will override
+            search_filter (str | None, optional): Filter by free text search in the mod name and author
+            sort_field (ModsSearchSortField | None, optional): Filter by ModsSearchSortField enumeration
+            sort_order (SortOrder | None, optional): 'asc' if sort is in ascending order, 'desc' if sort is in descending order
+            mod_loader_type (ModLoaderType | None, optional): Filter only mods associated to a given modloader (Forge, Fabric ...). Must be coupled with gameVersion.
+            mod_loader_types (list[ModLoaderType] | None, optional): Filter by a list of mod loader types - this will override modLoaderType
+            game_version_type_id (int | None, optional): Filter only mods that contain files tagged with versions of the given gameVersionTypeId
+            author_id (int | None, optional): Filter only mods that the given authorId is a member of.
+            primary_author_id (int | None, optional): Filter only mods that the given primaryAuthorId is the owner of.
+            slug (str | None, optional): Filter by slug (coupled with classId will result in a unique result).
+            page_size (int, optional): The number of items to request per page, the default/maximum value is 50.
+            fields (list[str] | None, optional): Only parse these `Mod` fields, the others are None, see `project`. Defaults to None.
+            prefetch (bool, optional): Whether to request the next page while the current one is consumed. Defaults to True.
+
+        Yields:
+            Mod: A mod object
+        """
+
+        def fetch_page(index: int, size: int) -> SearchModsResponse:
+            return self.search_mods(
+                game_id=game_id,
+                class_id=class_id,
+                category_id=category_id,
+                category_ids=category_ids,
+                game_version=game_version,
+                game_versions=game_versions,
+                search_filter=search_filter,
+                sort_field=sort_field,
+                sort_order=sort_order,
+                mod_loader_type=mod_loader_type,
+                mod_loader_types=mod_loader_types,
+                game_version_type_id=game_version_type_id,
+                author_id=author_id,
+                primary_author_id=primary_author_id,
+                slug=slug,
+                index=index,
+                page_size=size,
+                fields=fields,
+            )
+
+        for page in iter_pages(fetch_page, page_size, prefetch=prefetch):
+            yield from page.data
+
+    def search_mods_all(
+        self,
+        game_id: int,
+        class_id: int | None = None,
+        category_id: int | None = None,
+        category_ids: list[int] | None = None,
+        game_version: str | None = None,
+        game_versions: list[str] | None = None,
+        search_filter: str | None = None,
+        sort_field: ModsSearchSortField | None = None,
+        sort_order: SortOrder | None = None,
+        mod_loader_type: ModLoaderType | None = None,
+        mod_loader_types: list[ModLoaderType] | None = None,
+        game_version_type_id: int | None = None,
+        author_id: int | None = None,
+        primary_author_id: int | None = None,
+        slug: str | None = None,
+        page_size: int = 50,
+        fields: list[str] | None = None,
+        max_concurrency: int = 8,
+    ) -> SearchModsResponse:
+        """Get all mods that match the search criteria in a single response.
+
+        Once the first page reports the total count, the remaining pages are requested in parallel.
+        The results are limited to the (index + pageSize <= 10,000) window.
+
+        Args:
+            game_id (int): A game unique id
+            class_id (int | None, optional): Filter by section id (discoverable via Categories)
+            category_id (int | None, optional): Filter by category id
+            category_ids (list[int] | None, optional): Filter by a list of category ids - this will override categoryId
+            game_version (str | None, optional): Filter by game version string
+            game_versions (list[str] | None, optional): Filter by a list of game version strings - this will override
+            search_filter (str | None, optional): Filter by free text search in the mod name and author
+            sort_field (ModsSearchSortField | None, optional): Filter by ModsSearchSortField enumeration
+            sort_order (SortOrder | None, optional): 'asc' if sort is in ascending order, 'desc' if sort is in descending order
+            mod_loader_type (ModLoaderType | None, optional): Filter only mods associated to a given modloader (Forge, Fabric ...). Must be coupled with gameVersion.
+            mod_loader_types (list[ModLoaderType] | None, optional): Filter by a list of mod loader types - this will override modLoaderType
+            game_version_type_id (int | None, optional): Filter only mods that contain files tagged with versions of the given gameVersionTypeId
+            author_id (int | None, optional): Filter only mods that the given authorId is a member of.
+            primary_author_id (int | None, optional): Filter only mods that the given primaryAuthorId is the owner of.
+            slug (str | None, optional): Filter by slug (coupled with classId will result in a unique result).
+            page_size (int, optional): The number of items to request per page, the default/maximum value is 50.
+            fields (list[str] | None, optional): Only parse these `Mod` fields, the others are None, see `project`. Defaults to None.
+            max_concurrency (int, optional): The maximum number of pages requested at once. Defaults to 8.
+
+        Returns:
+            SearchModsResponse: A response object holding every matching mod
+        """
+
+        def fetch_page(index: int, size: int) -> SearchModsResponse:
+            return self.search_mods(
+                game_id=game_id,
+                class_id=class_id,
+                category_id=category_id,
+                category_ids=category_ids,
+                game_version=game_version,
+                game_versions=game_versions,
+                search_filter=search_filter,
+                sort_field=sort_field,
+                sort_order=sort_order,
+                mod_loader_type=mod_loader_type,
+                mod_loader_types=mod_loader_types,
+                game_version_type_id=game_version_type_id,
+                author_id=author_id,
+                primary_author_id=primary_author_id,
+                slug=slug,
+                index=index,
+                page_size=size,
+                fields=fields,
+            )
+
+        return fetch_all_pages(fetch_page, page_size, max_concurrency)
+
+    def get_mod(
+        self,
+        mod_id: int,
+        max_age: float | None = None,
+        fields: list[str] | None = None,
+    ) -> GetModResponse:
         """Get a single mod.
 
         https://docs.curseforge.com/#get-mod
 
         Args:
             mod_id (int): The mod id
+            max_age (float | None, optional): Answer from the client's entity store when its copy is at most this many seconds old. Defaults to None.
+            fields (list[str] | None, optional): Only parse these `Mod` fields, the others are None, see `project`. Defaults to None.
 
         Returns:
             GetModResponse: A response object
         """
-        response = self.client.get(
+        if max_age is not None and self.client.store is not None:
+            mod = self.client.store.get_mod(mod_id, max_age)
+            if mod is not None:
+                return GetModResponse(data=project_instance(mod, fields))
+
+        result = self.client.get_model(
             "v1/mods/{}".format(mod_id),
+            project_response(GetModResponse, Mod, fields),
         )
-        return GetModResponse(**response)
+        if fields is None:
+            self._store_mods([result.data])
+        return result
 
     def get_mods(
-        self, mod_ids: list[int], filter_pc_only: bool | None = False
+        self,
+        mod_ids: list[int],
+        filter_pc_only: bool | None = False,
+        max_age: float | None = None,
+        fields: list[str] | None = None,
     ) -> GetModsResponse:
         """Get a list of mods belonging the the same game.
 
@@ -227,18 +476,72 @@ class API_v1:
         Args:
             mod_ids (list[int]): A list of mod ids
             filter_pc_only (bool | None, optional): Filter mods that are only available for PC. Defaults to False.
+            max_age (float | None, optional): Answer from the client's entity store when its copy is at most this many seconds old. Defaults to None.
+            fields (list[str] | None, optional): Only parse these `Mod` fields, the others are None, see `project`. Defaults to None.
 
         Returns:
             GetModsResponse: A response object
         """
-        response = self.client.post(
+        stored: dict[int, Mod] = {}
+        missing = mod_ids
+        if max_age is not None and self.client.store is not None:
+            stored = self.client.store.get_mods(mod_ids, max_age)
+            if fields is not None:
+                stored = {
+                    mod_id: project_instance(mod, fields) for mod_id, mod in stored.items()
+                }
+            missing = [mod_id for mod_id in mod_ids if mod_id not in stored]
+            if not missing:
+                return GetModsResponse(data=in_id_order(mod_ids, stored))
+
+        result = self.client.post_model(
             "v1/mods",
+            project_response(GetModsResponse, Mod, fields),
             data={
-                "modIds": mod_ids,
+                "modIds": missing,
                 "filterPcOnly": filter_pc_only,
             },
         )
-        return GetModsResponse(**response)
+        if fields is None:
+            self._store_mods(result.data)
+        if stored:
+            fetched = {mod.id: mod for mod in result.data}
+            result.data = in_id_order(mod_ids, {**stored, **fetched})
+        return result
+
+    def get_mods_batched(
+        self,
+        mod_ids: list[int],
+        filter_pc_only: bool | None = False,
+        chunk_size: int = 500,
+        max_concurrency: int = 8,
+        max_age: float | None = None,
+        fields: list[str] | None = None,
+    ) -> GetModsBatchResponse:
+        """Get a list of mods of any length by splitting it into chunks.
+
+        Duplicate ids are dropped and the chunks are requested in parallel. A failing chunk does not fail the whole call,
+        its error is reported for each of its ids in `errors`.
+
+        Args:
+            mod_ids (list[int]): A list of mod ids
+            filter_pc_only (bool | None, optional): Filter mods that are only available for PC. Defaults to False.
+            chunk_size (int, optional): The maximum number of ids sent per request. Defaults to 500.
+            max_concurrency (int, optional): The maximum number of requests sent at once. Defaults to 8.
+            max_age (float | None, optional): Answer from the client's entity store when its copy is at most this many seconds old. Defaults to None.
+            fields (list[str] | None, optional): Only parse these `Mod` fields, the others are None, see `project`. Defaults to None.
+
+        Returns:
+            GetModsBatchResponse: A response object
+        """
+
+        def fetch_chunk(chunk: list[int]) -> list[Mod]:
+            return self.get_mods(
+                chunk, filter_pc_only=filter_pc_only, max_age=max_age, fields=fields
+            ).data
+
+        data, errors = fetch_chunks(fetch_chunk, mod_ids, chunk_size, max_concurrency)
+        return GetModsBatchResponse(data=data, errors=errors)
 
     def get_featured_mods(
         self,
@@ -258,15 +561,17 @@ class API_v1:
         Returns:
             GetFeaturedModsResponse: A response object
         """
-        response = self.client.post(
+        result = self.client.post_model(
             "v1/mods/featured",
+            GetFeaturedModsResponse,
             data={
                 "gameId": game_id,
                 "excludedModIds": excluded_mod_ids,
                 "gameVersionTypeId": game_version_type_id,
             },
         )
-        return GetFeaturedModsResponse(**response)
+        self._store_mods(result.featured + result.popular + result.recently_updated)
+        return result
 
     def get_mod_description(
         self,
@@ -288,17 +593,19 @@ class API_v1:
         Returns:
             StringResponse: The mod description
         """
-        response = self.client.get(
+        return self.client.get_model(
             "v1/mods/{}/description".format(mod_id),
+            StringResponse,
             params={
                 "raw": raw,
                 "stripped": stripped,
                 "markup": markup,
             },
         )
-        return StringResponse(**response)
 
-    def get_mod_file(self, mod_id: int, file_id: int) -> GetModFileResponse:
+    def get_mod_file(
+        self, mod_id: int, file_id: int, max_age: float | None = None
+    ) -> GetModFileResponse:
         """Get a single file of the specified mod.
 
         https://docs.curseforge.com/#get-mod-file
@@ -306,14 +613,22 @@ class API_v1:
         Args:
             mod_id (int): The mod id the file belongs to
             file_id (int): The file id
+            max_age (float | None, optional): Answer from the client's entity store when its copy is at most this many seconds old. Defaults to None.
 
         Returns:
             GetModFileResponse: The mod file
         """
-        response = self.client.get(
+        if max_age is not None and self.client.store is not None:
+            file = self.client.store.get_file(file_id, max_age)
+            if file is not None and file.mod_id == mod_id:
+                return GetModFileResponse(data=file)
+
+        result = self.client.get_model(
             "v1/mods/{}/files/{}".format(mod_id, file_id),
+            GetModFileResponse,
         )
-        return GetModFileResponse(**response)
+        self._store_files([result.data])
+        return result
 
     def get_mod_files(
         self,
@@ -339,8 +654,9 @@ class API_v1:
         Returns:
             GetModFilesResponse: A response object
         """
-        response = self.client.get(
+        result = self.client.get_model(
             "v1/mods/{}/files".format(mod_id),
+            GetModFilesResponse,
             params={
                 "gameVersion": game_version,
                 "modLoaderType": mod_loader_type,
@@ -349,26 +665,146 @@ class API_v1:
                 "pageSize": page_size,
             },
         )
-        return GetModFilesResponse(**response)
+        self._store_files(result.data)
+        return result
+
+    def iter_mod_files(
+        self,
+        mod_id: int,
+        game_version: str | None = None,
+        mod_loader_type: ModLoaderType | None = None,
+        game_version_type_id: int | None = None,
+        page_size: int = 50,
+        prefetch: bool = True,
+    ) -> Iterator[File]:
+        """Iterate over all files of the specified mod, requesting pages as they are consumed.
+
+        The iteration stops at the end of the results or at the (index + pageSize <= 10,000) limit.
+
+        Args:
+            mod_id (int): The mod id the files belong to
+            game_version (str | None, optional): Filter by game version string. Defaults to None.
+            mod_loader_type (ModLoaderType | None, optional): ModLoaderType enumeration. Defaults to None.
+            game_version_type_id (int | None, optional): Filter only files that are tagged with versions of the given gameVersionTypeId. Defaults to None.
+            page_size (int, optional): The number of items to request per page, the default/maximum value is 50.
+            prefetch (bool, optional): Whether to request the next page while the current one is consumed. Defaults to True.
+
+        Yields:
+            File: A file object
+        """
 
-    def get_files(self, file_ids: list[int]) -> GetFilesResponse:
+        def fetch_page(index: int, size: int) -> GetModFilesResponse:
+            return self.get_mod_files(
+                mod_id=mod_id,
+                game_version=game_version,
+                mod_loader_type=mod_loader_type,
+                game_version_type_id=game_version_type_id,
+                index=index,
+                page_size=size,
+            )
+
+        for page in iter_pages(fetch_page, page_size, prefetch=prefetch):
+            yield from page.data
+
+    def get_mod_files_all(
+        self,
+        mod_id: int,
+        game_version: str | None = None,
+        mod_loader_type: ModLoaderType | None = None,
+        game_version_type_id: int | None = None,
+        page_size: int = 50,
+        max_concurrency: int = 8,
+    ) -> GetModFilesResponse:
+        """Get all files of the specified mod in a single response.
+
+        Once the first page reports the total count, the remaining pages are requested in parallel.
+
+        Args:
+            mod_id (int): The mod id the files belong to
+            game_version (str | None, optional): Filter by game version string. Defaults to None.
+            mod_loader_type (ModLoaderType | None, optional): ModLoaderType enumeration. Defaults to None.
+            game_version_type_id (int | None, optional): Filter only files that are tagged with versions of the given gameVersionTypeId. Defaults to None.
+            page_size (int, optional): The number of items to request per page, the default/maximum value is 50.
+            max_concurrency (int, optional): The maximum number of pages requested at once. Defaults to 8.
+
+        Returns:
+            GetModFilesResponse: A response object holding every file
+        """
+
+        def fetch_page(index: int, size: int) -> GetModFilesResponse:
+            return self.get_mod_files(
+                mod_id=mod_id,
+                game_version=game_version,
+                mod_loader_type=mod_loader_type,
+                game_version_type_id=game_version_type_id,
+                index=index,
+                page_size=size,
+            )
+
+        return fetch_all_pages(fetch_page, page_size, max_concurrency)
+
+    def get_files(
+        self, file_ids: list[int], max_age: float | None = None
+    ) -> GetFilesResponse:
         """Get a list of files.
 
         https://docs.curseforge.com/#get-files
 
         Args:
             file_ids (list[int]): A list of file ids
+            max_age (float | None, optional): Answer from the client's entity store when its copy is at most this many seconds old. Defaults to None.
 
         Returns:
             GetFilesResponse: A response object
         """
-        response = self.client.post(
+        stored: dict[int, File] = {}
+        missing = file_ids
+        if max_age is not None and self.client.store is not None:
+            stored = self.client.store.get_files(file_ids, max_age)
+            missing = [file_id for file_id in file_ids if file_id not in stored]
+            if not missing:
+                return GetFilesResponse(data=in_id_order(file_ids, stored))
+
+        result = self.client.post_model(
             "v1/mods/files",
+            GetFilesResponse,
             data={
-                "fileIds": file_ids,
+                "fileIds": missing,
             },
         )
-        return GetFilesResponse(**response)
+        self._store_files(result.data)
+        if stored:
+            fetched = {file.id: file for file in result.data}
+            result.data = in_id_order(file_ids, {**stored, **fetched})
+        return result
+
+    def get_files_batched(
+        self,
+        file_ids: list[int],
+        chunk_size: int = 500,
+        max_concurrency: int = 8,
+        max_age: float | None = None,
+    ) -> GetFilesBatchResponse:
+        """Get a list of files of any length by splitting it into chunks.
+
+        Duplicate ids are dropped and the chunks are requested in parallel. A failing chunk does not fail the whole call,
+        its error is reported for each of its ids in `errors`.
+
+        Args:
+            file_ids (list[int]): A list of file ids
+            chunk_size (int, optional): The maximum number of ids sent per request. Defaults to 500.
+            max_concurrency (int, optional): The maximum number of requests sent at once. Defaults to 8.
+            max_age (float | None, optional): Answer from the client's entity store when its copy is at most this many seconds old. Defaults to None.
+
+        Returns:
+            GetFilesBatchResponse: A response object
+        """
+
+        def fetch_chunk(chunk: list[int]) -> list[File]:
+            return self.get_files(chunk, max_age=max_age).data
+
+        data, errors = fetch_chunks(fetch_chunk, file_ids, chunk_size, max_concurrency)
+        return GetFilesBatchResponse(data=data, errors=errors)
 
     def get_mod_file_changelog(self, mod_id: int, file_id: int) -> StringResponse:
         """Get the changelog of a file in HTML format.
@@ -382,10 +818,10 @@ class API_v1:
         Returns:
             StringResponse: A response object
         """
-        response = self.client.get(
+        return self.client.get_model(
             "v1/mods/{}/files/{}/changelog".format(mod_id, file_id),
+            StringResponse,
         )
-        return StringResponse(**response)
 
     def get_mod_file_download_url(self, mod_id: int, file_id: int) -> StringResponse:
         """Get a download url for a specific file.
@@ -399,10 +835,10 @@ class API_v1:
         Returns:
             StringResponse: A response object
         """
-        response = self.client.get(
+        return self.client.get_model(
             "v1/mods/{}/files/{}/download-url".format(mod_id, file_id),
+            StringResponse,
         )
-        return StringResponse(**response)
 
     def get_fingerprints_matches_by_game_id(
         self, game_id: int, fingerprints: list[int]
@@ -418,13 +854,21 @@ class API_v1:
         Returns:
             GetFingerprintMatchesResponse: A response object
         """
-        response = self.client.post(
+        result = self.client.post_model(
             "v1/fingerprints/{}".format(game_id),
+            GetFingerprintMatchesResponse,
             data={
                 "fingerprints": fingerprints,
             },
         )
-        return GetFingerprintMatchesResponse(**response)
+        self._store_files(
+            [
+                file
+                for match in result.data.exact_matches + result.data.partial_matches
+                for file in (match.file, *match.latest_files)
+            ]
+        )
+        return result
 
     def get_fingerprints_matches(
         self, fingerprints: list[int]
@@ -439,13 +883,21 @@ class API_v1:
         Returns:
             GetFingerprintMatchesResponse: A response object
         """
-        response = self.client.post(
+        result = self.client.post_model(
             "v1/fingerprints",
+            GetFingerprintMatchesResponse,
             data={
                 "fingerprints": fingerprints,
             },
         )
-        return GetFingerprintMatchesResponse(**response)
+        self._store_files(
+            [
+                file
+                for match in result.data.exact_matches + result.data.partial_matches
+                for file in (match.file, *match.latest_files)
+            ]
+        )
+        return result
 
     def get_fingerprints_fuzzy_matches_by_game_id(
         self, game_id: int, fingerprints: list[FolderFingerprint]
@@ -461,13 +913,56 @@ class API_v1:
         Returns:
             GetFingerprintsFuzzyMatchesResponse: A response object
         """
-        response = self.client.post(
+        return self.client.post_model(
             "/v1/fingerprints/fuzzy/{}".format(game_id),
+            GetFingerprintsFuzzyMatchesResponse,
             data={
-                "fingerprints": fingerprints,
+                "fingerprints": [
+                    fingerprint.model_dump(by_alias=True) for fingerprint in fingerprints
+                ],
             },
         )
-        return GetFingerprintsFuzzyMatchesResponse(**response)
+
+    def get_fingerprints_fuzzy_matches_batched(
+        self,
+        game_id: int,
+        fingerprints: list[FolderFingerprint],
+        max_folders: int = 50,
+        max_fingerprints: int = 10_000,
+        max_concurrency: int = 8,
+    ) -> GetFingerprintsFuzzyMatchesResponse:
+        """Get mod files that match any number of folder fingerprints using fuzzy matching.
+
+        The folders are split into batches of bounded size that are requested in parallel, see
+        `cursedforged.fingerprint.build_folder_fingerprints` to build the folder fingerprints.
+
+        Args:
+            game_id (int): The game id for matching fingerprints
+            fingerprints (list[FolderFingerprint]): The folder fingerprints to match
+            max_folders (int, optional): The maximum number of folders per request. Defaults to 50.
+            max_fingerprints (int, optional): The maximum number of file fingerprints per request. Defaults to 10,000.
+            max_concurrency (int, optional): The maximum number of requests sent at once. Defaults to 8.
+
+        Returns:
+            GetFingerprintsFuzzyMatchesResponse: A response object holding the matches of every batch
+        """
+        batches = batch_folder_fingerprints(fingerprints, max_folders, max_fingerprints)
+        if not batches:
+            return GetFingerprintsFuzzyMatchesResponse.model_validate(
+                {"data": {"fuzzyMatches": []}}
+            )
+
+        with ThreadPoolExecutor(max_workers=max(1, max_concurrency)) as executor:
+            responses = list(
+                executor.map(
+                    lambda batch: self.get_fingerprints_fuzzy_matches_by_game_id(game_id, batch),
+                    batches,
+                )
+            )
+        result = responses[0].model_copy(deep=True)
+        for response in responses[1:]:
+            result.data.fuzzy_matches.extend(response.data.fuzzy_matches)
+        return result
 
     def get_fingerprints_fuzzy_matches(
         self, fingerprints: list[FolderFingerprint]
@@ -482,13 +977,15 @@ class API_v1:
         Returns:
             GetFingerprintsFuzzyMatchesResponse: A response object
         """
-        response = self.client.post(
+        return self.client.post_model(
             "/v1/fingerprints/fuzzy",
+            GetFingerprintsFuzzyMatchesResponse,
             data={
-                "fingerprints": fingerprints,
+                "fingerprints": [
+                    fingerprint.model_dump(by_alias=True) for fingerprint in fingerprints
+                ],
             },
         )
-        return GetFingerprintsFuzzyMatchesResponse(**response)
 
     def get_minecraft_versions(
         self, sort_descending: bool | None = None
@@ -503,13 +1000,13 @@ class API_v1:
         Returns:
             ApiResponseOfListOfMinecraftGameVersion: A response object
         """
-        response = self.client.get(
+        return self.client.get_model(
             "v1/minecraft/version",
+            ApiResponseOfListOfMinecraftGameVersion,
             params={
                 "sortDescending": sort_descending,
             },
         )
-        return ApiResponseOfListOfMinecraftGameVersion(**response)
 
     def get_minecraft_version(
         self, game_version_string: str
@@ -524,10 +1021,10 @@ class API_v1:
         Returns:
             ApiResponseOfMinecraftGameVersion: A response object
         """
-        response = self.client.get(
+        return self.client.get_model(
             "v1/minecraft/version/{}".format(game_version_string),
+            ApiResponseOfMinecraftGameVersion,
         )
-        return ApiResponseOfMinecraftGameVersion(**response)
 
     def get_minecraft_modloaders(
         self, version: str | None = None, include_all: bool | None = None
@@ -543,14 +1040,14 @@ class API_v1:
         Returns:
             ApiResponseOfListOfMinecraftModLoaderIndex: A response object
         """
-        response = self.client.get(
+        return self.client.get_model(
             "v1/minecraft/modloader",
+            ApiResponseOfListOfMinecraftModLoaderIndex,
             params={
                 "version": version,
                 "includeAll": include_all,
             },
         )
-        return ApiResponseOfListOfMinecraftModLoaderIndex(**response)
 
     def get_minecraft_modloader(
         self, mod_loader_name: str
@@ -565,7 +1062,7 @@ class API_v1:
         Returns:
             ApiResponseOfMinecraftModLoaderVersion: A response object
         """
-        response = self.client.get(
+        return self.client.get_model(
             "v1/minecraft/modloader/{}".format(mod_loader_name),
+            ApiResponseOfMinecraftModLoaderVersion,
         )
-        return ApiResponseOfMinecraftModLoaderVersion(**response)
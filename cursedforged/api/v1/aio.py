@@ -0,0 +1,1070 @@
+import asyncio
+from typing import TYPE_CHECKING, AsyncIterator
+
+from ..batching import afetch_chunks, in_id_order
+from ..pagination import afetch_all_pages, aiter_pages
+
+from cursedforged.fingerprint import batch_folder_fingerprints
+from cursedforged.types import (
+    File,
+    Game,
+    Mod,
+    ModsSearchSortField,
+    SortOrder,
+    ModLoaderType,
+    GetGameResponse,
+    GetGamesResponse,
+    GetVersionsResponse,
+    GetVersionTypesResponse,
+    GetCategoriesResponse,
+    GetModResponse,
+    GetModsResponse,
+    GetModsBatchResponse,
+    GetFeaturedModsResponse,
+    StringResponse,
+    GetModFileResponse,
+    GetModFilesResponse,
+    GetFilesResponse,
+    GetFilesBatchResponse,
+    ApiResponseOfListOfMinecraftGameVersion,
+    ApiResponseOfMinecraftGameVersion,
+    ApiResponseOfListOfMinecraftModLoaderIndex,
+    ApiResponseOfMinecraftModLoaderVersion,
+    GetFingerprintMatchesResponse,
+    FolderFingerprint,
+    GetFingerprintsFuzzyMatchesResponse,
+    SearchModsResponse,
+    project_instance,
+    project_response,
+)
+
+if TYPE_CHECKING:
+    from ..aio import AsyncAPIClient
+
+
+class AsyncAPI_v1:
+    def __init__(self, client: "AsyncAPIClient"):
+        self.client = client
+
+    async def _store_mods(self, mods: list[Mod]) -> None:
+        """Write mods through to the client's entity store, if any, on a worker thread.
+
+        Args:
+            mods (list[Mod]): The parsed mods.
+        """
+        if self.client.store is not None and mods:
+            await asyncio.to_thread(self.client.store.put_mods, mods)
+
+    async def _store_files(self, files: list[File]) -> None:
+        """Write files through to the client's entity store, if any, on a worker thread.
+
+        Args:
+            files (list[File]): The parsed files.
+        """
+        if self.client.store is not None and files:
+            await asyncio.to_thread(self.client.store.put_files, files)
+
+    async def get_games(self, index: int = 0, page_size: int = 50) -> GetGamesResponse:
+        """Get all games
+
+        https://docs.curseforge.com/#get-games
+
+        Args:
+            index (int, optional): A zero based index of the first item to include in the response, the limit is: (index + pageSize <= 10,000).
+            page_size (int, optional): The number of items to include in the response, the default/maximum value is 50.
+
+        Returns:
+            GetGamesResponse: A response object
+        """
+        return await self.client.get_model(
+            "v1/games",
+            GetGamesResponse,
+            params={
+                "index": index,
+                "pageSize": page_size,
+            },
+        )
+
+    async def iter_games(
+        self, page_size: int = 50, prefetch: bool = True
+    ) -> AsyncIterator[Game]:
+        """Iterate over all games, requesting pages as they are consumed.
+
+        The iteration stops at the end of the results or at the (index + pageSize <= 10,000) limit.
+
+        Args:
+            page_size (int, optional): The number of items to request per page, the default/maximum value is 50.
+            prefetch (bool, optional): Whether to request the next page while the current one is consumed. Defaults to True.
+
+        Yields:
+            Game: A game object
+        """
+
+        async def fetch_page(index: int, size: int) -> GetGamesResponse:
+            return await self.get_games(index=index, page_size=size)
+
+        async for page in aiter_pages(fetch_page, page_size, prefetch=prefetch):
+            for game in page.data:
+                yield game
+
+    async def get_games_all(
+        self, page_size: int = 50, max_concurrency: int = 8
+    ) -> GetGamesResponse:
+        """Get all games in a single response.
+
+        Once the first page reports the total count, the remaining pages are requested as concurrent tasks.
+
+        Args:
+            page_size (int, optional): The number of items to request per page, the default/maximum value is 50.
+            max_concurrency (int, optional): The maximum number of pages requested at once. Defaults to 8.
+
+        Returns:
+            GetGamesResponse: A response object holding every game
+        """
+
+        async def fetch_page(index: int, size: int) -> GetGamesResponse:
+            return await self.get_games(index=index, page_size=size)
+
+        return await afetch_all_pages(fetch_page, page_size, max_concurrency)
+
+    async def get_game(self, game_id: int) -> Game:
+        """Get a game
+
+        https://docs.curseforge.com/#get-game
+
+        Args:
+            game_id (int): A game unique id
+
+        Returns:
+            Game: A game object
+        """
+        response = await self.client.get_model(
+            "v1/games/{}".format(game_id),
+            GetGameResponse,
+        )
+        return response.data
+
+    async def get_game_versions(self, game_id: int) -> GetVersionsResponse:
+        """Get all available versions for each known version type of the specified game. A private game is only accessible to its respective API key.
+
+        https://docs.curseforge.com/#get-versions
+
+        Args:
+            game_id (int): A game unique id
+
+        Returns:
+            GetVersionsResponse: A response object
+        """
+        return await self.client.get_model(
+            "v1/games/{}/versions".format(game_id),
+            GetVersionsResponse,
+        )
+
+    async def get_game_version_types(self, game_id: int) -> GetVersionTypesResponse:
+        """Get all available version types of the specified game.
+
+        https://docs.curseforge.com/#get-version-types
+
+        A private game is only accessible to its respective API key.
+
+        Currently, when creating games via the CurseForge for Studios Console, you are limited to a single game version type. This means that this endpoint is probably not useful in most cases and is relevant mostly when handling existing games that have multiple game versions such as World of Warcraft and Minecraft (e.g. 517 for wow_retail).
+
+        Args:
+            game_id (int): A game unique id
+
+        Returns:
+            GetVersionTypesResponse: A response object
+        """
+        return await self.client.get_model(
+            "v1/games/{}/version-types".format(game_id),
+            GetVersionTypesResponse,
+        )
+
+    async def get_categories(
+        self, game_id: int, class_id: int | None = None, classes_only: bool = False
+    ) -> GetCategoriesResponse:
+        """Get all available classes and categories of the specified game. Specify a game id for a list of all game categories, or a class id for a list of categories under that class. specifiy the classes Only flag to just get the classes for a given game.
+
+        https://docs.curseforge.com/#get-categories
+
+        Args:
+            game_id (int): A game unique id
+            class_id (int | None, optional): A class unique id. Defaults to None.
+            classes_only (bool, optional): If true, only return the classes for the specified game. Defaults to False.
+
+        Returns:
+            GetCategoriesResponse: A response object
+        """
+
+        return await self.client.get_model(
+            "v1/categories",
+            GetCategoriesResponse,
+            params={
+                "gameId": game_id,
+                "classId": class_id,
+                "classesOnly": classes_only,
+            },
+        )
+
+    async def search_mods(
+        self,
+        game_id: int,
+        class_id: int | None = None,
+        category_id: int | None = None,
+        category_ids: list[int] | None = None,
+        game_version: str | None = None,
+        game_versions: list[str] | None = None,
+        search_filter: str | None = None,
+        sort_field: ModsSearchSortField | None = None,
+        sort_order: SortOrder | None = None,
+        mod_loader_type: ModLoaderType | None = None,
+        mod_loader_types: list[ModLoaderType] | None = None,
+        game_version_type_id: int | None = None,
+        author_id: int | None = None,
+        primary_author_id: int | None = None,
+        slug: str | None = None,
+        index: int | None = 0,
+        page_size: int | None = 50,
+        fields: list[str] | None = None,
+    ) -> SearchModsResponse:
+        """Get all mods that match the search criteria.
+
+        https://docs.curseforge.com/#search-mods
+
+        Args:
+            game_id (int): A game unique id
+            class_id (int | None, optional): Filter by section id (discoverable via Categories)
+            category_id (int | None, optional): Filter by category id
+            category_ids (list[int] | None, optional): Filter by a list of category ids - this will override categoryId
+            game_version (str | None, optional): Filter by game version string
+            game_versions (list[str] | None, optional): Filter by a list of game version strings - this will override
+            search_filter (str | None, optional): Filter by free text search in the mod name and author
+            sort_field (ModsSearchSortField | None, optional): Filter by ModsSearchSortField enumeration
+            sort_order (SortOrder | None, optional): 'asc' if sort is in ascending order, 'desc' if sort is in descending order
+            mod_loader_type (ModLoaderType | None, optional): Filter only mods associated to a given modloader (Forge, Fabric ...). Must be coupled with gameVersion.
+            mod_loader_types (list[ModLoaderType] | None, optional): Filter by a list of mod loader types - this will override modLoaderType
+            game_version_type_id (int | None, optional): Filter only mods that contain files tagged with versions of the given gameVersionTypeId
+            author_id (int | None, optional): Filter only mods that the given authorId is a member of.
+            primary_author_id (int | None, optional): Filter only mods that the given primaryAuthorId is the owner of.
+            slug (str | None, optional): Filter by slug (coupled with classId will result in a unique result).
+            index (int | None, optional): A zero based index of the first item to include in the response, the limit is: (index + pageSize <= 10,000).
+            page_size (int | None, optional): The number of items to include in the response, the default/maximum value is 50.
+            fields (list[str] | None, optional): Only parse these `Mod` fields, the others are None, see `project`. Defaults to None.
+
+        Returns:
+            SearchModsResponse: A response object
+        """
+        result = await self.client.get_model(
+            "v1/mods/search",
+            project_response(SearchModsResponse, Mod, fields),
+            params={
+                "gameId": game_id,
+                "classId": class_id,
+                "categoryId": category_id,
+                "categoryIds": category_ids,
+                "gameVersion": game_version,
+                "gameVersions": game_versions,
+                "searchFilter": search_filter,
+                "sortField": sort_field,
+                "sortOrder": sort_order,
+                "modLoaderType": mod_loader_type,
+                "modLoaderTypes": mod_loader_types,
+                "gameVersionTypeId": game_version_type_id,
+                "authorId": author_id,
+                "primaryAuthorId": primary_author_id,
+                "slug": slug,
+                "index": index,
+                "pageSize": page_size,
+            },
+        )
+        if fields is None:
+            await self._store_mods(result.data)
+        return result
+
+    async def iter_search_mods(
+        self,
+        game_id: int,
+        class_id: int | None = None,
+        category_id: int | None = None,
+        category_ids: list[int] | None = None,
+        game_version: str | None = None,
+        game_versions: list[str] | None = None,
+        search_filter: str | None = None,
+        sort_field: ModsSearchSortField | None = None,
+        sort_order: SortOrder | None = None,
+        mod_loader_type: ModLoaderType | None = None,
+        mod_loader_types: list[ModLoaderType] | None = None,
+        game_version_type_id: int | None = None,
+        author_id: int | None = None,
+        primary_author_id: int | None = None,
+        slug: str | None = None,
+        page_size: int = 50,
+        fields: list[str] | None = None,
+        prefetch: bool = True,
+    ) -> AsyncIterator[Mod]:
+        """Iterate over all mods that match the search criteria, requesting pages as they are consumed.
+
+        The iteration stops at the end of the results or at the (index + pageSize <= 10,000) limit.
+
+        Args:
+            game_id (int): A game unique id
+            class_id (int | None, optional): Filter by section id (discoverable via Categories)
+            category_id (int | None, optional): Filter by category id
+            category_ids (list[int] | None, optional): Filter by a list of category ids - this will override categoryId
+            game_version (str | None, optional): Filter by game version string
+            game_versions (list[str] | None, optional): Filter by a list of game version strings - this will override
+            search_filter (str | None, optional): Filter by free text search in the mod name and author
+            sort_field (ModsSearchSortField | None, optional): Filter by ModsSearchSortField enumeration
+            sort_order (SortOrder | None, optional): 'asc' if sort is in ascending order, 'desc' if sort is in descending order
+            mod_loader_type (ModLoaderType | None, optional): Filter only mods associated to a given modloader (Forge, Fabric ...). Must be coupled with gameVersion.
+            mod_loader_types (list[ModLoaderType] | None, optional): Filter by a list of mod loader types - this will override modLoaderType
+            game_version_type_id (int | None, optional): Filter only mods that contain files tagged with versions of the given gameVersionTypeId
+            author_id (int | None, optional): Filter only mods that the given authorId is a member of.
+            primary_author_id (int | None, optional): Filter only mods that the given primaryAuthorId is the owner of.
+            slug (str | None, optional): Filter by slug (coupled with classId will result in a unique result).
+            page_size (int, optional): The number of items to request per page, the default/maximum value is 50.
+            fields (list[str] | None, optional): Only parse these `Mod` fields, the others are None, see `project`. Defaults to None.
+            prefetch (bool, optional): Whether to request the next page while the current one is consumed. Defaults to True.
+
+        Yields:
+            Mod: A mod object
+        """
+
+        async def fetch_page(index: int, size: int) -> SearchModsResponse:
+            return await self.search_mods(
+                game_id=game_id,
+                class_id=class_id,
+                category_id=category_id,
+                category_ids=category_ids,
+                game_version=game_version,
+                game_versions=game_versions,
+                search_filter=search_filter,
+                sort_field=sort_field,
+                sort_order=sort_order,
+                mod_loader_type=mod_loader_type,
+                mod_loader_types=mod_loader_types,
+                game_version_type_id=game_version_type_id,
+                author_id=author_id,
+                primary_author_id=primary_author_id,
+                slug=slug,
+                index=index,
+                page_size=size,
+                fields=fields,
+            )
+
+        async for page in aiter_pages(fetch_page, page_size, prefetch=prefetch):
+            for mod in page.data:
+                yield mod
+
+    async def search_mods_all(
+        self,
+        game_id: int,
+        class_id: int | None = None,
+        category_id: int | None = None,
+        category_ids: list[int] | None = None,
+        game_version: str | None = None,
+        game_versions: list[str] | None = None,
+        search_filter: str | None = None,
+        sort_field: ModsSearchSortField | None = None,
+        sort_order: SortOrder | None = None,
+        mod_loader_type: ModLoaderType | None = None,
+        mod_loader_types: list[ModLoaderType] | None = None,
+        game_version_type_id: int | None = None,
+        author_id: int | None = None,
+        primary_author_id: int | None = None,
+        slug: str | None = None,
+        page_size: int = 50,
+        fields: list[str] | None = None,
+        max_concurrency: int = 8,
+    ) -> SearchModsResponse:
+        """Get all mods that match the search criteria in a single response.
+
+        Once the first page reports the total count, the remaining pages are requested as concurrent tasks.
+        The results are limited to the (index + pageSize <= 10,000) window.
+
+        Args:
+            game_id (int): A game unique id
+            class_id (int | None, optional): Filter by section id (discoverable via Categories)
+            category_id (int | None, optional): Filter by category id
+            category_ids (list[int] | None, optional): Filter by a list of category ids - this will override categoryId
+            game_version (str | None, optional): Filter by game version string
+            game_versions (list[str] | None, optional): Filter by a list of game version strings - this will override
+            search_filter (str | None, optional): Filter by free text search in the mod name and author
+            sort_field (ModsSearchSortField | None, optional): Filter by ModsSearchSortField enumeration
+            sort_order (SortOrder | None, optional): 'asc' if sort is in ascending order, 'desc' if sort is in descending order
+            mod_loader_type (ModLoaderType | None, optional): Filter only mods associated to a given modloader (Forge, Fabric ...). Must be coupled with gameVersion.
+            mod_loader_types (list[ModLoaderType] | None, optional): Filter by a list of mod loader types - this will override modLoaderType
+            game_version_type_id (int | None, optional): Filter only mods that contain files tagged with versions of the given gameVersionTypeId
+            author_id (int | None, optional): Filter only mods that the given authorId is a member of.
+            primary_author_id (int | None, optional): Filter only mods that the given primaryAuthorId is the owner of.
+            slug (str | None, optional): Filter by slug (coupled with classId will result in a unique result).
+            page_size (int, optional): The number of items to request per page, the default/maximum value is 50.
+            fields (list[str] | None, optional): Only parse these `Mod` fields, the others are None, see `project`. Defaults to None.
+            max_concurrency (int, optional): The maximum number of pages requested at once. Defaults to 8.
+
+        Returns:
+            SearchModsResponse: A response object holding every matching mod
+        """
+
+        async def fetch_page(index: int, size: int) -> SearchModsResponse:
+            return await self.search_mods(
+                game_id=game_id,
+                class_id=class_id,
+                category_id=category_id,
+                category_ids=category_ids,
+                game_version=game_version,
+                game_versions=game_versions,
+                search_filter=search_filter,
+                sort_field=sort_field,
+                sort_order=sort_order,
+                mod_loader_type=mod_loader_type,
+                mod_loader_types=mod_loader_types,
+                game_version_type_id=game_version_type_id,
+                author_id=author_id,
+                primary_author_id=primary_author_id,
+                slug=slug,
+                index=index,
+                page_size=size,
+                fields=fields,
+            )
+
+        return await afetch_all_pages(fetch_page, page_size, max_concurrency)
+
+    async def get_mod(
+        self,
+        mod_id: int,
+        max_age: float | None = None,
+        fields: list[str] | None = None,
+    ) -> GetModResponse:
+        """Get a single mod.
+
+        https://docs.curseforge.com/#get-mod
+
+        Args:
+            mod_id (int): The mod id
+            max_age (float | None, optional): Answer from the client's entity store when its copy is at most this many seconds old. Defaults to None.
+            fields (list[str] | None, optional): Only parse these `Mod` fields, the others are None, see `project`. Defaults to None.
+
+        Returns:
+            GetModResponse: A response object
+        """
+        if max_age is not None and self.client.store is not None:
+            mod = await asyncio.to_thread(self.client.store.get_mod, mod_id, max_age)
+            if mod is not None:
+                return GetModResponse(data=project_instance(mod, fields))
+
+        result = await self.client.get_model(
+            "v1/mods/{}".format(mod_id),
+            project_response(GetModResponse, Mod, fields),
+        )
+        if fields is None:
+            await self._store_mods([result.data])
+        return result
+
+    async def get_mods(
+        self,
+        mod_ids: list[int],
+        filter_pc_only: bool | None = False,
+        max_age: float | None = None,
+        fields: list[str] | None = None,
+    ) -> GetModsResponse:
+        """Get a list of mods belonging the the same game.
+
+        https://docs.curseforge.com/#get-mods
+
+        Args:
+            mod_ids (list[int]): A list of mod ids
+            filter_pc_only (bool | None, optional): Filter mods that are only available for PC. Defaults to False.
+            max_age (float | None, optional): Answer from the client's entity store when its copy is at most this many seconds old. Defaults to None.
+            fields (list[str] | None, optional): Only parse these `Mod` fields, the others are None, see `project`. Defaults to None.
+
+        Returns:
+            GetModsResponse: A response object
+        """
+        stored: dict[int, Mod] = {}
+        missing = mod_ids
+        if max_age is not None and self.client.store is not None:
+            stored = await asyncio.to_thread(self.client.store.get_mods, mod_ids, max_age)
+            if fields is not None:
+                stored = {
+                    mod_id: project_instance(mod, fields) for mod_id, mod in stored.items()
+                }
+            missing = [mod_id for mod_id in mod_ids if mod_id not in stored]
+            if not missing:
+                return GetModsResponse(data=in_id_order(mod_ids, stored))
+
+        result = await self.client.post_model(
+            "v1/mods",
+            project_response(GetModsResponse, Mod, fields),
+            data={
+                "modIds": missing,
+                "filterPcOnly": filter_pc_only,
+            },
+        )
+        if fields is None:
+            await self._store_mods(result.data)
+        if stored:
+            fetched = {mod.id: mod for mod in result.data}
+            result.data = in_id_order(mod_ids, {**stored, **fetched})
+        return result
+
+    async def get_mods_batched(
+        self,
+        mod_ids: list[int],
+        filter_pc_only: bool | None = False,
+        chunk_size: int = 500,
+        max_concurrency: int = 8,
+        max_age: float | None = None,
+        fields: list[str] | None = None,
+    ) -> GetModsBatchResponse:
+        """Get a list of mods of any length by splitting it into chunks.
+
+        Duplicate ids are dropped and the chunks are requested as concurrent tasks. A failing chunk does not fail the whole call,
+        its error is reported for each of its ids in `errors`.
+
+        Args:
+            mod_ids (list[int]): A list of mod ids
+            filter_pc_only (bool | None, optional): Filter mods that are only available for PC. Defaults to False.
+            chunk_size (int, optional): The maximum number of ids sent per request. Defaults to 500.
+            max_concurrency (int, optional): The maximum number of requests sent at once. Defaults to 8.
+            max_age (float | None, optional): Answer from the client's entity store when its copy is at most this many seconds old. Defaults to None.
+            fields (list[str] | None, optional): Only parse these `Mod` fields, the others are None, see `project`. Defaults to None.
+
+        Returns:
+            GetModsBatchResponse: A response object
+        """
+
+        async def fetch_chunk(chunk: list[int]) -> list[Mod]:
+            return (await self.get_mods(
+                chunk, filter_pc_only=filter_pc_only, max_age=max_age, fields=fields
+            )).data
+
+        data, errors = await afetch_chunks(fetch_chunk, mod_ids, chunk_size, max_concurrency)
+        return GetModsBatchResponse(data=data, errors=errors)
+
+    async def get_featured_mods(
+        self,
+        game_id: int,
+        excluded_mod_ids: list[int] | None = None,
+        game_version_type_id: int | None = None,
+    ) -> GetFeaturedModsResponse:
+        """Get a list of featured, popular and recently updated mods.
+
+        https://docs.curseforge.com/#get-featured-mods
+
+        Args:
+            game_id (int): A game unique id
+            excluded_mod_ids (list[int] | None, optional): A list of mod ids to exclude from the response. Defaults to None.
+            game_version_type_id (int | None, optional): Filter mods by game version type. Defaults to None.
+
+        Returns:
+            GetFeaturedModsResponse: A response object
+        """
+        result = await self.client.post_model(
+            "v1/mods/featured",
+            GetFeaturedModsResponse,
+            data={
+                "gameId": game_id,
+                "excludedModIds": excluded_mod_ids,
+                "gameVersionTypeId": game_version_type_id,
+            },
+        )
+        await self._store_mods(result.featured + result.popular + result.recently_updated)
+        return result
+
+    async def get_mod_description(
+        self,
+        mod_id: int,
+        raw: bool | None = None,
+        stripped: bool | None = None,
+        markup: bool | None = None,
+    ) -> StringResponse:
+        """Get the full description of a mod in HTML format.
+
+        https://docs.curseforge.com/#get-mod-description
+
+        Args:
+            mod_id (int): The mod id
+            raw (bool | None, optional): If true, the description will be returned as it is stored in the database. Defaults to None.
+            stripped (bool | None, optional): If true, the description will be stripped of all HTML tags. Defaults to None.
+            markup (bool | None, optional): If true, the description will be returned as it is stored in the database. Defaults to None.
+
+        Returns:
+            StringResponse: The mod description
+        """
+        return await self.client.get_model(
+            "v1/mods/{}/description".format(mod_id),
+            StringResponse,
+            params={
+                "raw": raw,
+                "stripped": stripped,
+                "markup": markup,
+            },
+        )
+
+    async def get_mod_file(
+        self, mod_id: int, file_id: int, max_age: float | None = None
+    ) -> GetModFileResponse:
+        """Get a single file of the specified mod.
+
+        https://docs.curseforge.com/#get-mod-file
+
+        Args:
+            mod_id (int): The mod id the file belongs to
+            file_id (int): The file id
+            max_age (float | None, optional): Answer from the client's entity store when its copy is at most this many seconds old. Defaults to None.
+
+        Returns:
+            GetModFileResponse: The mod file
+        """
+        if max_age is not None and self.client.store is not None:
+            file = await asyncio.to_thread(self.client.store.get_file, file_id, max_age)
+            if file is not None and file.mod_id == mod_id:
+                return GetModFileResponse(data=file)
+
+        result = await self.client.get_model(
+            "v1/mods/{}/files/{}".format(mod_id, file_id),
+            GetModFileResponse,
+        )
+        await self._store_files([result.data])
+        return result
+
+    async def get_mod_files(
+        self,
+        mod_id: int,
+        game_version: str | None = None,
+        mod_loader_type: ModLoaderType | None = None,
+        game_version_type_id: int | None = None,
+        index: int | None = 0,
+        page_size: int | None = 50,
+    ) -> GetModFilesResponse:
+        """Get all files of the specified mod.
+
+        https://docs.curseforge.com/#get-mod-files
+
+        Args:
+            mod_id (int): The mod id the files belong to
+            game_version (str | None, optional): Filter by game version string. Defaults to None.
+            mod_loader_type (ModLoaderType | None, optional): ModLoaderType enumeration. Defaults to None.
+            game_version_type_id (int | None, optional): Filter only files that are tagged with versions of the given gameVersionTypeId. Defaults to None.
+            index (int | None, optional): A zero based index of the first item to include in the response, the limit is: (index + pageSize <= 10,000).
+            page_size (int | None, optional): The number of items to include in the response, the default/maximum value is 50.
+
+        Returns:
+            GetModFilesResponse: A response object
+        """
+        result = await self.client.get_model(
+            "v1/mods/{}/files".format(mod_id),
+            GetModFilesResponse,
+            params={
+                "gameVersion": game_version,
+                "modLoaderType": mod_loader_type,
+                "gameVersionTypeId": game_version_type_id,
+                "index": index,
+                "pageSize": page_size,
+            },
+        )
+        await self._store_files(result.data)
+        return result
+
+    async def iter_mod_files(
+        self,
+        mod_id: int,
+        game_version: str | None = None,
+        mod_loader_type: ModLoaderType | None = None,
+        game_version_type_id: int | None = None,
+        page_size: int = 50,
+        prefetch: bool = True,
+    ) -> AsyncIterator[File]:
+        """Iterate over all files of the specified mod, requesting pages as they are consumed.
+
+        The iteration stops at the end of the results or at the (index + pageSize <= 10,000) limit.
+
+        Args:
+            mod_id (int): The mod id the files belong to
+            game_version (str | None, optional): Filter by game version string. Defaults to None.
+            mod_loader_type (ModLoaderType | None, optional): ModLoaderType enumeration. Defaults to None.
+            game_version_type_id (int | None, optional): Filter only files that are tagged with versions of the given gameVersionTypeId. Defaults to None.
+            page_size (int, optional): The number of items to request per page, the default/maximum value is 50.
+            prefetch (bool, optional): Whether to request the next page while the current one is consumed. Defaults to True.
+
+        Yields:
+            File: A file object
+        """
+
+        async def fetch_page(index: int, size: int) -> GetModFilesResponse:
+            return await self.get_mod_files(
+                mod_id=mod_id,
+                game_version=game_version,
+                mod_loader_type=mod_loader_type,
+                game_version_type_id=game_version_type_id,
+                index=index,
+                page_size=size,
+            )
+
+        async for page in aiter_pages(fetch_page, page_size, prefetch=prefetch):
+            for file in page.data:
+                yield file
+
+    async def get_mod_files_all(
+        self,
+        mod_id: int,
+        game_version: str | None = None,
+        mod_loader_type: ModLoaderType | None = None,
+        game_version_type_id: int | None = None,
+        page_size: int = 50,
+        max_concurrency: int = 8,
+    ) -> GetModFilesResponse:
+        """Get all files of the specified mod in a single response.
+
+        Once the first page reports the total count, the remaining pages are requested as concurrent tasks.
+
+        Args:
+            mod_id (int): The mod id the files belong to
+            game_version (str | None, optional): Filter by game version string. Defaults to None.
+            mod_loader_type (ModLoaderType | None, optional): ModLoaderType enumeration. Defaults to None.
+            game_version_type_id (int | None, optional): Filter only files that are tagged with versions of the given gameVersionTypeId. Defaults to None.
+            page_size (int, optional): The number of items to request per page, the default/maximum value is 50.
+            max_concurrency (int, optional): The maximum number of pages requested at once. Defaults to 8.
+
+        Returns:
+            GetModFilesResponse: A response object holding every file
+        """
+
+        async def fetch_page(index: int, size: int) -> GetModFilesResponse:
+            return await self.get_mod_files(
+                mod_id=mod_id,
+                game_version=game_version,
+                mod_loader_type=mod_loader_type,
+                game_version_type_id=game_version_type_id,
+                index=index,
+                page_size=size,
+            )
+
+        return await afetch_all_pages(fetch_page, page_size, max_concurrency)
+
+    async def get_files(
+        self, file_ids: list[int], max_age: float | None = None
+    ) -> GetFilesResponse:
+        """Get a list of files.
+
+        https://docs.curseforge.com/#get-files
+
+        Args:
+            file_ids (list[int]): A list of file ids
+            max_age (float | None, optional): Answer from the client's entity store when its copy is at most this many seconds old. Defaults to None.
+
+        Returns:
+            GetFilesResponse: A response object
+        """
+        stored: dict[int, File] = {}
+        missing = file_ids
+        if max_age is not None and self.client.store is not None:
+            stored = await asyncio.to_thread(self.client.store.get_files, file_ids, max_age)
+            missing = [file_id for file_id in file_ids if file_id not in stored]
+            if not missing:
+                return GetFilesResponse(data=in_id_order(file_ids, stored))
+
+        result = await self.client.post_model(
+            "v1/mods/files",
+            GetFilesResponse,
+            data={
+                "fileIds": missing,
+            },
+        )
+        await self._store_files(result.data)
+        if stored:
+            fetched = {file.id: file for file in result.data}
+            result.data = in_id_order(file_ids, {**stored, **fetched})
+        return result
+
+    async def get_files_batched(
+        self,
+        file_ids: list[int],
+        chunk_size: int = 500,
+        max_concurrency: int = 8,
+        max_age: float | None = None,
+    ) -> GetFilesBatchResponse:
+        """Get a list of files of any length by splitting it into chunks.
+
+        Duplicate ids are dropped and the chunks are requested as concurrent tasks. A failing chunk does not fail the whole call,
+        its error is reported for each of its ids in `errors`.
+
+        Args:
+            file_ids (list[int]): A list of file ids
+            chunk_size (int, optional): The maximum number of ids sent per request. Defaults to 500.
+            max_concurrency (int, optional): The maximum number of requests sent at once. Defaults to 8.
+            max_age (float | None, optional): Answer from the client's entity store when its copy is at most this many seconds old. Defaults to None.
+
+        Returns:
+            GetFilesBatchResponse: A response object
+        """
+
+        async def fetch_chunk(chunk: list[int]) -> list[File]:
+            return (await self.get_files(chunk, max_age=max_age)).data
+
+        data, errors = await afetch_chunks(fetch_chunk, file_ids, chunk_size, max_concurrency)
+        return GetFilesBatchResponse(data=data, errors=errors)
+
+    async def get_mod_file_changelog(self, mod_id: int, file_id: int) -> StringResponse:
+        """Get the changelog of a file in HTML format.
+
+        https://docs.curseforge.com/#get-mod-file-changelog
+
+        Args:
+            mod_id (int): The mod id the file belongs to
+            file_id (int): The file id
+
+        Returns:
+            StringResponse: A response object
+        """
+        return await self.client.get_model(
+            "v1/mods/{}/files/{}/changelog".format(mod_id, file_id),
+            StringResponse,
+        )
+
+    async def get_mod_file_download_url(self, mod_id: int, file_id: int) -> StringResponse:
+        """Get a download url for a specific file.
+
+        https://docs.curseforge.com/#get-mod-file-download-url
+
+        Args:
+            mod_id (int): The mod id the file belongs to
+            file_id (int): The file id
+
+        Returns:
+            StringResponse: A response object
+        """
+        return await self.client.get_model(
+            "v1/mods/{}/files/{}/download-url".format(mod_id, file_id),
+            StringResponse,
+        )
+
+    async def get_fingerprints_matches_by_game_id(
+        self, game_id: int, fingerprints: list[int]
+    ) -> GetFingerprintMatchesResponse:
+        """Get mod files that match a list of fingerprints for a given game id.
+
+        https://docs.curseforge.com/#get-fingerprints-matches-by-game-id
+
+        Args:
+            game_id (int): The game id for matching fingerprints
+            fingerprints (list[int]): The request body containing an array of fingerprints
+
+        Returns:
+            GetFingerprintMatchesResponse: A response object
+        """
+        result = await self.client.post_model(
+            "v1/fingerprints/{}".format(game_id),
+            GetFingerprintMatchesResponse,
+            data={
+                "fingerprints": fingerprints,
+            },
+        )
+        await self._store_files(
+            [
+                file
+                for match in result.data.exact_matches + result.data.partial_matches
+                for file in (match.file, *match.latest_files)
+            ]
+        )
+        return result
+
+    async def get_fingerprints_matches(
+        self, fingerprints: list[int]
+    ) -> GetFingerprintMatchesResponse:
+        """Get mod files that match a list of fingerprints.
+
+        https://docs.curseforge.com/#get-fingerprints-matches
+
+        Args:
+            fingerprints (list[int]): The request body containing an array of fingerprints
+
+        Returns:
+            GetFingerprintMatchesResponse: A response object
+        """
+        result = await self.client.post_model(
+            "v1/fingerprints",
+            GetFingerprintMatchesResponse,
+            data={
+                "fingerprints": fingerprints,
+            },
+        )
+        await self._store_files(
+            [
+                file
+                for match in result.data.exact_matches + result.data.partial_matches
+                for file in (match.file, *match.latest_files)
+            ]
+        )
+        return result
+
+    async def get_fingerprints_fuzzy_matches_by_game_id(
+        self, game_id: int, fingerprints: list[FolderFingerprint]
+    ) -> GetFingerprintsFuzzyMatchesResponse:
+        """Get mod files that match a list of fingerprints using fuzzy matching.
+
+        https://docs.curseforge.com/#get-fingerprints-fuzzy-matches-by-game-id
+
+        Args:
+            game_id (int): The game id for matching fingerprints
+            fingerprints (list[FolderFingerprint]): Game id and folder fingerprints options for the fuzzy matching
+
+        Returns:
+            GetFingerprintsFuzzyMatchesResponse: A response object
+        """
+        return await self.client.post_model(
+            "/v1/fingerprints/fuzzy/{}".format(game_id),
+            GetFingerprintsFuzzyMatchesResponse,
+            data={
+                "fingerprints": [
+                    fingerprint.model_dump(by_alias=True) for fingerprint in fingerprints
+                ],
+            },
+        )
+
+    async def get_fingerprints_fuzzy_matches_batched(
+        self,
+        game_id: int,
+        fingerprints: list[FolderFingerprint],
+        max_folders: int = 50,
+        max_fingerprints: int = 10_000,
+        max_concurrency: int = 8,
+    ) -> GetFingerprintsFuzzyMatchesResponse:
+        """Get mod files that match any number of folder fingerprints using fuzzy matching.
+
+        The folders are split into batches of bounded size that are requested as concurrent tasks, see
+        `cursedforged.fingerprint.build_folder_fingerprints` to build the folder fingerprints.
+
+        Args:
+            game_id (int): The game id for matching fingerprints
+            fingerprints (list[FolderFingerprint]): The folder fingerprints to match
+            max_folders (int, optional): The maximum number of folders per request. Defaults to 50.
+            max_fingerprints (int, optional): The maximum number of file fingerprints per request. Defaults to 10,000.
+            max_concurrency (int, optional): The maximum number of requests sent at once. Defaults to 8.
+
+        Returns:
+            GetFingerprintsFuzzyMatchesResponse: A response object holding the matches of every batch
+        """
+        batches = batch_folder_fingerprints(fingerprints, max_folders, max_fingerprints)
+        if not batches:
+            return GetFingerprintsFuzzyMatchesResponse.model_validate(
+                {"data": {"fuzzyMatches": []}}
+            )
+
+        semaphore = asyncio.Semaphore(max(1, max_concurrency))
+
+        async def fetch_batch(
+            batch: list[FolderFingerprint],
+        ) -> GetFingerprintsFuzzyMatchesResponse:
+            async with semaphore:
+                return await self.get_fingerprints_fuzzy_matches_by_game_id(game_id, batch)
+
+        responses = await asyncio.gather(*(fetch_batch(batch) for batch in batches))
+        result = responses[0].model_copy(deep=True)
+        for response in responses[1:]:
+            result.data.fuzzy_matches.extend(response.data.fuzzy_matches)
+        return result
+
+    async def get_fingerprints_fuzzy_matches(
+        self, fingerprints: list[FolderFingerprint]
+    ) -> GetFingerprintsFuzzyMatchesResponse:
+        """Get mod files that match a list of fingerprints using fuzzy matching.
+
+        https://docs.curseforge.com/#get-fingerprints-fuzzy-matches
+
+        Args:
+            fingerprints (list[FolderFingerprint]): Game id and folder fingerprints options for the fuzzy matching
+
+        Returns:
+            GetFingerprintsFuzzyMatchesResponse: A response object
+        """
+        return await self.client.post_model(
+            "/v1/fingerprints/fuzzy",
+            GetFingerprintsFuzzyMatchesResponse,
+            data={
+                "fingerprints": [
+                    fingerprint.model_dump(by_alias=True) for fingerprint in fingerprints
+                ],
+            },
+        )
+
+    async def get_minecraft_versions(
+        self, sort_descending: bool | None = None
+    ) -> ApiResponseOfListOfMinecraftGameVersion:
+        """Get a list of all available Minecraft versions.
+
+        https://docs.curseforge.com/#get-minecraft-versions
+
+        Args:
+            sort_descending (bool, optional): If true, the list will be sorted in descending order. Defaults to None.
+
+        Returns:
+            ApiResponseOfListOfMinecraftGameVersion: A response object
+        """
+        return await self.client.get_model(
+            "v1/minecraft/version",
+            ApiResponseOfListOfMinecraftGameVersion,
+            params={
+                "sortDescending": sort_descending,
+            },
+        )
+
+    async def get_minecraft_version(
+        self, game_version_string: str
+    ) -> ApiResponseOfMinecraftGameVersion:
+        """Get a single Minecraft version.
+
+        https://docs.curseforge.com/#get-specific-minecraft-version
+
+        Args:
+            game_version_string (str): The game version string
+
+        Returns:
+            ApiResponseOfMinecraftGameVersion: A response object
+        """
+        return await self.client.get_model(
+            "v1/minecraft/version/{}".format(game_version_string),
+            ApiResponseOfMinecraftGameVersion,
+        )
+
+    async def get_minecraft_modloaders(
+        self, version: str | None = None, include_all: bool | None = None
+    ) -> ApiResponseOfListOfMinecraftModLoaderIndex:
+        """Get a list of all available Minecraft modloaders.
+
+        https://docs.curseforge.com/#get-minecraft-modloaders
+
+        Args:
+            version (str | None, optional): Filter by game version string. Defaults to None.
+            include_all (bool | None, optional): If true, include all modloaders. Defaults to None.
+
+        Returns:
+            ApiResponseOfListOfMinecraftModLoaderIndex: A response object
+        """
+        return await self.client.get_model(
+            "v1/minecraft/modloader",
+            ApiResponseOfListOfMinecraftModLoaderIndex,
+            params={
+                "version": version,
+                "includeAll": include_all,
+            },
+        )
+
+    async def get_minecraft_modloader(
+        self, mod_loader_name: str
+    ) -> ApiResponseOfMinecraftModLoaderVersion:
+        """Get a single Minecraft modloader.
+
+        https://docs.curseforge.com/#get-specific-minecraft-modloader
+
+        Args:
+            modloader_id (str): The modloader name
+
+        Returns:
+            ApiResponseOfMinecraftModLoaderVersion: A response object
+        """
+        return await self.client.get_model(
+            "v1/minecraft/modloader/{}".format(mod_loader_name),
+            ApiResponseOfMinecraftModLoaderVersion,
+        )
@@ -18,8 +18,7 @@ class API_v2:
         Returns:
             GetVersionsResponse2: A response object
         """
-        response = self.client.get(
+        return self.client.get_model(
             "v2/games/{}/versions".format(game_id),
+            GetVersionsResponse2,
         )
-
-        return GetVersionsResponse2(**response)
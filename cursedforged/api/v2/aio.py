@@ -0,0 +1,27 @@
+from typing import TYPE_CHECKING
+
+from cursedforged.types import GetVersionsResponse2
+
+if TYPE_CHECKING:
+    from cursedforged.api.aio import AsyncAPIClient
+
+
+class AsyncAPI_v2:
+    def __init__(self, client: "AsyncAPIClient"):
+        self.client = client
+
+    async def get_game_versions(self, game_id: int) -> GetVersionsResponse2:
+        """Get all available versions for each known version type of the specified game. A private game is only accessible to its respective API key.
+
+        https://docs.curseforge.com/#get-versions-v2
+
+        Args:
+            game_id (int): A game unique id
+
+        Returns:
+            GetVersionsResponse2: A response object
+        """
+        return await self.client.get_model(
+            "v2/games/{}/versions".format(game_id),
+            GetVersionsResponse2,
+        )
@@ -0,0 +1,318 @@
+"""Columnar export of `Mod`, `File` and `FileIndex` collections.
+
+`to_columns` turns a list of models into a `Table` holding one list per scalar field.
+Nested models are flattened into dotted column names (`links.website_url`) and list
+fields such as `categories`, `authors` or `game_versions` become child tables: the items
+of row `i` are the child rows `offsets[i]:offsets[i + 1]`, like in Arrow list arrays.
+
+Tables convert to NumPy structured arrays when numpy is installed, and to Arrow tables
+or Parquet files when pyarrow is installed, so aggregations over large collections run
+vectorized instead of looping over pydantic objects.
+"""
+
+import os
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from enum import Enum
+from functools import lru_cache
+from operator import attrgetter
+from types import NoneType, UnionType
+from typing import Any, Callable, Iterable, Union, get_args, get_origin
+
+from pydantic import BaseModel
+
+try:
+    import numpy
+except ImportError:  # pragma: no cover - optional dependency
+    numpy = None  # type: ignore[assignment]
+
+try:
+    import pyarrow  # type: ignore[import-untyped]
+    import pyarrow.parquet  # type: ignore[import-untyped]
+except ImportError:  # pragma: no cover - optional dependency
+    pyarrow = None  # type: ignore[assignment]
+
+PARENT_COLUMN = "_parent"
+"""The column added to child tables by the NumPy and Arrow conversions, holding the parent row index."""
+
+_KINDS: dict[type, str] = {
+    bool: "bool",
+    int: "int",
+    float: "float",
+    str: "str",
+    datetime: "datetime",
+}
+
+
+@dataclass
+class _Column:
+    name: str
+    path: tuple[str, ...]
+    kind: str
+    optional: bool
+    enum: bool
+
+
+@dataclass
+class _Child:
+    name: str
+    path: tuple[str, ...]
+    item: type[BaseModel] | None
+    kind: str
+    enum: bool
+
+
+@dataclass
+class Table:
+    columns: dict[str, list[Any]] = field(default_factory=dict)
+    """The values of every scalar field by column name, nested models use dotted names."""
+    kinds: dict[str, tuple[str, bool]] = field(default_factory=dict)
+    """The `(kind, optional)` of every column, kind being one of bool, int, float, str, datetime or object."""
+    children: dict[str, "Table"] = field(default_factory=dict)
+    """The child table of every list field by column name."""
+    offsets: list[int] | None = None
+    """For a child table, the first child row of every parent row followed by the number of child rows."""
+    length: int = 0
+    """The number of rows."""
+
+    def __len__(self) -> int:
+        return self.length
+
+    def parent_rows(self) -> list[int]:
+        """Get the parent row index of every row of a child table.
+
+        Returns:
+            list[int]: The parent row indexes.
+        """
+        if self.offsets is None:
+            raise ValueError("Only child tables have parent rows")
+        return [
+            parent
+            for parent in range(len(self.offsets) - 1)
+            for _ in range(self.offsets[parent + 1] - self.offsets[parent])
+        ]
+
+    def to_numpy(self) -> "numpy.ndarray":
+        """Convert the columns to a NumPy structured array.
+
+        Integer and boolean columns that may hold None become float and object columns,
+        None being NaN for floats. Datetimes are converted to UTC `datetime64[ms]`. A child
+        table gets a `_parent` column holding the parent row index. Child tables are
+        converted separately, e.g. `table.children["authors"].to_numpy()`.
+
+        Raises:
+            ImportError: numpy is not installed.
+
+        Returns:
+            numpy.ndarray: The structured array.
+        """
+        if numpy is None:
+            raise ImportError(
+                "Table.to_numpy requires numpy, install it with `pip install cursedforged[columnar]`"
+            )
+        arrays = {
+            name: _numpy_column(values, *self.kinds[name])
+            for name, values in self.columns.items()
+        }
+        if self.offsets is not None:
+            arrays[PARENT_COLUMN] = numpy.repeat(
+                numpy.arange(len(self.offsets) - 1), numpy.diff(self.offsets)
+            )
+        result = numpy.empty(
+            self.length, dtype=[(name, array.dtype) for name, array in arrays.items()]
+        )
+        for name, array in arrays.items():
+            result[name] = array
+        return result
+
+    def to_arrow(self) -> "pyarrow.Table":
+        """Convert the columns to an Arrow table.
+
+        A child table gets a `_parent` column holding the parent row index. Child tables
+        are converted separately, e.g. `table.children["authors"].to_arrow()`.
+
+        Raises:
+            ImportError: pyarrow is not installed.
+
+        Returns:
+            pyarrow.Table: The Arrow table.
+        """
+        if pyarrow is None:
+            raise ImportError(
+                "Table.to_arrow requires pyarrow, install it with `pip install cursedforged[columnar]`"
+            )
+        arrays = {name: pyarrow.array(values) for name, values in self.columns.items()}
+        if self.offsets is not None:
+            arrays[PARENT_COLUMN] = pyarrow.array(self.parent_rows(), pyarrow.int64())
+        return pyarrow.table(arrays)
+
+    def write_parquet(self, directory: str | os.PathLike[str], name: str) -> list[str]:
+        """Write the table and its child tables to Parquet files.
+
+        The table is written to `<name>.parquet` and each child table to
+        `<name>.<column>.parquet`, recursively.
+
+        Args:
+            directory (str | os.PathLike[str]): The directory to write the files to.
+            name (str): The base name of the files, e.g. "mods".
+
+        Raises:
+            ImportError: pyarrow is not installed.
+
+        Returns:
+            list[str]: The paths of the written files.
+        """
+        arrow = self.to_arrow()
+        os.makedirs(directory, exist_ok=True)
+        path = os.path.join(os.fspath(directory), "{}.parquet".format(name))
+        pyarrow.parquet.write_table(arrow, path)
+        paths = [path]
+        for column, child in self.children.items():
+            paths.extend(child.write_parquet(directory, "{}.{}".format(name, column)))
+        return paths
+
+
+def _unwrap_optional(annotation: Any) -> tuple[Any, bool]:
+    if get_origin(annotation) in (Union, UnionType):
+        args = [arg for arg in get_args(annotation) if arg is not NoneType]
+        if len(args) == 1:
+            return args[0], True
+    return annotation, False
+
+
+def _scalar_kind(annotation: Any) -> tuple[str, bool]:
+    """Get the column kind of a scalar annotation and whether it is an enum."""
+    if isinstance(annotation, type):
+        for base, kind in _KINDS.items():
+            if issubclass(annotation, base):
+                return kind, issubclass(annotation, Enum)
+        if issubclass(annotation, Enum):
+            return "object", True
+    return "object", False
+
+
+@lru_cache(maxsize=None)
+def _plan(
+    model: type[BaseModel], prefix: tuple[str, ...] = (), optional_parent: bool = False
+) -> tuple[list[_Column], list[_Child]]:
+    """Compile the columns and child tables of a model, flattening nested models.
+
+    Fields excluded from serialization, such as the fields left out of a projection,
+    are skipped.
+    """
+    columns: list[_Column] = []
+    children: list[_Child] = []
+    for name, info in model.model_fields.items():
+        if info.exclude:
+            continue
+        path = (*prefix, name)
+        dotted = ".".join(path)
+        annotation, optional = _unwrap_optional(info.annotation)
+        optional = optional or optional_parent
+
+        if get_origin(annotation) is list:
+            (item,) = get_args(annotation)
+            item, _ = _unwrap_optional(item)
+            if isinstance(item, type) and issubclass(item, BaseModel):
+                children.append(_Child(dotted, path, item, "object", False))
+            else:
+                kind, enum = _scalar_kind(item)
+                children.append(_Child(dotted, path, None, kind, enum))
+        elif isinstance(annotation, type) and issubclass(annotation, BaseModel):
+            nested_columns, nested_children = _plan(annotation, path, optional)
+            columns.extend(nested_columns)
+            children.extend(nested_children)
+        else:
+            kind, enum = _scalar_kind(annotation)
+            columns.append(_Column(dotted, path, kind, optional, enum))
+    return columns, children
+
+
+def _getter(path: tuple[str, ...]) -> Callable[[Any], Any]:
+    if len(path) == 1:
+        return attrgetter(path[0])
+
+    def get(item: Any) -> Any:
+        for name in path:
+            if item is None:
+                return None
+            item = getattr(item, name)
+        return item
+
+    return get
+
+
+def _plain(values: list[Any], enum: bool) -> list[Any]:
+    """Replace enum members by their values, so every backend sees plain scalars."""
+    if not enum:
+        return values
+    return [value.value if value is not None else None for value in values]
+
+
+def to_columns(items: Iterable[BaseModel], model: type[BaseModel] | None = None) -> Table:
+    """Convert models, e.g. mods, files or file indexes, to a columnar table.
+
+    Args:
+        items (Iterable[BaseModel]): The models to convert, all of the same type.
+        model (type[BaseModel] | None, optional): The type of the models. Defaults to the type of the first item.
+
+    Raises:
+        ValueError: `items` is empty and no `model` is given.
+
+    Returns:
+        Table: The columns of the models and the child tables of their list fields.
+    """
+    items = list(items)
+    if model is None:
+        if not items:
+            raise ValueError("The model of an empty collection must be specified")
+        model = type(items[0])
+
+    columns, children = _plan(model)
+    table = Table(length=len(items))
+    for column in columns:
+        table.columns[column.name] = _plain(list(map(_getter(column.path), items)), column.enum)
+        table.kinds[column.name] = (column.kind, column.optional)
+
+    for child in children:
+        get = _getter(child.path)
+        offsets = [0]
+        flat: list[Any] = []
+        for item in items:
+            flat.extend(get(item) or ())
+            offsets.append(len(flat))
+        if child.item is not None:
+            child_table = to_columns(flat, child.item)
+        else:
+            child_table = Table(
+                columns={"value": _plain(flat, child.enum)},
+                kinds={"value": (child.kind, False)},
+                length=len(flat),
+            )
+        child_table.offsets = offsets
+        table.children[child.name] = child_table
+    return table
+
+
+def _numpy_column(values: list[Any], kind: str, optional: bool) -> "numpy.ndarray":
+    if kind == "int" and not optional:
+        return numpy.array(values, dtype=numpy.int64)
+    if kind in ("int", "float"):
+        return numpy.array(
+            [numpy.nan if value is None else value for value in values], dtype=numpy.float64
+        )
+    if kind == "bool" and not optional:
+        return numpy.array(values, dtype=numpy.bool_)
+    if kind == "datetime":
+        return numpy.array(
+            [
+                None
+                if value is None
+                else value.astimezone(timezone.utc).replace(tzinfo=None)
+                if value.tzinfo is not None
+                else value
+                for value in values
+            ],
+            dtype="datetime64[ms]",
+        )
+    return numpy.array(values, dtype=object)
@@ -0,0 +1,277 @@
+"""Complete enumeration of a game's mods despite the 10,000 results window of `search_mods`.
+
+A query matching more mods than the window can page through is split into narrower
+partitions, by class, category, game version type, game version and mod loader, until
+every partition fits. The partitions overlap, so the results are deduplicated by mod
+id. Mods that no partition reaches, e.g. mods without files, can be found by probing
+ranges of ids with the batched `get_mods`.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass, field, replace
+from typing import Any
+
+from cursedforged.api.errors import REQUEST_ERRORS
+from cursedforged.api.pagination import (
+    MAX_PAGE_SIZE,
+    MAX_RESULT_WINDOW,
+    remaining_page_indexes,
+)
+from cursedforged.api.v1 import API_v1
+from cursedforged.types import Mod, ModLoaderType, SearchModsResponse
+
+
+@dataclass(frozen=True)
+class Partition:
+    """The filters of a `search_mods` query covering part of a game's mods."""
+
+    class_id: int | None = None
+    category_id: int | None = None
+    game_version_type_id: int | None = None
+    game_version: str | None = None
+    mod_loader_type: ModLoaderType | None = None
+
+
+@dataclass
+class CrawlResult:
+    mods: dict[int, Mod] = field(default_factory=dict)
+    """Every mod found, by mod id."""
+    truncated: list[Partition] = field(default_factory=list)
+    """The partitions that still exceed the results window and cannot be split further, or whose split does not add up to their total."""
+    errors: dict[Partition | int, Exception] = field(default_factory=dict)
+    """The error of every partition that could not be crawled, or of every probed id whose chunk failed."""
+    requests: int = 0
+    """The number of requests sent."""
+
+
+@dataclass
+class _Split:
+    total: int
+    """The total count of the split partition."""
+    pending: int
+    """The number of children whose first page is still expected."""
+    found: int = 0
+    """The sum of the total counts of the children."""
+    failed: bool = False
+    """Whether the first page of a child failed, its error is then reported instead."""
+
+
+class ModCrawler:
+    """Enumerates every mod of a game, splitting queries larger than the results window.
+
+    The first page of a partition tells its total count. A partition that fits in the
+    10,000 results window is paged through, a larger one is split along the next
+    dimension, in order: class, category, game version type, game version and mod
+    loader. The mods of the first page of a split partition are kept too. Pages are
+    requested concurrently on up to `max_concurrency` threads, and as the search writes
+    the mods through to the client's entity store, a crawl fills the store as well.
+
+    The children of a split may overlap but should together count at least as many mods
+    as their parent. When they count fewer, e.g. resource packs that have no mod loader
+    in a game version split by loader, the parent is reported as truncated, since the
+    missing mods cannot be reached by any narrower query.
+
+    Args:
+        api (API_v1): The API used for the crawl, e.g. `client.v1`.
+        game_id (int): The game to crawl.
+        max_concurrency (int, optional): The maximum number of requests sent at once. Defaults to 8.
+        page_size (int, optional): The number of mods requested per page, the default/maximum value is 50.
+        fields (list[str] | None, optional): Only parse these `Mod` fields, the others are None, see `project`. `id` and `game_id` are always parsed. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        api: API_v1,
+        game_id: int,
+        max_concurrency: int = 8,
+        page_size: int = MAX_PAGE_SIZE,
+        fields: list[str] | None = None,
+    ):
+        self.api = api
+        self.game_id = game_id
+        self.max_concurrency = max_concurrency
+        self.page_size = min(page_size, MAX_PAGE_SIZE)
+        # The ids are needed to deduplicate the results and the game ids to filter probed ids.
+        self.fields = list(dict.fromkeys([*fields, "id", "game_id"])) if fields is not None else None
+
+        self._classes: list[int] | None = None
+        self._categories: dict[int, list[int]] = {}
+        self._versions: dict[int, list[str]] | None = None
+
+    def _class_ids(self) -> list[int]:
+        if self._classes is None:
+            response = self.api.get_categories(self.game_id, classes_only=True)
+            self._classes = [category.id for category in response.data]
+        return self._classes
+
+    def _category_ids(self, class_id: int) -> list[int]:
+        if class_id not in self._categories:
+            response = self.api.get_categories(self.game_id, class_id=class_id)
+            self._categories[class_id] = [
+                category.id
+                for category in response.data
+                if not category.is_class and category.id != class_id
+            ]
+        return self._categories[class_id]
+
+    def _game_versions(self) -> dict[int, list[str]]:
+        if self._versions is None:
+            response = self.api.get_game_versions(self.game_id)
+            self._versions = {versions.type: versions.versions for versions in response.data}
+        return self._versions
+
+    def split(self, partition: Partition) -> list[Partition] | None:
+        """Split a partition along the first dimension it does not filter on yet.
+
+        Dimensions without any value, e.g. a class without categories, are skipped.
+
+        Args:
+            partition (Partition): The partition to split.
+
+        Returns:
+            list[Partition] | None: The narrower partitions, or None if the partition cannot be split.
+        """
+        if partition.class_id is None and self._class_ids():
+            return [replace(partition, class_id=class_id) for class_id in self._class_ids()]
+        if (
+            partition.class_id is not None
+            and partition.category_id is None
+            and self._category_ids(partition.class_id)
+        ):
+            return [
+                replace(partition, category_id=category_id)
+                for category_id in self._category_ids(partition.class_id)
+            ]
+        if partition.game_version is None:
+            versions = self._game_versions()
+            type_id = partition.game_version_type_id
+            if type_id is None and versions:
+                return [
+                    replace(partition, game_version_type_id=version_type)
+                    for version_type in versions
+                ]
+            if type_id is not None and versions.get(type_id):
+                return [replace(partition, game_version=version) for version in versions[type_id]]
+        if partition.game_version is not None and partition.mod_loader_type is None:
+            return [
+                replace(partition, mod_loader_type=loader)
+                for loader in ModLoaderType
+                if loader != ModLoaderType.ANY
+            ]
+        return None
+
+    def _fetch_page(self, partition: Partition, index: int) -> SearchModsResponse:
+        return self.api.search_mods(
+            self.game_id,
+            class_id=partition.class_id,
+            category_id=partition.category_id,
+            game_version_type_id=partition.game_version_type_id,
+            game_version=partition.game_version,
+            mod_loader_type=partition.mod_loader_type,
+            index=index,
+            page_size=min(self.page_size, MAX_RESULT_WINDOW - index),
+            fields=self.fields,
+        )
+
+    def crawl(self, partition: Partition | None = None) -> CrawlResult:
+        """Find every mod of a partition, by default of the whole game.
+
+        Args:
+            partition (Partition | None, optional): The partition to crawl. Defaults to every mod of the game.
+
+        Returns:
+            CrawlResult: The mods found, deduplicated by id.
+        """
+        result = CrawlResult()
+        parents: dict[Partition, Partition] = {}
+        splits: dict[Partition, _Split] = {}
+
+        def count_child(child: Partition, total: int | None) -> None:
+            parent = parents.pop(child, None)
+            if parent is None:
+                return
+            split = splits[parent]
+            split.pending -= 1
+            if total is None:
+                split.failed = True
+            else:
+                split.found += total
+            if split.pending == 0:
+                del splits[parent]
+                if split.found < split.total and not split.failed:
+                    result.truncated.append(parent)
+
+        with ThreadPoolExecutor(max_workers=max(1, self.max_concurrency)) as executor:
+            pending: dict[Future[SearchModsResponse], tuple[Partition, int]] = {}
+
+            def submit(partition: Partition, index: int) -> None:
+                pending[executor.submit(self._fetch_page, partition, index)] = (partition, index)
+                result.requests += 1
+
+            submit(partition if partition is not None else Partition(), 0)
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    partition, index = pending.pop(future)
+                    try:
+                        page = future.result()
+                    except REQUEST_ERRORS as e:
+                        result.errors[partition] = e
+                        if index == 0:
+                            count_child(partition, None)
+                        continue
+                    result.mods.update((mod.id, mod) for mod in page.data)
+                    if index != 0:
+                        continue
+
+                    total = page.pagination.total_count
+                    count_child(partition, total)
+                    children = None
+                    if total > MAX_RESULT_WINDOW:
+                        try:
+                            children = self.split(partition)
+                        except REQUEST_ERRORS as e:
+                            result.errors[partition] = e
+                            continue
+                        if children is None:
+                            result.truncated.append(partition)
+                    if children:
+                        splits[partition] = _Split(total, len(children))
+                        for child in children:
+                            parents[child] = partition
+                            submit(child, 0)
+                    elif children is None:
+                        for next_index in remaining_page_indexes(page, self.page_size):
+                            submit(partition, next_index)
+        return result
+
+    def crawl_ids(self, start: int, stop: int, chunk_size: int = 500, **kwargs: Any) -> CrawlResult:
+        """Find the mods of the game among a range of ids, with batched `get_mods` calls.
+
+        This reaches the mods no search partition returns. Ids of other games and unknown
+        ids are left out.
+
+        Args:
+            start (int): The first id to probe.
+            stop (int): The id after the last one to probe.
+            chunk_size (int, optional): The maximum number of ids sent per request. Defaults to 500.
+            **kwargs (Any): The other arguments passed to `get_mods_batched`, e.g. `max_age`.
+
+        Returns:
+            CrawlResult: The mods found, with the errors of the failed chunks by mod id.
+        """
+        response = self.api.get_mods_batched(
+            list(range(start, stop)),
+            chunk_size=chunk_size,
+            max_concurrency=self.max_concurrency,
+            fields=self.fields,
+            **kwargs,
+        )
+        errors: dict[Partition | int, Exception] = {
+            mod_id: error for mod_id, error in response.errors.items()
+        }
+        return CrawlResult(
+            mods={mod.id: mod for mod in response.data if mod.game_id == self.game_id},
+            errors=errors,
+            requests=-(-(stop - start) // chunk_size) if stop > start else 0,
+        )
@@ -0,0 +1,203 @@
+"""Breadth-first resolution of mod dependencies.
+
+Each level of the dependency graph is fetched with a single batched `get_mods` call and
+a single batched `get_files` call, so resolving a pack costs one round trip pair per
+level of depth instead of one request per dependency.
+"""
+
+from dataclasses import dataclass, field
+from typing import Iterable
+
+from cursedforged.api.v1 import API_v1
+from cursedforged.selection import select_file_ids
+from cursedforged.types import File, FileRelationType, Mod, ModLoaderType
+
+FOLLOWED_RELATIONS = {FileRelationType.REQUIRED_DEPENDENCY}
+"""The relations followed by default when walking the dependency graph."""
+
+
+@dataclass
+class Resolution:
+    files: dict[int, File] = field(default_factory=dict)
+    """The selected file of every mod of the closure, by mod id."""
+    mods: dict[int, Mod] = field(default_factory=dict)
+    """The mods of the closure that had to be fetched, by mod id."""
+    dependents: dict[int, set[int]] = field(default_factory=dict)
+    """The mods depending on each mod of the closure, by mod id."""
+    conflicts: list[tuple[int, int]] = field(default_factory=list)
+    """`(mod_id, incompatible_mod_id)` pairs of mods of the closure declared incompatible."""
+    missing: set[int] = field(default_factory=set)
+    """The dependency mod ids that do not exist or have no matching file."""
+    errors: dict[int, Exception] = field(default_factory=dict)
+    """The error of every mod id whose mod or selected file could not be fetched, e.g. a failed chunk."""
+
+
+class DependencyResolver:
+    """Resolves the dependency closure of a set of files level by level.
+
+    The file selected for each mod is memoized on the resolver, so resolving several packs
+    with the same resolver only fetches each dependency once. Lookups that failed are not
+    memoized and are retried by the next resolution. Passing `max_age` lets the client's
+    entity store answer lookups across runs.
+
+    Args:
+        api (API_v1): The API used to fetch mods and files, e.g. `client.v1`.
+        game_version (str | None, optional): Only select files for this game version. Defaults to None.
+        mod_loader_type (ModLoaderType | None, optional): Only select files for this mod loader. Defaults to None.
+        include_optional (bool, optional): Whether to follow optional dependencies too. Defaults to False.
+        max_age (float | None, optional): Passed to the batched lookups to answer them from the client's entity store. Defaults to None.
+    """
+
+    def __init__(
+        self,
+        api: API_v1,
+        game_version: str | None = None,
+        mod_loader_type: ModLoaderType | None = None,
+        include_optional: bool = False,
+        max_age: float | None = None,
+    ):
+        self.api = api
+        self.game_version = game_version
+        self.mod_loader_type = mod_loader_type
+        self.max_age = max_age
+        self.relations = set(FOLLOWED_RELATIONS)
+        if include_optional:
+            self.relations.add(FileRelationType.OPTIONAL_DEPENDENCY)
+
+        self._mods: dict[int, Mod] = {}
+        self._selected: dict[int, File | None] = {}
+
+    def select_file_id(self, mod: Mod) -> int | None:
+        """Select the file of a mod matching the game version and mod loader.
+
+        Releases are preferred over betas and alphas, then the most recent file wins, see
+        `select_file_ids`.
+
+        Args:
+            mod (Mod): The mod to select a file of.
+
+        Returns:
+            int | None: The selected file id, or None if no file matches.
+        """
+        return select_file_ids([mod], self.game_version, self.mod_loader_type)[mod.id]
+
+    def _fetch_level(self, mod_ids: list[int]) -> dict[int, Exception]:
+        """Fetch the mods of a level and their selected files with one batched call each.
+
+        Args:
+            mod_ids (list[int]): The mod ids that are not memoized yet.
+
+        Returns:
+            dict[int, Exception]: The error of every mod id whose mod or file could not be fetched, these are not memoized.
+        """
+        response = self.api.get_mods_batched(mod_ids, max_age=self.max_age)
+        self._mods.update((mod.id, mod) for mod in response.data)
+        errors = {
+            mod_id: response.errors[mod_id] for mod_id in mod_ids if mod_id in response.errors
+        }
+
+        selected = select_file_ids(response.data, self.game_version, self.mod_loader_type)
+        wanted: dict[int, int] = {}
+        for mod_id in mod_ids:
+            if mod_id in errors:
+                continue
+            mod = self._mods.get(mod_id)
+            file_id = selected.get(mod_id)
+            if mod is None or file_id is None:
+                self._selected[mod_id] = None
+                continue
+            latest = next((file for file in mod.latest_files if file.id == file_id), None)
+            if latest is not None:
+                self._selected[mod_id] = latest
+            else:
+                wanted[file_id] = mod_id
+
+        if wanted:
+            files = self.api.get_files_batched(list(wanted), max_age=self.max_age)
+            found = {file.id: file for file in files.data}
+            for file_id, mod_id in wanted.items():
+                if file_id in files.errors:
+                    errors[mod_id] = files.errors[file_id]
+                else:
+                    self._selected[mod_id] = found.get(file_id)
+        return errors
+
+    def resolve(self, files: Iterable[File]) -> Resolution:
+        """Resolve the dependency closure of files.
+
+        Args:
+            files (Iterable[File]): The root files, e.g. the files of a modpack.
+
+        Returns:
+            Resolution: The closure, the incompatibilities within it, the missing dependencies and the failed lookups.
+        """
+        resolution = Resolution()
+        frontier = list(files)
+        resolution.files.update((file.mod_id, file) for file in frontier)
+        incompatible: list[tuple[int, int]] = []
+
+        while frontier:
+            edges: list[tuple[int, int]] = []
+            for file in frontier:
+                for dependency in file.dependencies:
+                    if dependency.relation_type == FileRelationType.INCOMPATIBLE:
+                        incompatible.append((file.mod_id, dependency.mod_id))
+                    elif dependency.relation_type in self.relations:
+                        edges.append((file.mod_id, dependency.mod_id))
+
+            level: list[int] = []
+            for dependent, mod_id in edges:
+                resolution.dependents.setdefault(mod_id, set()).add(dependent)
+                if (
+                    mod_id not in resolution.files
+                    and mod_id not in resolution.missing
+                    and mod_id not in resolution.errors
+                ):
+                    level.append(mod_id)
+            level = list(dict.fromkeys(level))
+
+            unknown = [mod_id for mod_id in level if mod_id not in self._selected]
+            if unknown:
+                resolution.errors.update(self._fetch_level(unknown))
+
+            frontier = []
+            for mod_id in level:
+                if mod_id in resolution.errors:
+                    continue
+                selected = self._selected.get(mod_id)
+                if selected is None:
+                    resolution.missing.add(mod_id)
+                    continue
+                resolution.files[mod_id] = selected
+                if mod_id in self._mods:
+                    resolution.mods[mod_id] = self._mods[mod_id]
+                frontier.append(selected)
+
+        resolution.conflicts = [
+            (mod_id, other)
+            for mod_id, other in dict.fromkeys(incompatible)
+            if other in resolution.files
+        ]
+        return resolution
+
+    def resolve_mods(self, mod_ids: Iterable[int]) -> Resolution:
+        """Select a file for each mod and resolve the dependency closure of those files.
+
+        Args:
+            mod_ids (Iterable[int]): The root mod ids.
+
+        Returns:
+            Resolution: The closure, the incompatibilities within it, the missing dependencies and the failed lookups.
+        """
+        mod_ids = list(dict.fromkeys(mod_ids))
+        unknown = [mod_id for mod_id in mod_ids if mod_id not in self._selected]
+        errors = self._fetch_level(unknown) if unknown else {}
+
+        roots = {mod_id: self._selected[mod_id] for mod_id in mod_ids if mod_id not in errors}
+        resolution = self.resolve(file for file in roots.values() if file is not None)
+        resolution.missing.update(mod_id for mod_id, file in roots.items() if file is None)
+        resolution.errors.update(errors)
+        resolution.mods.update(
+            (mod_id, self._mods[mod_id]) for mod_id in mod_ids if mod_id in self._mods
+        )
+        return resolution
@@ -0,0 +1,268 @@
+"""Concurrent download of mod files with on-the-fly hash verification.
+
+Files are streamed to disk in chunks while the hashes listed in `File.hashes` are
+computed, so no second pass over the data is needed. Interrupted transfers are kept as
+`<file_name>.part` and resumed with a `Range` request on the next attempt. Files are
+requested without content encoding, so the resumed bytes line up with the ones on disk.
+"""
+
+import hashlib
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Iterable
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from cursedforged.types import File, HashAlgo
+
+_CHUNK_SIZE = 1 << 16
+
+_HASH_NAMES = {
+    HashAlgo.SHA1: "sha1",
+    HashAlgo.MD5: "md5",
+}
+
+
+class DownloadError(Exception):
+    """Raised when a file cannot be downloaded or does not match its metadata."""
+
+
+@dataclass
+class DownloadResults:
+    paths: dict[int, str] = field(default_factory=dict)
+    """The path of every downloaded file by file id."""
+    errors: dict[int, Exception] = field(default_factory=dict)
+    """The error of every file that could not be downloaded by file id."""
+
+
+def _new_hashers(file: File) -> dict[HashAlgo, "hashlib._Hash"]:
+    return {
+        h.algo: hashlib.new(_HASH_NAMES[h.algo]) for h in file.hashes if h.algo in _HASH_NAMES
+    }
+
+
+def _verify(file: File, path: str, hashers: dict[HashAlgo, "hashlib._Hash"]) -> None:
+    size = os.path.getsize(path)
+    if size != file.file_length:
+        raise DownloadError(
+            "{} is {} bytes long, expected {}".format(file.file_name, size, file.file_length)
+        )
+    for expected in file.hashes:
+        hasher = hashers.get(expected.algo)
+        if hasher is not None and hasher.hexdigest() != expected.value.lower():
+            raise DownloadError(
+                "{} {} mismatch: got {}, expected {}".format(
+                    file.file_name, expected.algo.name, hasher.hexdigest(), expected.value
+                )
+            )
+
+
+def _hash_existing(path: str, hashers: dict[HashAlgo, "hashlib._Hash"]) -> None:
+    with open(path, "rb") as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            for hasher in hashers.values():
+                hasher.update(chunk)
+
+
+def target_path(file: File, directory: str | os.PathLike[str]) -> str:
+    """Get the path a file is downloaded to, never outside of `directory`.
+
+    Only the last component of `file_name` is used, so a name such as `../../x` is
+    written as `directory/x`.
+
+    Args:
+        file (File): The file.
+        directory (str | os.PathLike[str]): The download directory.
+
+    Raises:
+        DownloadError: The file name is empty, `.` or `..`, or resolves outside of the directory.
+
+    Returns:
+        str: The path of the file.
+    """
+    name = os.path.basename(file.file_name.replace("\\", "/"))
+    if name in ("", ".", ".."):
+        raise DownloadError("{!r} is not a valid file name".format(file.file_name))
+    root = os.path.realpath(directory)
+    path = os.path.join(os.fspath(directory), name)
+    if os.path.commonpath([root, os.path.realpath(path)]) != root:
+        raise DownloadError("{!r} resolves outside of {}".format(file.file_name, root))
+    return path
+
+
+def new_session(max_workers: int = 8) -> requests.Session:
+    """Create a session whose connection pool fits the number of download workers.
+
+    Args:
+        max_workers (int, optional): The number of concurrent downloads. Defaults to 8.
+
+    Returns:
+        requests.Session: The session.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=max_workers, pool_maxsize=max_workers)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+def download_file(
+    file: File,
+    directory: str | os.PathLike[str],
+    session: requests.Session | None = None,
+    chunk_size: int = _CHUNK_SIZE,
+) -> str:
+    """Download a file, verifying its length and hashes while it is written.
+
+    A complete file already present in `directory` is verified and kept. A partial
+    `.part` file left by an interrupted download is resumed with a `Range` request. The
+    file is written to `target_path(file, directory)`.
+
+    Args:
+        file (File): The file to download, its `download_url` must be set.
+        directory (str | os.PathLike[str]): The directory to download the file to.
+        session (requests.Session | None, optional): The session used for the request. Defaults to a new session.
+        chunk_size (int, optional): The number of bytes written at once. Defaults to 64 KiB.
+
+    Raises:
+        DownloadError: The file has no download url, an invalid name, or does not match its length or hashes.
+
+    Returns:
+        str: The path of the downloaded file.
+    """
+    if file.download_url is None:
+        raise DownloadError("{} has no download url".format(file.file_name))
+
+    path = target_path(file, directory)
+    part_path = path + ".part"
+
+    if os.path.exists(path) and os.path.getsize(path) == file.file_length:
+        hashers = _new_hashers(file)
+        _hash_existing(path, hashers)
+        try:
+            _verify(file, path, hashers)
+            return path
+        except DownloadError:
+            os.remove(path)
+
+    hashers = _new_hashers(file)
+    offset = os.path.getsize(part_path) if os.path.exists(part_path) else 0
+    if offset > file.file_length:
+        os.remove(part_path)
+        offset = 0
+
+    if offset < file.file_length or not os.path.exists(part_path):
+        session = session or requests.Session()
+        headers = {"Accept-Encoding": "identity"}
+        if offset:
+            headers["Range"] = "bytes={}-".format(offset)
+        with session.get(file.download_url, headers=headers, stream=True) as response:
+            response.raise_for_status()
+            encoded = response.headers.get("Content-Encoding", "identity").lower() != "identity"
+            if offset and response.status_code == 206:
+                if encoded:
+                    # The range is of the encoded body, it does not continue the file on disk.
+                    os.remove(part_path)
+                    raise DownloadError(
+                        "{} was resumed with an encoded body".format(file.file_name)
+                    )
+                _hash_existing(part_path, hashers)
+                mode = "ab"
+            else:
+                offset, mode = 0, "wb"
+
+            # The length of an encoded body is checked once decoded, by _verify.
+            content_length = response.headers.get("Content-Length")
+            if (
+                content_length is not None
+                and not encoded
+                and int(content_length) != file.file_length - offset
+            ):
+                raise DownloadError(
+                    "{} is served with {} bytes, expected {}".format(
+                        file.file_name, content_length, file.file_length - offset
+                    )
+                )
+
+            with open(part_path, mode) as f:
+                for chunk in response.iter_content(chunk_size):
+                    f.write(chunk)
+                    for hasher in hashers.values():
+                        hasher.update(chunk)
+    else:
+        _hash_existing(part_path, hashers)
+
+    try:
+        _verify(file, part_path, hashers)
+    except DownloadError:
+        os.remove(part_path)
+        raise
+    os.replace(part_path, path)
+    return path
+
+
+def download_files(
+    files: Iterable[File],
+    directory: str | os.PathLike[str],
+    max_workers: int = 8,
+    session: requests.Session | None = None,
+    chunk_size: int = _CHUNK_SIZE,
+) -> DownloadResults:
+    """Download many files concurrently.
+
+    The total `file_length` is checked against the free disk space before anything is
+    downloaded. A failing file does not stop the others, its error is reported in
+    `DownloadResults.errors`. So is a file whose name clashes with the name of a previous
+    file, since both would be written to the same path.
+
+    Args:
+        files (Iterable[File]): The files to download.
+        directory (str | os.PathLike[str]): The directory to download the files to.
+        max_workers (int, optional): The maximum number of concurrent downloads. Defaults to 8.
+        session (requests.Session | None, optional): The session used for the requests. Defaults to a session pooling `max_workers` connections.
+        chunk_size (int, optional): The number of bytes written at once. Defaults to 64 KiB.
+
+    Raises:
+        DownloadError: There is not enough free disk space for the files.
+
+    Returns:
+        DownloadResults: The downloaded paths and the errors by file id.
+    """
+    files = list({file.id: file for file in files}.values())
+    os.makedirs(directory, exist_ok=True)
+
+    required = sum(file.file_length for file in files)
+    free = shutil.disk_usage(directory).free
+    if required > free:
+        raise DownloadError(
+            "{} bytes are required but only {} are available".format(required, free)
+        )
+
+    session = session or new_session(max_workers)
+    results = DownloadResults()
+
+    owners: dict[str, File] = {}
+    for file in files:
+        try:
+            path = os.path.normcase(target_path(file, directory))
+        except DownloadError as e:
+            results.errors[file.id] = e
+            continue
+        owner = owners.setdefault(path, file)
+        if owner is not file:
+            results.errors[file.id] = DownloadError(
+                "{} has the same file name as file {}".format(file.file_name, owner.id)
+            )
+
+    def download(file: File) -> None:
+        try:
+            results.paths[file.id] = download_file(file, directory, session, chunk_size)
+        except (DownloadError, OSError) as e:
+            results.errors[file.id] = e
+
+    with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+        list(executor.map(download, owners.values()))
+    return results
@@ -0,0 +1,336 @@
+"""Local computation of CurseForge file fingerprints.
+
+A fingerprint is the 32 bit MurmurHash2 (seed 1) of the file contents with every
+whitespace byte (tab, line feed, carriage return and space) removed. The values can be
+passed straight to `API_v1.get_fingerprints_matches` and
+`API_v1.get_fingerprints_matches_by_game_id`, and grouped per addon folder with
+`build_folder_fingerprints` for the fuzzy matching endpoints.
+"""
+
+import mmap
+import os
+import sys
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from typing import TYPE_CHECKING, BinaryIO, Iterable, Iterator
+
+from cursedforged.types import FolderFingerprint
+
+if TYPE_CHECKING:
+    from cursedforged.fingerprint_index import FingerprintIndex
+
+SEED = 1
+WHITESPACE = b"\t\n\r "
+
+_M = 0x5BD1E995
+_MASK = 0xFFFFFFFF
+_CHUNK_SIZE = 1 << 20
+_MMAP_THRESHOLD = 1 << 22
+
+
+def normalize(data: bytes) -> bytes:
+    """Remove the whitespace bytes ignored by the fingerprint.
+
+    Args:
+        data (bytes): The raw file contents.
+
+    Returns:
+        bytes: The contents without whitespace.
+    """
+    return data.translate(None, WHITESPACE)
+
+
+@lru_cache(maxsize=8)
+def _lane_mask(count: int) -> int:
+    return int.from_bytes(b"\xff\xff\xff\xff\x00\x00\x00\x00" * count, "little")
+
+
+def _mix_words(h: int, words: bytes) -> int:
+    """Feed a buffer whose length is a multiple of 4 into the hash state.
+
+    The per-word mixing (`k *= m; k ^= k >> 24; k *= m`) does not depend on the hash
+    state, so it is done for every word at once on a single big integer holding one word
+    per 64 bit lane, which keeps the products from overflowing into the next lane. Only
+    the sequential `h = h * m ^ k` step is left to the Python loop.
+
+    Args:
+        h (int): The current hash state.
+        words (bytes): The buffer, read as little endian 32 bit words.
+
+    Returns:
+        int: The updated hash state.
+    """
+    count = len(words) // 4
+    if count == 0:
+        return h
+
+    lanes = bytearray(8 * count)
+    for i in range(4):
+        lanes[i::8] = words[i::4]
+    lane_mask = _lane_mask(count)
+    x = (int.from_bytes(lanes, "little") * _M) & lane_mask
+    x ^= (x >> 24) & lane_mask
+    x = (x * _M) & lane_mask
+
+    values = array("I")
+    values.frombytes(x.to_bytes(8 * count, "little"))
+    if sys.byteorder == "big":
+        values.byteswap()
+
+    m, mask = _M, _MASK
+    for k in values[::2]:
+        h = (h * m ^ k) & mask
+    return h
+
+
+def _finalize(h: int, tail: bytes) -> int:
+    """Mix the trailing bytes and apply the final avalanche.
+
+    Args:
+        h (int): The current hash state.
+        tail (bytes): The last `len % 4` bytes.
+
+    Returns:
+        int: The hash.
+    """
+    if len(tail) == 3:
+        h ^= tail[2] << 16
+    if len(tail) >= 2:
+        h ^= tail[1] << 8
+    if len(tail) >= 1:
+        h ^= tail[0]
+        h = (h * _M) & _MASK
+
+    h ^= h >> 13
+    h = (h * _M) & _MASK
+    h ^= h >> 15
+    return h
+
+
+def murmurhash2(data: bytes, seed: int = SEED) -> int:
+    """Compute the 32 bit MurmurHash2 of a buffer.
+
+    Args:
+        data (bytes): The buffer to hash.
+        seed (int, optional): The hash seed. Defaults to 1.
+
+    Returns:
+        int: The hash.
+    """
+    end = len(data) - len(data) % 4
+    h = (seed ^ len(data)) & _MASK
+    for start in range(0, end, _CHUNK_SIZE):
+        h = _mix_words(h, data[start : min(start + _CHUNK_SIZE, end)])
+    return _finalize(h, data[end:])
+
+
+def fingerprint_bytes(data: bytes) -> int:
+    """Compute the fingerprint of in-memory file contents.
+
+    Args:
+        data (bytes): The raw file contents.
+
+    Returns:
+        int: The fingerprint.
+    """
+    return murmurhash2(normalize(data))
+
+
+def _iter_chunks(f: BinaryIO, chunk_size: int) -> Iterator[bytes]:
+    while chunk := f.read(chunk_size):
+        yield chunk
+
+
+def fingerprint_stream(f: BinaryIO, chunk_size: int = _CHUNK_SIZE) -> int:
+    """Compute the fingerprint of a seekable binary stream with bounded memory.
+
+    The stream is read twice, once to count the bytes that are not whitespace (the hash
+    is seeded with that length) and once to hash them.
+
+    Args:
+        f (BinaryIO): The stream, positioned at the start of the contents.
+        chunk_size (int, optional): The number of bytes read at once. Defaults to 1 MiB.
+
+    Returns:
+        int: The fingerprint.
+    """
+    start = f.tell()
+    length = sum(len(normalize(chunk)) for chunk in _iter_chunks(f, chunk_size))
+    f.seek(start)
+
+    h = (SEED ^ length) & _MASK
+    pending = b""
+    for chunk in _iter_chunks(f, chunk_size):
+        pending += normalize(chunk)
+        end = len(pending) - len(pending) % 4
+        h = _mix_words(h, pending[:end])
+        pending = pending[end:]
+    return _finalize(h, pending)
+
+
+def fingerprint_file(path: str | os.PathLike[str], chunk_size: int = _CHUNK_SIZE) -> int:
+    """Compute the fingerprint of a file.
+
+    Large files are memory-mapped and hashed chunk by chunk, so they are never loaded
+    into memory as a whole.
+
+    Args:
+        path (str | os.PathLike[str]): The file to fingerprint.
+        chunk_size (int, optional): The number of bytes hashed at once. Defaults to 1 MiB.
+
+    Returns:
+        int: The fingerprint.
+    """
+    with open(path, "rb") as f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return murmurhash2(b"")
+        if size < _MMAP_THRESHOLD:
+            return fingerprint_bytes(f.read())
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return fingerprint_stream(mapped, chunk_size)  # type: ignore[arg-type]
+
+
+def fingerprint_files(
+    paths: Iterable[str | os.PathLike[str]], max_workers: int | None = None
+) -> dict[str, int]:
+    """Compute the fingerprints of many files on a process pool.
+
+    Args:
+        paths (Iterable[str | os.PathLike[str]]): The files to fingerprint.
+        max_workers (int | None, optional): The number of worker processes. Defaults to the number of CPUs.
+
+    Returns:
+        dict[str, int]: The fingerprints by path.
+    """
+    names = [os.fspath(path) for path in paths]
+    workers = min(max_workers or os.cpu_count() or 1, len(names))
+    if workers <= 1:
+        return {name: fingerprint_file(name) for name in names}
+
+    chunksize = max(1, len(names) // (workers * 4))
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        fingerprints = executor.map(fingerprint_file, names, chunksize=chunksize)
+        return dict(zip(names, fingerprints))
+
+
+def fingerprint_directory(
+    directory: str | os.PathLike[str],
+    extensions: Iterable[str] | None = (".jar", ".zip"),
+    recursive: bool = False,
+    max_workers: int | None = None,
+) -> dict[str, int]:
+    """Compute the fingerprints of the files of a directory on a process pool.
+
+    Args:
+        directory (str | os.PathLike[str]): The directory to scan, e.g. an instance `mods` folder.
+        extensions (Iterable[str] | None, optional): Only include files with these extensions, None includes every file. Defaults to (".jar", ".zip").
+        recursive (bool, optional): Whether to include the files of subdirectories. Defaults to False.
+        max_workers (int | None, optional): The number of worker processes. Defaults to the number of CPUs.
+
+    Returns:
+        dict[str, int]: The fingerprints by path.
+    """
+    return fingerprint_files(list_files(directory, extensions, recursive), max_workers)
+
+
+def list_files(
+    directory: str | os.PathLike[str],
+    extensions: Iterable[str] | None = (".jar", ".zip"),
+    recursive: bool = False,
+) -> list[str]:
+    """List the files of a directory, sorted by path.
+
+    Args:
+        directory (str | os.PathLike[str]): The directory to scan.
+        extensions (Iterable[str] | None, optional): Only include files with these extensions, None includes every file. Defaults to (".jar", ".zip").
+        recursive (bool, optional): Whether to include the files of subdirectories. Defaults to False.
+
+    Returns:
+        list[str]: The file paths.
+    """
+    suffixes = tuple(ext.lower() for ext in extensions) if extensions is not None else None
+    paths: list[str] = []
+    for root, dirs, names in os.walk(directory):
+        paths.extend(
+            os.path.join(root, name)
+            for name in names
+            if suffixes is None or name.lower().endswith(suffixes)
+        )
+        if not recursive:
+            break
+    return sorted(paths)
+
+
+def build_folder_fingerprints(
+    folders: Iterable[str | os.PathLike[str]],
+    extensions: Iterable[str] | None = None,
+    max_workers: int | None = None,
+    index: "FingerprintIndex | None" = None,
+) -> list[FolderFingerprint]:
+    """Build the fuzzy matching fingerprints of addon folders.
+
+    Each folder is described by its name and the sorted, deduplicated fingerprints of
+    every file below it. The files of all folders are hashed together on a single process
+    pool, so many small folders are processed as efficiently as a few large ones. With an
+    `index`, only the new or changed files are hashed.
+
+    Args:
+        folders (Iterable[str | os.PathLike[str]]): The addon folders, e.g. the subdirectories of `Interface/AddOns`.
+        extensions (Iterable[str] | None, optional): Only include files with these extensions, None includes every file. Defaults to None.
+        max_workers (int | None, optional): The number of worker processes. Defaults to the number of CPUs.
+        index (FingerprintIndex | None, optional): The index remembering the fingerprints of unchanged files. Defaults to None.
+
+    Returns:
+        list[FolderFingerprint]: The folder fingerprints, in the order of `folders`.
+    """
+    files_by_folder = {
+        os.fspath(folder): list_files(folder, extensions, recursive=True) for folder in folders
+    }
+    all_paths = [path for paths in files_by_folder.values() for path in paths]
+    if index is not None:
+        fingerprints = index.fingerprint(all_paths, max_workers)
+    else:
+        fingerprints = fingerprint_files(all_paths, max_workers)
+    return [
+        FolderFingerprint(
+            foldername=os.path.basename(os.path.normpath(folder)),
+            fingerprints=sorted({fingerprints[path] for path in paths}),
+        )
+        for folder, paths in files_by_folder.items()
+    ]
+
+
+def batch_folder_fingerprints(
+    folder_fingerprints: Iterable[FolderFingerprint],
+    max_folders: int = 50,
+    max_fingerprints: int = 10_000,
+) -> list[list[FolderFingerprint]]:
+    """Split folder fingerprints into batches sized for a single fuzzy matching request.
+
+    A batch is closed once it holds `max_folders` folders or adding the next folder would
+    exceed `max_fingerprints` fingerprints. A folder larger than `max_fingerprints` gets a
+    batch of its own.
+
+    Args:
+        folder_fingerprints (Iterable[FolderFingerprint]): The folder fingerprints to split.
+        max_folders (int, optional): The maximum number of folders per batch. Defaults to 50.
+        max_fingerprints (int, optional): The maximum number of file fingerprints per batch. Defaults to 10,000.
+
+    Returns:
+        list[list[FolderFingerprint]]: The batches, in order.
+    """
+    batches: list[list[FolderFingerprint]] = []
+    batch: list[FolderFingerprint] = []
+    count = 0
+    for folder in folder_fingerprints:
+        size = len(folder.fingerprints)
+        if batch and (len(batch) >= max_folders or count + size > max_fingerprints):
+            batches.append(batch)
+            batch, count = [], 0
+        batch.append(folder)
+        count += size
+    if batch:
+        batches.append(batch)
+    return batches
@@ -0,0 +1,249 @@
+import os
+import sqlite3
+import threading
+import time
+from typing import Iterable
+
+from cursedforged.api.v1 import API_v1
+from cursedforged.fingerprint import fingerprint_files, list_files
+from cursedforged.types import FingerprintMatch, FingerprintMatchesResult
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS files (
+    path TEXT PRIMARY KEY,
+    size INTEGER NOT NULL,
+    mtime_ns INTEGER NOT NULL,
+    inode INTEGER NOT NULL,
+    fingerprint INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS matches (
+    game_id INTEGER NOT NULL,
+    fingerprint INTEGER NOT NULL,
+    match TEXT,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (game_id, fingerprint)
+);
+"""
+
+_SQLITE_MAX_VARIABLES = 900
+
+_ANY_GAME = 0
+"""The `game_id` under which the matches of `get_fingerprints_matches` are remembered."""
+
+
+class FingerprintIndex:
+    """A persistent index of file fingerprints and of their CurseForge matches.
+
+    Files are keyed by path and only re-hashed when their size, modification time or
+    inode changed. The exact match found for each fingerprint (or the fact that there is
+    none) is remembered too, per game, so rescanning an unchanged folder costs neither
+    hashing nor a network lookup. Unmatched fingerprints are only remembered for
+    `miss_ttl` seconds, so a file uploaded later ends up being matched.
+
+    Args:
+        path (str | os.PathLike[str]): The database file, or ":memory:".
+        miss_ttl (float, optional): How long a fingerprint without a match is remembered as unmatched, in seconds. Defaults to one hour.
+    """
+
+    def __init__(self, path: str | os.PathLike[str] = ":memory:", miss_ttl: float = 3600):
+        self.path = os.fspath(path)
+        self.miss_ttl = miss_ttl
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def fingerprint(
+        self, paths: Iterable[str | os.PathLike[str]], max_workers: int | None = None
+    ) -> dict[str, int]:
+        """Get the fingerprints of files, only hashing the new or changed ones.
+
+        Args:
+            paths (Iterable[str | os.PathLike[str]]): The files to fingerprint.
+            max_workers (int | None, optional): The number of worker processes used for hashing. Defaults to the number of CPUs.
+
+        Returns:
+            dict[str, int]: The fingerprints by path.
+        """
+        stats = {}
+        for name in paths:
+            path = os.fspath(name)
+            st = os.stat(path)
+            stats[os.path.abspath(path)] = (path, st.st_size, st.st_mtime_ns, st.st_ino)
+
+        keys = list(stats)
+        known: dict[str, tuple[int, int, int, int]] = {}
+        with self._lock:
+            for i in range(0, len(keys), _SQLITE_MAX_VARIABLES):
+                chunk = keys[i : i + _SQLITE_MAX_VARIABLES]
+                known.update(
+                    (key, (size, mtime_ns, inode, fingerprint))
+                    for key, size, mtime_ns, inode, fingerprint in self._connection.execute(
+                        "SELECT path, size, mtime_ns, inode, fingerprint FROM files WHERE path IN ({})".format(
+                            ",".join("?" * len(chunk))
+                        ),
+                        chunk,
+                    )
+                )
+
+        fingerprints: dict[str, int] = {}
+        changed: list[str] = []
+        for key, (path, size, mtime_ns, inode) in stats.items():
+            entry = known.get(key)
+            if entry is not None and entry[:3] == (size, mtime_ns, inode):
+                fingerprints[path] = entry[3]
+            else:
+                changed.append(key)
+
+        if changed:
+            hashed = fingerprint_files(changed, max_workers)
+            with self._lock, self._connection:
+                self._connection.executemany(
+                    "INSERT OR REPLACE INTO files (path, size, mtime_ns, inode, fingerprint) VALUES (?, ?, ?, ?, ?)",
+                    [(key, *stats[key][1:], hashed[key]) for key in changed],
+                )
+            fingerprints.update((stats[key][0], hashed[key]) for key in changed)
+
+        return fingerprints
+
+    def fingerprint_directory(
+        self,
+        directory: str | os.PathLike[str],
+        extensions: Iterable[str] | None = (".jar", ".zip"),
+        recursive: bool = False,
+        max_workers: int | None = None,
+    ) -> dict[str, int]:
+        """Get the fingerprints of the files of a directory, only hashing the new or changed ones.
+
+        Entries of files that were removed from the directory are dropped from the index.
+
+        Args:
+            directory (str | os.PathLike[str]): The directory to scan.
+            extensions (Iterable[str] | None, optional): Only include files with these extensions, None includes every file. Defaults to (".jar", ".zip").
+            recursive (bool, optional): Whether to include the files of subdirectories. Defaults to False.
+            max_workers (int | None, optional): The number of worker processes used for hashing. Defaults to the number of CPUs.
+
+        Returns:
+            dict[str, int]: The fingerprints by path.
+        """
+        paths = list_files(directory, extensions, recursive)
+        fingerprints = self.fingerprint(paths, max_workers)
+
+        root = os.path.join(os.path.abspath(directory), "")
+        present = {os.path.abspath(path) for path in paths}
+        with self._lock, self._connection:
+            stale = [
+                (key,)
+                for (key,) in self._connection.execute(
+                    "SELECT path FROM files WHERE substr(path, 1, ?) = ?", (len(root), root)
+                )
+                if key not in present
+                and (recursive or os.path.dirname(key) == root.rstrip(os.sep))
+            ]
+            self._connection.executemany("DELETE FROM files WHERE path = ?", stale)
+        return fingerprints
+
+    def lookup_matches(
+        self,
+        fingerprints: Iterable[int],
+        max_age: float | None = None,
+        game_id: int | None = None,
+    ) -> dict[int, FingerprintMatch | None]:
+        """Get the remembered matches of fingerprints.
+
+        Args:
+            fingerprints (Iterable[int]): The fingerprints to look up.
+            max_age (float | None, optional): Ignore matches remembered more than this many seconds ago. Defaults to None.
+            game_id (int | None, optional): Look up the matches found for this game, None for the matches found across games. Defaults to None.
+
+        Returns:
+            dict[int, FingerprintMatch | None]: The known fingerprints mapped to their exact match, or None when they are known to be unmatched.
+        """
+        wanted = list(dict.fromkeys(fingerprints))
+        now = time.time()
+        oldest = now - max_age if max_age is not None else float("-inf")
+        oldest_miss = max(oldest, now - self.miss_ttl)
+        rows: list[tuple[int, str | None]] = []
+        with self._lock:
+            for i in range(0, len(wanted), _SQLITE_MAX_VARIABLES):
+                chunk = wanted[i : i + _SQLITE_MAX_VARIABLES]
+                rows.extend(
+                    self._connection.execute(
+                        "SELECT fingerprint, match FROM matches WHERE game_id = ? AND stored_at >= ?"
+                        " AND (match IS NOT NULL OR stored_at >= ?) AND fingerprint IN ({})".format(
+                            ",".join("?" * len(chunk))
+                        ),
+                        [_game_key(game_id), oldest, oldest_miss, *chunk],
+                    )
+                )
+        return {
+            fingerprint: FingerprintMatch.model_validate_json(match) if match else None
+            for fingerprint, match in rows
+        }
+
+    def record_matches(
+        self,
+        result: FingerprintMatchesResult,
+        requested: Iterable[int] = (),
+        game_id: int | None = None,
+    ) -> None:
+        """Remember the exact matches and the unmatched fingerprints of a match result.
+
+        Args:
+            result (FingerprintMatchesResult): The `data` of a `get_fingerprints_matches*` response.
+            requested (Iterable[int], optional): The fingerprints sent with the request, those without an exact match are remembered as unmatched. Defaults to ().
+            game_id (int | None, optional): The game the request was restricted to, None for `get_fingerprints_matches`. Defaults to None.
+        """
+        now = time.time()
+        found: dict[int, str | None] = dict.fromkeys(requested)
+        found.update(dict.fromkeys(result.unmatched_fingerprints))
+        found.update(
+            (match.file.file_fingerprint, match.model_dump_json(by_alias=True))
+            for match in result.exact_matches
+        )
+        game_key = _game_key(game_id)
+        rows = [(game_key, fingerprint, match, now) for fingerprint, match in found.items()]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO matches (game_id, fingerprint, match, stored_at) VALUES (?, ?, ?, ?)",
+                rows,
+            )
+
+    def match(
+        self,
+        api: API_v1,
+        fingerprints: Iterable[int],
+        game_id: int | None = None,
+        max_age: float | None = None,
+    ) -> dict[int, FingerprintMatch | None]:
+        """Get the exact matches of fingerprints, only querying the API for unknown ones.
+
+        Args:
+            api (API_v1): The API used for the fingerprints that are not known yet, e.g. `client.v1`.
+            fingerprints (Iterable[int]): The fingerprints to match.
+            game_id (int | None, optional): Match against the files of this game only. Defaults to None.
+            max_age (float | None, optional): Query again the matches remembered more than this many seconds ago. Defaults to None.
+
+        Returns:
+            dict[int, FingerprintMatch | None]: The fingerprints mapped to their exact match, or None when there is none.
+        """
+        wanted = list(dict.fromkeys(fingerprints))
+        matches = self.lookup_matches(wanted, max_age, game_id)
+        missing = [fingerprint for fingerprint in wanted if fingerprint not in matches]
+        if missing:
+            if game_id is not None:
+                response = api.get_fingerprints_matches_by_game_id(game_id, missing)
+            else:
+                response = api.get_fingerprints_matches(missing)
+            self.record_matches(response.data, missing, game_id)
+            matches.update(self.lookup_matches(missing, game_id=game_id))
+        return {fingerprint: matches.get(fingerprint) for fingerprint in wanted}
+
+
+def _game_key(game_id: int | None) -> int:
+    return _ANY_GAME if game_id is None else game_id
@@ -0,0 +1,282 @@
+"""A persistent catalog of the Minecraft versions and mod loaders.
+
+The version and mod loader lists are fetched once and indexed by game version and
+`ModLoaderType`, and the details of the mod loaders are fetched on demand, many at once
+when asked together. Everything is kept in SQLite for `ttl` seconds, so a launcher only
+talks to the API when its catalog expired.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Iterable
+
+from pydantic import BaseModel
+
+from cursedforged.api.v1 import API_v1
+from cursedforged.types import (
+    ApiResponseOfListOfMinecraftGameVersion,
+    ApiResponseOfListOfMinecraftModLoaderIndex,
+    MinecraftGameVersion,
+    MinecraftModLoaderIndex,
+    MinecraftModLoaderVersion,
+    ModLoaderType,
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS entries (
+    kind TEXT NOT NULL,
+    name TEXT NOT NULL,
+    data TEXT NOT NULL,
+    stored_at REAL NOT NULL,
+    PRIMARY KEY (kind, name)
+);
+"""
+
+
+class MinecraftCatalog:
+    """The Minecraft versions and mod loaders, indexed and persisted with a time to live.
+
+    The lists of `get_minecraft_versions` and `get_minecraft_modloaders(include_all=True)`
+    are loaded on first use, from the database when they are younger than `ttl` and from
+    the API otherwise. The details of a mod loader, `get_minecraft_modloader`, are only
+    fetched when asked for. Their large `version_json` and `additional_files_json`
+    strings are only parsed when `version_data` or `additional_files` is accessed.
+
+    Args:
+        api (API_v1): The API used to fetch the catalog, e.g. `client.v1`.
+        path (str | os.PathLike[str], optional): The database file, or ":memory:". Defaults to ":memory:".
+        ttl (float, optional): How long the fetched data is used before being fetched again, in seconds. Defaults to one day.
+        max_concurrency (int, optional): The maximum number of mod loader details fetched at once. Defaults to 8.
+    """
+
+    def __init__(
+        self,
+        api: API_v1,
+        path: str | os.PathLike[str] = ":memory:",
+        ttl: float = 24 * 3600,
+        max_concurrency: int = 8,
+    ):
+        self.api = api
+        self.path = os.fspath(path)
+        self.ttl = ttl
+        self.max_concurrency = max_concurrency
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(self.path, check_same_thread=False)
+        self._connection.execute("PRAGMA journal_mode=WAL")
+        self._connection.executescript(_SCHEMA)
+
+        self._loaded_at: float | None = None
+        self._versions: dict[str, MinecraftGameVersion] = {}
+        self._modloaders: dict[str, MinecraftModLoaderIndex] = {}
+        self._by_version: dict[tuple[str, ModLoaderType], list[MinecraftModLoaderIndex]] = {}
+        self._details: dict[str, tuple[float, MinecraftModLoaderVersion]] = {}
+
+    def close(self) -> None:
+        """Close the underlying database connection."""
+        with self._lock:
+            self._connection.close()
+
+    def _read(self, kind: str, names: Iterable[str]) -> dict[str, tuple[float, str]]:
+        """Read the unexpired entries of a kind, must be called with the lock held."""
+        oldest = time.time() - self.ttl
+        return {
+            name: (stored_at, data)
+            for name in names
+            for data, stored_at in self._connection.execute(
+                "SELECT data, stored_at FROM entries WHERE kind = ? AND name = ? AND stored_at >= ?",
+                (kind, name, oldest),
+            )
+        }
+
+    def _write(self, kind: str, entries: dict[str, BaseModel], stored_at: float) -> None:
+        """Write entries of a kind, must be called with the lock held."""
+        with self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO entries (kind, name, data, stored_at) VALUES (?, ?, ?, ?)",
+                [
+                    (kind, name, entry.model_dump_json(by_alias=True), stored_at)
+                    for name, entry in entries.items()
+                ],
+            )
+
+    def refresh(self, force: bool = False) -> None:
+        """Load the version and mod loader lists, unless they are loaded and unexpired.
+
+        The lists are fetched without holding the lock, so readers keep using the current
+        lists meanwhile; concurrent refreshes may then fetch them more than once.
+
+        Args:
+            force (bool, optional): Whether to fetch the lists from the API even if they did not expire. Defaults to False.
+        """
+        with self._lock:
+            if (
+                not force
+                and self._loaded_at is not None
+                and self._loaded_at >= time.time() - self.ttl
+            ):
+                return
+            stored = {} if force else self._read("list", ["versions", "modloaders"])
+
+        fetched = len(stored) != 2
+        if fetched:
+            loaded_at = time.time()
+            versions = self.api.get_minecraft_versions()
+            modloaders = self.api.get_minecraft_modloaders(include_all=True)
+        else:
+            loaded_at = min(stored_at for stored_at, _ in stored.values())
+            versions = ApiResponseOfListOfMinecraftGameVersion.model_validate_json(
+                stored["versions"][1]
+            )
+            modloaders = ApiResponseOfListOfMinecraftModLoaderIndex.model_validate_json(
+                stored["modloaders"][1]
+            )
+
+        by_version: dict[tuple[str, ModLoaderType], list[MinecraftModLoaderIndex]] = {}
+        for modloader in modloaders.data:
+            by_version.setdefault((modloader.game_version, modloader.type), []).append(modloader)
+
+        with self._lock:
+            if self._loaded_at is not None and self._loaded_at > loaded_at:
+                # A concurrent refresh loaded newer lists.
+                return
+            if fetched:
+                self._write("list", {"versions": versions, "modloaders": modloaders}, loaded_at)
+            self._versions = {version.version_string: version for version in versions.data}
+            self._modloaders = {modloader.name: modloader for modloader in modloaders.data}
+            self._by_version = by_version
+            self._loaded_at = loaded_at
+
+    def versions(self) -> list[MinecraftGameVersion]:
+        """List the Minecraft versions.
+
+        Returns:
+            list[MinecraftGameVersion]: The versions, in the order of the API.
+        """
+        self.refresh()
+        return list(self._versions.values())
+
+    def version(self, version_string: str) -> MinecraftGameVersion | None:
+        """Get a Minecraft version.
+
+        Args:
+            version_string (str): The version, e.g. "1.20.1".
+
+        Returns:
+            MinecraftGameVersion | None: The version, or None if it is not known.
+        """
+        self.refresh()
+        return self._versions.get(version_string)
+
+    def modloaders(
+        self, game_version: str | None = None, mod_loader_type: ModLoaderType | None = None
+    ) -> list[MinecraftModLoaderIndex]:
+        """List the mod loaders, optionally of a game version and of a type.
+
+        Args:
+            game_version (str | None, optional): Only list the mod loaders of this game version. Defaults to None.
+            mod_loader_type (ModLoaderType | None, optional): Only list the mod loaders of this type. Defaults to None.
+
+        Returns:
+            list[MinecraftModLoaderIndex]: The mod loaders, in the order of the API.
+        """
+        self.refresh()
+        if game_version is not None and mod_loader_type is not None:
+            return list(self._by_version.get((game_version, mod_loader_type), ()))
+        return [
+            modloader
+            for modloader in self._modloaders.values()
+            if (game_version is None or modloader.game_version == game_version)
+            and (mod_loader_type is None or modloader.type == mod_loader_type)
+        ]
+
+    def recommended(
+        self, game_version: str, mod_loader_type: ModLoaderType
+    ) -> MinecraftModLoaderIndex | None:
+        """Get the recommended mod loader of a type for a game version.
+
+        Args:
+            game_version (str): The game version, e.g. "1.20.1".
+            mod_loader_type (ModLoaderType): The mod loader type.
+
+        Returns:
+            MinecraftModLoaderIndex | None: The recommended mod loader, falling back to the latest one, or None if there is none.
+        """
+        candidates = self.modloaders(game_version, mod_loader_type)
+        return next(
+            (modloader for modloader in candidates if modloader.recommended),
+            self.latest(game_version, mod_loader_type),
+        )
+
+    def latest(
+        self, game_version: str, mod_loader_type: ModLoaderType
+    ) -> MinecraftModLoaderIndex | None:
+        """Get the latest mod loader of a type for a game version.
+
+        Args:
+            game_version (str): The game version, e.g. "1.20.1".
+            mod_loader_type (ModLoaderType): The mod loader type.
+
+        Returns:
+            MinecraftModLoaderIndex | None: The latest mod loader, or None if there is none.
+        """
+        candidates = self.modloaders(game_version, mod_loader_type)
+        return next(
+            (modloader for modloader in candidates if modloader.latest),
+            max(candidates, key=lambda modloader: modloader.date_modified, default=None),
+        )
+
+    def modloader_details(self, names: Iterable[str]) -> dict[str, MinecraftModLoaderVersion]:
+        """Get the details of mod loaders, fetching the unknown or expired ones concurrently.
+
+        Args:
+            names (Iterable[str]): The mod loader names, e.g. "forge-47.2.0".
+
+        Returns:
+            dict[str, MinecraftModLoaderVersion]: The details by name.
+        """
+        wanted = list(dict.fromkeys(names))
+        oldest = time.time() - self.ttl
+        found: dict[str, MinecraftModLoaderVersion] = {}
+        with self._lock:
+            for name in wanted:
+                remembered = self._details.get(name)
+                if remembered is not None and remembered[0] >= oldest:
+                    found[name] = remembered[1]
+            for name, (stored_at, data) in self._read(
+                "modloader", [name for name in wanted if name not in found]
+            ).items():
+                found[name] = MinecraftModLoaderVersion.model_validate_json(data)
+                self._details[name] = (stored_at, found[name])
+
+        missing = [name for name in wanted if name not in found]
+        if missing:
+            with ThreadPoolExecutor(max_workers=max(1, self.max_concurrency)) as executor:
+                fetched = dict(
+                    zip(
+                        missing,
+                        executor.map(
+                            lambda name: self.api.get_minecraft_modloader(name).data, missing
+                        ),
+                        strict=True,
+                    )
+                )
+            now = time.time()
+            with self._lock:
+                self._write("modloader", dict(fetched), now)
+                self._details.update((name, (now, details)) for name, details in fetched.items())
+            found.update(fetched)
+        return {name: found[name] for name in wanted}
+
+    def modloader_detail(self, name: str) -> MinecraftModLoaderVersion:
+        """Get the details of a mod loader.
+
+        Args:
+            name (str): The mod loader name, e.g. "forge-47.2.0".
+
+        Returns:
+            MinecraftModLoaderVersion: The details.
+        """
+        return self.modloader_details([name])[name]
@@ -0,0 +1,372 @@
+"""In-memory search over a mirrored set of mods.
+
+`ModSearchIndex` answers `search_mods` queries locally: every filter of the endpoint is a
+posting set looked up in a dict, free text is matched against an inverted index of the
+name, summary and author tokens, and the sort orders are computed once per sort field.
+A query is a handful of set intersections, so it answers in milliseconds and is not
+limited to the 10,000 results window of the API.
+"""
+
+import re
+import threading
+from bisect import bisect_left
+from collections import Counter
+from typing import Any, Callable, Iterable
+
+from cursedforged.types import (
+    Mod,
+    ModLoaderType,
+    ModsSearchSortField,
+    Pagination,
+    SearchModsResponse,
+    SortOrder,
+    project_response,
+)
+
+_TOKEN = re.compile(r"\w+")
+
+_ASCENDING_BY_DEFAULT = {
+    ModsSearchSortField.NAME,
+    ModsSearchSortField.AUTHOR,
+    ModsSearchSortField.CATEGORY,
+}
+
+
+def tokenize(text: str) -> list[str]:
+    """Split text into the lowercase word tokens used by the search index.
+
+    Args:
+        text (str): The text to split.
+
+    Returns:
+        list[str]: The tokens, in order.
+    """
+    return _TOKEN.findall(text.casefold())
+
+
+def _version_key(version: str) -> tuple[tuple[int, Any], ...]:
+    """Order version strings numerically, e.g. 1.20.10 after 1.20.9."""
+    return tuple(
+        (0, int(part)) if part.isdigit() else (1, part)
+        for part in re.findall(r"\d+|[^\d.\-\s]+", version.casefold())
+    )
+
+
+def _primary_category(mod: Mod) -> str:
+    for category in mod.categories:
+        if category.id == mod.primary_category_id:
+            return category.name.casefold()
+    return ""
+
+
+_SORT_KEYS: dict[ModsSearchSortField, Callable[[Mod], Any]] = {
+    ModsSearchSortField.FEATURED: lambda mod: (mod.is_featured, -mod.game_popularity_rank),
+    ModsSearchSortField.POPULARITY: lambda mod: -mod.game_popularity_rank,
+    ModsSearchSortField.LAST_UPDATED: lambda mod: mod.date_modified,
+    ModsSearchSortField.NAME: lambda mod: mod.name.casefold(),
+    ModsSearchSortField.AUTHOR: lambda mod: mod.authors[0].name.casefold() if mod.authors else "",
+    ModsSearchSortField.TOTAL_DOWNLOADS: lambda mod: mod.download_count,
+    ModsSearchSortField.CATEGORY: _primary_category,
+    ModsSearchSortField.GAME_VERSION: lambda mod: max(
+        (_version_key(index.game_version) for index in mod.latest_files_indexes), default=()
+    ),
+    ModsSearchSortField.EARLY_ACCESS: lambda mod: (
+        bool(mod.latest_early_access_files_indexes),
+        mod.date_modified,
+    ),
+    ModsSearchSortField.FEATURED_RELEASED: lambda mod: (mod.is_featured, mod.date_released),
+    ModsSearchSortField.RELEASED_DATE: lambda mod: mod.date_released,
+    ModsSearchSortField.RATING: lambda mod: mod.rating if mod.rating is not None else float("-inf"),
+}
+"""The ascending sort key of every sort field, popularity being the inverse of the rank."""
+
+
+class ModSearchIndex:
+    """An in-memory search index over mods, queried like the `search_mods` endpoint.
+
+    Mods are indexed under their game, class, categories, authors and slug, under the game
+    versions, game version types and mod loaders of their `latest_files_indexes`, and
+    under the tokens of their name, summary and author names. Adding a mod that is
+    already indexed replaces it. The index is safe to share between threads.
+
+    Free text filters match the mods having, for every token of the filter, a name,
+    summary or author token starting with it, so partial words match while typing.
+
+    Args:
+        mods (Iterable[Mod], optional): The mods to index. Defaults to ().
+    """
+
+    def __init__(self, mods: Iterable[Mod] = ()):
+        self._lock = threading.Lock()
+        self._mods: dict[int, Mod] = {}
+        self._postings: dict[tuple[Any, ...], set[int]] = {}
+        self._keys: dict[int, list[tuple[Any, ...]]] = {}
+        self._vocabulary: list[str] | None = None
+        self._orders: dict[ModsSearchSortField, tuple[list[int], dict[int, int]]] = {}
+        self.add(mods)
+
+    def __len__(self) -> int:
+        return len(self._mods)
+
+    def __contains__(self, mod_id: object) -> bool:
+        return mod_id in self._mods
+
+    def get(self, mod_id: int) -> Mod | None:
+        """Get an indexed mod.
+
+        Args:
+            mod_id (int): The mod id.
+
+        Returns:
+            Mod | None: The mod, or None if it is not indexed.
+        """
+        return self._mods.get(mod_id)
+
+    @staticmethod
+    def _index_keys(mod: Mod) -> list[tuple[Any, ...]]:
+        """List the posting keys of a mod."""
+        keys: list[tuple[Any, ...]] = [
+            ("game", mod.game_id),
+            ("class", mod.class_id),
+            ("slug", mod.slug),
+        ]
+        keys.extend(("category", category.id) for category in mod.categories)
+        keys.extend(("author", author.id) for author in mod.authors)
+        if mod.authors:
+            keys.append(("primary_author", mod.authors[0].id))
+        for index in mod.latest_files_indexes:
+            version = index.game_version.casefold()
+            keys.append(("version", version))
+            if index.game_version_type_id is not None:
+                keys.append(("version_type", index.game_version_type_id))
+            if index.mod_loader is not None:
+                keys.append(("loader", index.mod_loader))
+                keys.append(("version_loader", version, index.mod_loader))
+        name_tokens = tokenize(mod.name)
+        keys.extend(("name", token) for token in name_tokens)
+        keys.extend(("text", token) for token in name_tokens)
+        keys.extend(("text", token) for token in tokenize(mod.summary))
+        for author in mod.authors:
+            keys.extend(("text", token) for token in tokenize(author.name))
+        return list(dict.fromkeys(keys))
+
+    def _unindex(self, mod_id: int) -> None:
+        for key in self._keys.pop(mod_id, ()):
+            posting = self._postings[key]
+            posting.discard(mod_id)
+            if not posting:
+                del self._postings[key]
+                if key[0] == "text":
+                    self._vocabulary = None
+        self._mods.pop(mod_id, None)
+
+    def add(self, mods: Iterable[Mod]) -> None:
+        """Index mods, replacing the indexed mods with the same ids.
+
+        Args:
+            mods (Iterable[Mod]): The mods to index, e.g. the `data` of `search_mods_all` or `get_mods`.
+        """
+        with self._lock:
+            for mod in mods:
+                self._unindex(mod.id)
+                keys = self._index_keys(mod)
+                for key in keys:
+                    posting = self._postings.get(key)
+                    if posting is None:
+                        posting = self._postings[key] = set()
+                        if key[0] == "text":
+                            self._vocabulary = None
+                    posting.add(mod.id)
+                self._mods[mod.id] = mod
+                self._keys[mod.id] = keys
+            self._orders.clear()
+
+    def remove(self, mod_ids: Iterable[int]) -> None:
+        """Remove mods from the index, unknown ids are ignored.
+
+        Args:
+            mod_ids (Iterable[int]): The ids of the mods to remove.
+        """
+        with self._lock:
+            for mod_id in mod_ids:
+                self._unindex(mod_id)
+            self._orders.clear()
+
+    def _posting(self, key: tuple[Any, ...]) -> set[int]:
+        return self._postings.get(key, set())
+
+    def _union(self, keys: Iterable[tuple[Any, ...]]) -> set[int]:
+        result: set[int] = set()
+        for key in keys:
+            result |= self._posting(key)
+        return result
+
+    def _prefixed(self, field: str, prefix: str) -> set[int]:
+        """Get the mods having a `field` token starting with `prefix`."""
+        if self._vocabulary is None:
+            self._vocabulary = sorted(key[1] for key in self._postings if key[0] == "text")
+        vocabulary = self._vocabulary
+        result: set[int] = set()
+        for i in range(bisect_left(vocabulary, prefix), len(vocabulary)):
+            token = vocabulary[i]
+            if not token.startswith(prefix):
+                break
+            result |= self._posting((field, token))
+        return result
+
+    def _ordering(self, sort_field: ModsSearchSortField) -> tuple[list[int], dict[int, int]]:
+        """Get the mod ids in ascending order of a sort field, ties broken by id, and their ranks."""
+        ordering = self._orders.get(sort_field)
+        if ordering is None:
+            key = _SORT_KEYS[sort_field]
+            order = [
+                mod.id for mod in sorted(self._mods.values(), key=lambda mod: (key(mod), mod.id))
+            ]
+            ordering = self._orders[sort_field] = (
+                order,
+                {mod_id: rank for rank, mod_id in enumerate(order)},
+            )
+        return ordering
+
+    def _sorted(
+        self, matches: set[int], sort_field: ModsSearchSortField, descending: bool
+    ) -> list[int]:
+        order, ranks = self._ordering(sort_field)
+        if len(matches) * 8 < len(order):
+            return sorted(matches, key=ranks.__getitem__, reverse=descending)
+        # Walking the precomputed order beats sorting once most of the mods match.
+        ordered = [mod_id for mod_id in order if mod_id in matches]
+        if descending:
+            ordered.reverse()
+        return ordered
+
+    def search_mods(
+        self,
+        game_id: int,
+        class_id: int | None = None,
+        category_id: int | None = None,
+        category_ids: list[int] | None = None,
+        game_version: str | None = None,
+        game_versions: list[str] | None = None,
+        search_filter: str | None = None,
+        sort_field: ModsSearchSortField | None = None,
+        sort_order: SortOrder | None = None,
+        mod_loader_type: ModLoaderType | None = None,
+        mod_loader_types: list[ModLoaderType] | None = None,
+        game_version_type_id: int | None = None,
+        author_id: int | None = None,
+        primary_author_id: int | None = None,
+        slug: str | None = None,
+        index: int | None = 0,
+        page_size: int | None = 50,
+        fields: list[str] | None = None,
+    ) -> SearchModsResponse:
+        """Get the indexed mods that match the search criteria, see `API_v1.search_mods`.
+
+        Game versions are only matched against the `latest_files_indexes` of the mods, and
+        a mod loader given along with game versions must be the loader of a file of one of
+        these versions. The primary author is the first listed author.
+
+        Without a sort field, mods matching a free text filter are ordered by the number of
+        filter tokens found in their name, then by popularity, and other results by
+        popularity. The default sort order is ascending for the name, author and category
+        fields and descending for the others.
+
+        Args:
+            game_id (int): A game unique id
+            class_id (int | None, optional): Filter by section id (discoverable via Categories)
+            category_id (int | None, optional): Filter by category id
+            category_ids (list[int] | None, optional): Filter by a list of category ids - this will override categoryId
+            game_version (str | None, optional): Filter by game version string
+            game_versions (list[str] | None, optional): Filter by a list of game version strings - this will override
+            search_filter (str | None, optional): Filter by free text search in the mod name, summary and author
+            sort_field (ModsSearchSortField | None, optional): Filter by ModsSearchSortField enumeration
+            sort_order (SortOrder | None, optional): 'asc' if sort is in ascending order, 'desc' if sort is in descending order
+            mod_loader_type (ModLoaderType | None, optional): Filter only mods associated to a given modloader (Forge, Fabric ...).
+            mod_loader_types (list[ModLoaderType] | None, optional): Filter by a list of mod loader types - this will override modLoaderType
+            game_version_type_id (int | None, optional): Filter only mods that contain files tagged with versions of the given gameVersionTypeId
+            author_id (int | None, optional): Filter only mods that the given authorId is a member of.
+            primary_author_id (int | None, optional): Filter only mods that the given primaryAuthorId is the owner of.
+            slug (str | None, optional): Filter by slug (coupled with classId will result in a unique result).
+            index (int | None, optional): A zero based index of the first item to include in the response, without the 10,000 limit of the API.
+            page_size (int | None, optional): The number of items to include in the response, None includes every result. Defaults to 50.
+            fields (list[str] | None, optional): Only return these `Mod` fields, the others are None, see `project`. Defaults to None.
+
+        Returns:
+            SearchModsResponse: A response object
+        """
+        if category_ids is None and category_id is not None:
+            category_ids = [category_id]
+        if game_versions is None and game_version is not None:
+            game_versions = [game_version]
+        if mod_loader_types is None and mod_loader_type is not None:
+            mod_loader_types = [mod_loader_type]
+        tokens = tokenize(search_filter) if search_filter else []
+
+        with self._lock:
+            filters = [self._posting(("game", game_id))]
+            if class_id is not None:
+                filters.append(self._posting(("class", class_id)))
+            if category_ids:
+                filters.append(self._union(("category", id) for id in category_ids))
+            versions = [version.casefold() for version in game_versions or ()]
+            if versions and mod_loader_types:
+                filters.append(
+                    self._union(
+                        ("version_loader", version, loader)
+                        for version in versions
+                        for loader in mod_loader_types
+                    )
+                )
+            elif versions:
+                filters.append(self._union(("version", version) for version in versions))
+            elif mod_loader_types:
+                filters.append(self._union(("loader", loader) for loader in mod_loader_types))
+            if game_version_type_id is not None:
+                filters.append(self._posting(("version_type", game_version_type_id)))
+            if author_id is not None:
+                filters.append(self._posting(("author", author_id)))
+            if primary_author_id is not None:
+                filters.append(self._posting(("primary_author", primary_author_id)))
+            if slug is not None:
+                filters.append(self._posting(("slug", slug)))
+            filters.extend(self._prefixed("text", token) for token in tokens)
+
+            filters.sort(key=len)
+            matches = set(filters[0]).intersection(*filters[1:])
+
+            if sort_field is not None:
+                if sort_order is None:
+                    descending = sort_field not in _ASCENDING_BY_DEFAULT
+                else:
+                    descending = sort_order == SortOrder.DESC
+                ordered = self._sorted(matches, sort_field, descending)
+            elif tokens:
+                _, ranks = self._ordering(ModsSearchSortField.POPULARITY)
+                in_name: Counter[int] = Counter()
+                for token in tokens:
+                    in_name.update(self._prefixed("name", token) & matches)
+                ordered = sorted(
+                    matches, key=lambda mod_id: (in_name[mod_id], ranks[mod_id]), reverse=True
+                )
+            else:
+                ordered = self._sorted(matches, ModsSearchSortField.POPULARITY, True)
+
+            start = index or 0
+            end = None if page_size is None else start + page_size
+            data = [self._mods[mod_id] for mod_id in ordered[start:end]]
+
+        pagination = Pagination(
+            index=start,
+            pageSize=len(data) if page_size is None else page_size,
+            resultCount=len(data),
+            totalCount=len(ordered),
+        )
+        if fields is not None:
+            return project_response(SearchModsResponse, Mod, fields).model_validate(
+                {
+                    "data": [mod.model_dump(by_alias=True, include=set(fields)) for mod in data],
+                    "pagination": pagination,
+                }
+            )
+        return SearchModsResponse(data=data, pagination=pagination)
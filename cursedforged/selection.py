@@ -0,0 +1,62 @@
+"""Local selection of the best file of mods from their `latest_files_indexes`.
+
+`Mod.latest_files_indexes` lists the latest file of a mod for every game version, mod
+loader and release type, so the file to install for a target version and loader can be
+picked without requesting `get_mod_files` for every mod.
+"""
+
+from typing import Iterable
+
+from cursedforged.types import FileReleaseType, Mod, ModLoaderType
+
+
+def select_file_ids(
+    mods: Iterable[Mod],
+    game_version: str | None = None,
+    mod_loader_type: ModLoaderType | None = None,
+    min_release_type: FileReleaseType = FileReleaseType.ALPHA,
+    prefer_stable: bool = True,
+) -> dict[int, int | None]:
+    """Select the best file of every mod for a game version and mod loader.
+
+    The file indexes of all the mods are scanned once. Among the files matching the game
+    version, the mod loader and the release type, releases are preferred over betas and
+    betas over alphas, then the most recent file wins. Without any filter, a mod whose
+    indexes are empty falls back to its main file.
+
+    Args:
+        mods (Iterable[Mod]): The mods, e.g. the `data` of `get_mods`.
+        game_version (str | None, optional): Only select files for this game version. Defaults to None.
+        mod_loader_type (ModLoaderType | None, optional): Only select files for this mod loader. Defaults to None.
+        min_release_type (FileReleaseType, optional): The least stable release type accepted, e.g. BETA accepts releases and betas. Defaults to ALPHA.
+        prefer_stable (bool, optional): Whether to prefer the most stable file over the most recent one. Defaults to True.
+
+    Returns:
+        dict[int, int | None]: The selected file id of every mod, None when no file matches.
+    """
+    unfiltered = (
+        game_version is None
+        and mod_loader_type is None
+        and min_release_type == FileReleaseType.ALPHA
+    )
+    # The best candidate has the greatest (-release_type, file_id) key, or (0, file_id).
+    stability = -1 if prefer_stable else 0
+    selected: dict[int, int | None] = {}
+    for mod in mods:
+        best_key = (-4, -1)
+        best: int | None = None
+        for index in mod.latest_files_indexes:
+            if (
+                index.release_type > min_release_type
+                or (game_version is not None and index.game_version != game_version)
+                or (mod_loader_type is not None and index.mod_loader != mod_loader_type)
+            ):
+                continue
+            key = (stability * index.release_type, index.file_id)
+            if key > best_key:
+                best_key = key
+                best = index.file_id
+        if best is None and unfiltered:
+            best = mod.main_file_id
+        selected[mod.id] = best
+    return selected
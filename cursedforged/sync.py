@@ -0,0 +1,177 @@
+"""Incremental synchronization of a game's mods into the client's entity store.
+
+`search_mods` sorted by `LAST_UPDATED` in descending order lists the most recently
+modified mods first, so a sync only has to page until it meets the newest modification
+date seen by the previous run. Only the mods changed since then, and their files, are
+fetched, and the new high-water mark is saved as a checkpoint in the entity store. When
+the changes do not fit in the results window, e.g. on the first run, the rest of the
+mods are crawled by partitions with `ModCrawler`.
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from cursedforged.api.pagination import MAX_PAGE_SIZE, MAX_RESULT_WINDOW, iter_pages
+from cursedforged.api.store import EntityStore
+from cursedforged.api.v1 import API_v1
+from cursedforged.crawl import CrawlResult, ModCrawler, Partition
+from cursedforged.types import (
+    File,
+    Mod,
+    ModsSearchSortField,
+    SearchModsResponse,
+    SortOrder,
+)
+
+
+@dataclass
+class SyncResult:
+    mods: dict[int, Mod] = field(default_factory=dict)
+    """The mods modified since the previous sync, by mod id."""
+    files: dict[int, File] = field(default_factory=dict)
+    """The refreshed files of the modified mods, by file id."""
+    errors: dict[int, Exception] = field(default_factory=dict)
+    """The error of every file id that could not be fetched."""
+    checkpoint: datetime | None = None
+    """The high-water mark after the sync, the newest modification date seen."""
+    complete: bool = True
+    """False when some changed mods may have been missed, the checkpoint is then left unchanged."""
+    crawl: CrawlResult | None = None
+    """The crawl of the mods beyond the results window, when the changes did not fit in it."""
+
+
+class CatalogSync:
+    """Keeps the client's entity store in sync with the mods of a game, incrementally.
+
+    Each run pages `search_mods` by last update, newest first, and stops at the mods
+    modified before the checkpoint of the previous run, minus `overlap`. The changed mods
+    are written through to the entity store by the search itself, and the files listed in
+    their `latest_files_indexes` are then fetched in bulk with `get_files_batched`.
+
+    On the first run, or after a long pause, the changes may not fit in the 10,000
+    results window of `search_mods`. The run then crawls every mod of the game, or of
+    the class, by partitions with `ModCrawler`, which is slow but only needed once. The
+    checkpoint is saved once the pass is finished, unless some partition could not be
+    crawled entirely or some files could not be fetched, so no change is ever skipped.
+    A first run can also start from a known date with `run(since=...)`.
+
+    Args:
+        api (API_v1): The API used for the sync, its client must have an entity store, e.g. `client.v1`.
+        game_id (int): The game to sync.
+        class_id (int | None, optional): Only sync the mods of this class. Defaults to None.
+        name (str | None, optional): The checkpoint name. Defaults to "sync:<game_id>:<class_id>".
+        overlap (timedelta, optional): Also sync the mods modified this long before the checkpoint, to cover the delay of the search index. Defaults to 10 minutes.
+        page_size (int, optional): The number of mods requested per page. Defaults to 50.
+        max_concurrency (int, optional): The maximum number of requests sent at once by a crawl. Defaults to 8.
+
+    Raises:
+        ValueError: The client has no entity store.
+    """
+
+    def __init__(
+        self,
+        api: API_v1,
+        game_id: int,
+        class_id: int | None = None,
+        name: str | None = None,
+        overlap: timedelta = timedelta(minutes=10),
+        page_size: int = 50,
+        max_concurrency: int = 8,
+    ):
+        if api.client.store is None:
+            raise ValueError("CatalogSync requires a client with an entity store")
+        self.api = api
+        self.store: EntityStore = api.client.store
+        self.game_id = game_id
+        self.class_id = class_id
+        self.name = name or "sync:{}:{}".format(game_id, class_id)
+        self.overlap = overlap
+        self.page_size = page_size
+        self.max_concurrency = max_concurrency
+
+    @property
+    def checkpoint(self) -> datetime | None:
+        """The newest modification date seen by the last complete sync, None before the first one."""
+        value = self.store.get_checkpoint(self.name)
+        return datetime.fromisoformat(value) if value is not None else None
+
+    def _fetch_page(self, index: int, size: int) -> SearchModsResponse:
+        return self.api.search_mods(
+            self.game_id,
+            class_id=self.class_id,
+            sort_field=ModsSearchSortField.LAST_UPDATED,
+            sort_order=SortOrder.DESC,
+            index=index,
+            page_size=size,
+        )
+
+    def run(self, files: bool = True, since: datetime | None = None) -> SyncResult:
+        """Fetch the mods modified since the last sync and move the checkpoint forward.
+
+        Args:
+            files (bool, optional): Whether to fetch the files of the modified mods too. Defaults to True.
+            since (datetime | None, optional): The timezone aware date to sync from when there is no checkpoint yet, e.g. the date an existing mirror was made. Defaults to None, i.e. sync every mod.
+
+        Raises:
+            ValueError: `since` is a naive datetime, it cannot be compared with the dates of the API.
+
+        Returns:
+            SyncResult: The modified mods and their files.
+        """
+        if since is not None and since.utcoffset() is None:
+            raise ValueError(
+                "since must be timezone aware, e.g. datetime(2024, 1, 1, tzinfo=timezone.utc)"
+            )
+
+        previous = self.checkpoint or since
+        stop = previous - self.overlap if previous is not None else None
+        result = SyncResult(checkpoint=previous)
+        newest = previous
+        reached = False
+        total = 0
+
+        for page in iter_pages(self._fetch_page, self.page_size):
+            total = page.pagination.total_count
+            for mod in page.data:
+                if stop is not None and mod.date_modified < stop:
+                    reached = True
+                    break
+                result.mods[mod.id] = mod
+                if newest is None or mod.date_modified > newest:
+                    newest = mod.date_modified
+            if reached:
+                break
+
+        complete = reached or total <= MAX_RESULT_WINDOW
+        if not complete:
+            crawler = ModCrawler(
+                self.api, self.game_id, self.max_concurrency, min(self.page_size, MAX_PAGE_SIZE)
+            )
+            result.crawl = crawler.crawl(Partition(class_id=self.class_id))
+            for mod in result.crawl.mods.values():
+                if stop is not None and mod.date_modified < stop:
+                    continue
+                result.mods.setdefault(mod.id, mod)
+                if newest is None or mod.date_modified > newest:
+                    newest = mod.date_modified
+            complete = not result.crawl.truncated and not result.crawl.errors
+
+        if files:
+            for mod in result.mods.values():
+                result.files.update((file.id, file) for file in mod.latest_files)
+            wanted = {
+                index.file_id
+                for mod in result.mods.values()
+                for index in (*mod.latest_files_indexes, *mod.latest_early_access_files_indexes)
+                if index.file_id not in result.files
+            }
+            if wanted:
+                response = self.api.get_files_batched(sorted(wanted))
+                result.files.update((file.id, file) for file in response.data)
+                result.errors.update(response.errors)
+
+        result.complete = complete
+        if result.complete and newest is not None and not result.errors:
+            self.store.set_checkpoint(self.name, newest.isoformat())
+            result.checkpoint = newest
+        return result
@@ -6,3 +6,4 @@ from .minecraft import *
 from .mods import *
 from .responses import *
 from .fingerprints import *
+from .projection import *
@@ -45,4 +45,4 @@ class FingerprintFuzzyMatch(BaseModel):
 class FingerprintFuzzyMatchResult(BaseModel):
     """https://docs.curseforge.com/#tocS_FingerprintFuzzyMatchResult"""
 
-    fuzzyMatches: list[FingerprintMatch] = Field(alias="fuzzyMatches")
+    fuzzy_matches: list[FingerprintFuzzyMatch] = Field(alias="fuzzyMatches")
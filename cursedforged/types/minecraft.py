@@ -1,4 +1,7 @@
+import json
 from datetime import datetime
+from functools import cached_property
+from typing import Any
 
 from pydantic import BaseModel, Field
 
@@ -73,3 +76,13 @@ class MinecraftModLoaderVersion(BaseModel):
     mc_game_version_type_status: GameVersionTypeStatus = Field(
         alias="mcGameVersionTypeStatus"
     )
+
+    @cached_property
+    def version_data(self) -> Any:
+        """The `version_json` document, parsed on first access."""
+        return json.loads(self.version_json) if self.version_json else None
+
+    @cached_property
+    def additional_files(self) -> Any:
+        """The `additional_files_json` document, parsed on first access."""
+        return json.loads(self.additional_files_json) if self.additional_files_json else None
@@ -0,0 +1,112 @@
+from functools import lru_cache
+from typing import Any, Iterable, TypeVar, get_origin
+
+from pydantic import BaseModel, Field, create_model
+
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
+_IGNORED_ALIAS = "\x00"
+"""A validation alias no payload uses, so the fields left out of a projection are never read."""
+
+
+@lru_cache(maxsize=None)
+def _project(model: type[BaseModel], fields: frozenset[str]) -> type[BaseModel]:
+    unknown = fields - model.model_fields.keys()
+    if unknown:
+        raise ValueError(
+            "Unknown {} fields: {}".format(model.__name__, ", ".join(sorted(unknown)))
+        )
+    overrides: dict[str, Any] = {
+        name: (
+            Any,
+            Field(default=None, validation_alias=_IGNORED_ALIAS, exclude=True, repr=False),
+        )
+        for name in model.model_fields
+        if name not in fields
+    }
+    return create_model(
+        "{}[{}]".format(model.__name__, ",".join(sorted(fields))),
+        __base__=model,
+        __module__=model.__module__,
+        **overrides,
+    )
+
+
+def project(model: type[ModelT], fields: Iterable[str]) -> type[ModelT]:
+    """Derive a model that only parses some fields of another one.
+
+    The projection is a subclass of `model`, so it can be used wherever `model` is
+    expected. The other fields are skipped while parsing, which saves most of the parsing
+    time and memory of large nested payloads; they are None on the instances and are left
+    out of `repr` and `model_dump`. Projections are cached, asking twice for the same
+    fields returns the same class.
+
+    Args:
+        model (type[ModelT]): The model to project, e.g. `Mod`.
+        fields (Iterable[str]): The names of the fields to keep, e.g. `["id", "name"]`.
+
+    Raises:
+        ValueError: A field does not exist on `model`.
+
+    Returns:
+        type[ModelT]: The projected model.
+    """
+    return _project(model, frozenset(fields))  # type: ignore[return-value]
+
+
+def project_instance(instance: ModelT, fields: Iterable[str] | None) -> ModelT:
+    """Project an already parsed model, e.g. a mod read from the entity store.
+
+    Args:
+        instance (ModelT): The model to project.
+        fields (Iterable[str] | None): The names of the fields to keep, None keeps every field.
+
+    Raises:
+        ValueError: A field does not exist on the model.
+
+    Returns:
+        ModelT: An instance of the projected model, or `instance` itself when `fields` is None.
+    """
+    if fields is None:
+        return instance
+    fields = frozenset(fields)
+    return project(type(instance), fields).model_validate(
+        instance.model_dump(by_alias=True, include=set(fields))
+    )
+
+
+@lru_cache(maxsize=None)
+def _project_response(
+    response_model: type[BaseModel], item_model: type[BaseModel]
+) -> type[BaseModel]:
+    data = response_model.model_fields["data"]
+    annotation = list[item_model] if get_origin(data.annotation) is list else item_model  # type: ignore[valid-type]
+    return create_model(
+        "{}[{}]".format(response_model.__name__, item_model.__name__),
+        __base__=response_model,
+        __module__=response_model.__module__,
+        data=(annotation, Field(alias=data.alias or "data")),
+    )
+
+
+def project_response(
+    response_model: type[ModelT],
+    item_model: type[BaseModel],
+    fields: Iterable[str] | None,
+) -> type[ModelT]:
+    """Derive a response model whose `data` only parses some fields of its items.
+
+    Args:
+        response_model (type[ModelT]): The response model, e.g. `SearchModsResponse`.
+        item_model (type[BaseModel]): The model of the `data` items, e.g. `Mod`.
+        fields (Iterable[str] | None): The names of the item fields to keep, None keeps every field.
+
+    Raises:
+        ValueError: A field does not exist on `item_model`.
+
+    Returns:
+        type[ModelT]: The projected response model, or `response_model` itself when `fields` is None.
+    """
+    if fields is None:
+        return response_model
+    return _project_response(response_model, project(item_model, fields))  # type: ignore[return-value]
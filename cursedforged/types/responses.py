@@ -1,4 +1,4 @@
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from .category import Category
 from .minecraft import (
@@ -71,6 +71,17 @@ class GetFilesResponse(BaseModel):
     data: list[File]
 
 
+class GetFilesBatchResponse(GetFilesResponse):
+    """A `GetFilesResponse` merged from several chunked requests."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    errors: dict[int, Exception] = Field(
+        default_factory=dict,
+        description="The error of every requested file id whose chunk could not be fetched",
+    )
+
+
 class GetGameResponse(BaseModel):
     """https://docs.curseforge.com/#tocS_Get%20Game%20Response"""
 
@@ -109,6 +120,17 @@ class GetModsResponse(BaseModel):
     data: list[Mod]
 
 
+class GetModsBatchResponse(GetModsResponse):
+    """A `GetModsResponse` merged from several chunked requests."""
+
+    model_config = ConfigDict(arbitrary_types_allowed=True)
+
+    errors: dict[int, Exception] = Field(
+        default_factory=dict,
+        description="The error of every requested mod id whose chunk could not be fetched",
+    )
+
+
 class GetVersionTypesResponse(BaseModel):
     """https://docs.curseforge.com/#tocS_Get%20Version%20Types%20Response"""
 
@@ -147,10 +169,10 @@ class StringResponse(BaseModel):
 class GetFingerprintMatchesResponse(BaseModel):
     """https://docs.curseforge.com/#tocS_Get%20Fingerprint%20Matches%20Response"""
 
-    data: list[FingerprintMatchesResult]
+    data: FingerprintMatchesResult
 
 
 class GetFingerprintsFuzzyMatchesResponse(BaseModel):
     """https://docs.curseforge.com/#tocS_Get%20Fingerprints%20Fuzzy%20Matches%20Response"""
 
-    data: list[FingerprintFuzzyMatchResult]
+    data: FingerprintFuzzyMatchResult
@@ -0,0 +1,417 @@
+"""Ordering of game versions.
+
+CurseForge sorts game versions by their padded form, e.g. `0000000001.0000000020.0000000001`
+for 1.20.1, as found in `SortableGameVersion.game_version_padded`. `GameVersionIndex`
+sorts every known version once and gives each one an ordinal, so comparing versions is
+an integer comparison and version ranges are resolved with a bisection.
+
+Versions are only ordered against the versions of their own family of version types:
+"Java 8" pads to `0000000008` but is not newer than 1.20.1. The types of a family share
+a name up to their version, e.g. "Minecraft 1.19" and "Minecraft 1.20".
+"""
+
+import re
+import threading
+from bisect import bisect_left
+from typing import TYPE_CHECKING, Hashable, Iterable, TypeVar
+
+from cursedforged.types import (
+    File,
+    FileIndex,
+    GameVersionsByType,
+    GameVersionType,
+    SortableGameVersion,
+)
+
+if TYPE_CHECKING:
+    from cursedforged.api.v1 import API_v1
+
+ItemT = TypeVar("ItemT", File, FileIndex)
+
+_DIGITS = re.compile(r"\d+")
+_TRAILING_VERSION = re.compile(r"[\s\d.]+$")
+
+
+def pad_version(version: str) -> str:
+    """Build the padded form of a version, the way CurseForge does for sorting.
+
+    Args:
+        version (str): The version, e.g. "1.20.1".
+
+    Returns:
+        str: Its numbers padded to 10 digits, e.g. "0000000001.0000000020.0000000001", or "0" without any number.
+    """
+    numbers = _DIGITS.findall(version)
+    if not numbers:
+        return "0"
+    return ".".join(number.zfill(10) for number in numbers)
+
+
+class GameVersionIndex:
+    """The order of a game's versions, shared by every file to compare.
+
+    Versions are registered with their type from `get_game_versions` and with their
+    padded form from the `sortable_game_versions` of files, which takes precedence over
+    the padded form computed by `pad_version`. The ordinals are computed once, when
+    first needed after versions were added.
+
+    Each family of version types is ordered on its own. A family is named after its
+    version types with their version left out, so "Minecraft 1.19" and "Minecraft 1.20"
+    form the "Minecraft" family while "Java" and "Modloader" form their own. Without the
+    names of the version types, see `add_types`, every version type is a family. Ranges
+    only span the family of their bounds, or of `type_id` when it is given.
+
+    Range bounds do not need to be known versions: a lower bound of "1.19" includes
+    1.19 and 1.19.2, an upper bound of "1.21" excludes 1.21 and 1.21.1. The family of an
+    unknown bound is the one named like it, e.g. "Java" for "Java 11", or else the one
+    whose versions share the most leading numbers with it, e.g. "Minecraft" for "1.18".
+
+    Args:
+        versions (Iterable[GameVersionsByType], optional): The versions of each version type, e.g. the `data` of `get_game_versions`. Defaults to ().
+        types (Iterable[GameVersionType], optional): The version types, e.g. the `data` of `get_game_version_types`. Defaults to ().
+    """
+
+    def __init__(
+        self,
+        versions: Iterable[GameVersionsByType] = (),
+        types: Iterable[GameVersionType] = (),
+    ):
+        self._lock = threading.Lock()
+        self._padded: dict[str, str] = {}
+        self._types: dict[str, int | None] = {}
+        self._families: dict[int, str] = {}
+        self._built = False
+        self._orders: dict[Hashable, list[str]] = {}
+        self._keys: dict[Hashable, list[str]] = {}
+        self._ordinals: dict[str, int] = {}
+        self.add_types(types)
+        self.add_versions(versions)
+
+    @classmethod
+    def from_api(cls, api: "API_v1", game_id: int) -> "GameVersionIndex":
+        """Build the index of a game's versions and version types.
+
+        Args:
+            api (API_v1): The API used to fetch the versions, e.g. `client.v1`.
+            game_id (int): A game unique id
+
+        Returns:
+            GameVersionIndex: The index.
+        """
+        return cls(
+            api.get_game_versions(game_id).data, api.get_game_version_types(game_id).data
+        )
+
+    def __len__(self) -> int:
+        return len(self._padded)
+
+    def __contains__(self, version: object) -> bool:
+        return version in self._padded
+
+    def add_types(self, types: Iterable[GameVersionType]) -> None:
+        """Register the names of version types, which tell the family of each type.
+
+        Args:
+            types (Iterable[GameVersionType]): The version types.
+        """
+        with self._lock:
+            for version_type in types:
+                family = _TRAILING_VERSION.sub("", version_type.name) or version_type.name
+                if self._families.get(version_type.id) != family:
+                    self._families[version_type.id] = family
+                    self._built = False
+
+    def add_versions(self, versions: Iterable[GameVersionsByType]) -> None:
+        """Register the versions of version types.
+
+        Args:
+            versions (Iterable[GameVersionsByType]): The versions of each version type.
+        """
+        with self._lock:
+            for by_type in versions:
+                for version in by_type.versions:
+                    if version not in self._padded:
+                        self._padded[version] = pad_version(version)
+                        self._built = False
+                    if self._types.get(version) != by_type.type:
+                        self._types[version] = by_type.type
+                        self._built = False
+
+    def add_sortable(self, versions: Iterable[SortableGameVersion]) -> None:
+        """Register versions with their padded form and type.
+
+        Args:
+            versions (Iterable[SortableGameVersion]): The versions, e.g. the `sortable_game_versions` of a file.
+        """
+        with self._lock:
+            for version in versions:
+                name = version.game_version_name
+                if self._padded.get(name) != version.game_version_padded:
+                    self._padded[name] = version.game_version_padded
+                    self._built = False
+                if (
+                    version.game_version_type_id is not None or name not in self._types
+                ) and self._types.get(name, 0) != version.game_version_type_id:
+                    self._types[name] = version.game_version_type_id
+                    self._built = False
+
+    def add_files(self, files: Iterable[File]) -> None:
+        """Register the sortable game versions of files.
+
+        Args:
+            files (Iterable[File]): The files.
+        """
+        self.add_sortable(version for file in files for version in file.sortable_game_versions)
+
+    def _family(self, type_id: int | None) -> Hashable:
+        if type_id is None:
+            return None
+        return self._families.get(type_id, type_id)
+
+    def _build(self) -> tuple[dict[Hashable, list[str]], dict[Hashable, list[str]], dict[str, int]]:
+        """Get the versions of each family in order, their padded forms and their ordinals."""
+        with self._lock:
+            if not self._built:
+                orders: dict[Hashable, list[str]] = {}
+                padded = self._padded
+                for version in sorted(padded, key=lambda version: (padded[version], version)):
+                    orders.setdefault(self._family(self._types.get(version)), []).append(version)
+                self._orders = orders
+                self._keys = {
+                    family: [self._padded[version] for version in order]
+                    for family, order in orders.items()
+                }
+                self._ordinals = {
+                    version: ordinal
+                    for order in orders.values()
+                    for ordinal, version in enumerate(order)
+                }
+                self._built = True
+            return self._orders, self._keys, self._ordinals
+
+    def family(self, version: str) -> Hashable:
+        """Get the family of version types of a version, known or not.
+
+        Args:
+            version (str): The version.
+
+        Raises:
+            KeyError: The version is not known and its family cannot be told apart, see `GameVersionIndex`.
+
+        Returns:
+            Hashable: The family name, or the version type id when its name is not known.
+        """
+        if version in self._padded:
+            return self._family(self._types.get(version))
+
+        name = _TRAILING_VERSION.sub("", version)
+        if name in self._families.values():
+            return name
+
+        _, keys, _ = self._build()
+        numbers = self.key(version).split(".")
+        best, found = 0, []
+        for family, family_keys in keys.items():
+            shared = max((_shared_prefix(numbers, key.split(".")) for key in family_keys), default=0)
+            if shared > best:
+                best, found = shared, [family]
+            elif shared == best:
+                found.append(family)
+        if best == 0 or len(found) != 1:
+            raise KeyError(version)
+        return found[0]
+
+    def ordinal(self, version: str) -> int:
+        """Get the position of a version in the order of the known versions of its family.
+
+        Args:
+            version (str): A known version.
+
+        Raises:
+            KeyError: The version is not known.
+
+        Returns:
+            int: The ordinal, greater for newer versions of the same family.
+        """
+        return self._build()[2][version]
+
+    def key(self, version: str) -> str:
+        """Get the sort key of any version, known or not.
+
+        Args:
+            version (str): The version.
+
+        Returns:
+            str: Its padded form.
+        """
+        return self._padded.get(version) or pad_version(version)
+
+    def _range(
+        self, lower: str | None, upper: str | None, type_id: int | None
+    ) -> tuple[Hashable, int, int]:
+        """Get the family of a range and the ordinal range within it."""
+        if type_id is not None:
+            family = self._family(type_id)
+        else:
+            bounds = [bound for bound in (lower, upper) if bound is not None]
+            if not bounds:
+                raise ValueError("A range needs a bound or a version type")
+            for bound in bounds:
+                try:
+                    family = self.family(bound)
+                    break
+                except KeyError:
+                    continue
+            else:
+                raise ValueError(
+                    "The version type of {} is not known, pass type_id".format(" and ".join(bounds))
+                )
+
+        keys = self._build()[1].get(family, [])
+        start = bisect_left(keys, self.key(lower)) if lower is not None else 0
+        stop = bisect_left(keys, self.key(upper)) if upper is not None else len(keys)
+        return family, start, max(start, stop)
+
+    def bounds(
+        self, lower: str | None = None, upper: str | None = None, type_id: int | None = None
+    ) -> tuple[int, int]:
+        """Get the ordinal range of the versions `>= lower` and `< upper` of a family.
+
+        Args:
+            lower (str | None, optional): The oldest version included. Defaults to no lower bound.
+            upper (str | None, optional): The oldest version excluded. Defaults to no upper bound.
+            type_id (int | None, optional): A version type of the family. Defaults to the family of the bounds.
+
+        Raises:
+            ValueError: Neither a bound nor `type_id` is given, or the family of the bounds is not known.
+
+        Returns:
+            tuple[int, int]: The ordinals `(start, stop)` of the range, `start <= ordinal < stop`.
+        """
+        _, start, stop = self._range(lower, upper, type_id)
+        return start, stop
+
+    def versions(
+        self,
+        lower: str | None = None,
+        upper: str | None = None,
+        type_id: int | None = None,
+    ) -> list[str]:
+        """List the known versions `>= lower` and `< upper`, oldest first.
+
+        Without any bound or `type_id`, every known version is listed, family by family.
+
+        Args:
+            lower (str | None, optional): The oldest version included. Defaults to no lower bound.
+            upper (str | None, optional): The oldest version excluded. Defaults to no upper bound.
+            type_id (int | None, optional): Only list the versions of this version type. Defaults to the types of the family of the bounds.
+
+        Raises:
+            ValueError: The family of the bounds is not known.
+
+        Returns:
+            list[str]: The versions.
+        """
+        orders, _, _ = self._build()
+        if lower is None and upper is None and type_id is None:
+            return [version for order in orders.values() for version in order]
+        family, start, stop = self._range(lower, upper, type_id)
+        return [
+            version
+            for version in orders.get(family, [])[start:stop]
+            if type_id is None or self._types.get(version) == type_id
+        ]
+
+    def by_type(self) -> dict[int | None, list[str]]:
+        """Group the known versions by version type, oldest first.
+
+        Returns:
+            dict[int | None, list[str]]: The versions of each version type id.
+        """
+        groups: dict[int | None, list[str]] = {}
+        for order in self._build()[0].values():
+            for version in order:
+                groups.setdefault(self._types.get(version), []).append(version)
+        return groups
+
+    def compatible(
+        self,
+        items: Iterable[ItemT],
+        lower: str | None = None,
+        upper: str | None = None,
+        type_id: int | None = None,
+    ) -> list[ItemT]:
+        """Keep the files, or file indexes, of a game version `>= lower` and `< upper`.
+
+        Only the versions of the family of the bounds match, e.g. "Java 17" or "Forge"
+        never match a range of Minecraft versions. Without any bound or `type_id`, every
+        known version matches. Versions that are not known never match.
+
+        Args:
+            items (Iterable[File] | Iterable[FileIndex]): The files or file indexes.
+            lower (str | None, optional): The oldest version included. Defaults to no lower bound.
+            upper (str | None, optional): The oldest version excluded. Defaults to no upper bound.
+            type_id (int | None, optional): Only match the versions of this version type. Defaults to the types of the family of the bounds.
+
+        Raises:
+            ValueError: The family of the bounds is not known.
+
+        Returns:
+            list[File] | list[FileIndex]: The matching items, in order.
+        """
+        _, _, ordinals = self._build()
+        if lower is None and upper is None and type_id is None:
+            return [
+                item for item in items if any(map(ordinals.__contains__, _item_versions(item)))
+            ]
+        family, start, stop = self._range(lower, upper, type_id)
+
+        def matches(version: str) -> bool:
+            ordinal = ordinals.get(version)
+            return (
+                ordinal is not None
+                and start <= ordinal < stop
+                and self._family(self._types.get(version)) == family
+                and (type_id is None or self._types.get(version) == type_id)
+            )
+
+        return [item for item in items if any(map(matches, _item_versions(item)))]
+
+    def newest_version(self, item: File | FileIndex, type_id: int | None = None) -> str | None:
+        """Get the newest known game version of a file or file index within a family.
+
+        Args:
+            item (File | FileIndex): The file or file index.
+            type_id (int | None, optional): A version type of the family. Defaults to the family with the most known versions, e.g. the Minecraft versions rather than Java, the mod loaders or the environments.
+
+        Returns:
+            str | None: The newest version, or None if none of its versions of the family is known.
+        """
+        orders, _, ordinals = self._build()
+        if type_id is not None:
+            family = self._family(type_id)
+        elif orders:
+            family = max(orders, key=lambda family: len(orders[family]))
+        else:
+            return None
+        known = [
+            version
+            for version in _item_versions(item)
+            if version in ordinals and self._family(self._types.get(version)) == family
+        ]
+        return max(known, key=ordinals.__getitem__, default=None)
+
+
+def _shared_prefix(numbers: list[str], other: list[str]) -> int:
+    shared = 0
+    for number, other_number in zip(numbers, other, strict=False):
+        if number != other_number:
+            break
+        shared += 1
+    return shared
+
+
+def _item_versions(item: File | FileIndex) -> list[str]:
+    if isinstance(item, FileIndex):
+        return [item.game_version]
+    return item.game_versions
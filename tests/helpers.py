@@ -0,0 +1,240 @@
+import contextlib
+import json
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Callable, Iterator
+from unittest import mock
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+Handler = Callable[[str, str, dict[str, Any]], tuple[int, Any, dict[str, str]]]
+
+
+def file_json(file_id: int, mod_id: int = 1, game_versions: tuple[str, ...] = ("1.20.1",)) -> dict[str, Any]:
+    """Build the JSON of a file as the API returns it."""
+    return {
+        "id": file_id,
+        "gameId": 432,
+        "modId": mod_id,
+        "isAvailable": True,
+        "displayName": "File {}".format(file_id),
+        "fileName": "file-{}.jar".format(file_id),
+        "releaseType": 1,
+        "fileStatus": 4,
+        "hashes": [],
+        "fileDate": "2024-01-01T00:00:00Z",
+        "fileLength": 10,
+        "downloadCount": 0,
+        "downloadUrl": "https://edge.forgecdn.net/files/{}/file-{}.jar".format(file_id, file_id),
+        "gameVersions": list(game_versions),
+        "sortableGameVersions": [],
+        "dependencies": [],
+        "fileFingerprint": 0,
+        "modules": [],
+    }
+
+
+def mod_json(mod_id: int, date_modified: str = "2024-01-01T00:00:00Z") -> dict[str, Any]:
+    """Build the JSON of a mod as the API returns it."""
+    return {
+        "id": mod_id,
+        "gameId": 432,
+        "name": "Mod {}".format(mod_id),
+        "slug": "mod-{}".format(mod_id),
+        "links": {"websiteUrl": None, "wikiUrl": None, "issuesUrl": None, "sourceUrl": None},
+        "summary": "",
+        "status": 4,
+        "downloadCount": 0,
+        "isFeatured": False,
+        "primaryCategoryId": 1,
+        "categories": [],
+        "classId": 6,
+        "authors": [],
+        "screenshots": [],
+        "mainFileId": mod_id * 100,
+        "latestFiles": [],
+        "latestFilesIndexes": [],
+        "latestEarlyAccessFilesIndexes": [],
+        "dateCreated": "2020-01-01T00:00:00Z",
+        "dateModified": date_modified,
+        "dateReleased": date_modified,
+        "gamePopularityRank": 1,
+        "isAvailable": True,
+        "thumbsUpCount": 0,
+    }
+
+
+def make_response(
+    url: str, status_code: int = 200, body: Any = None, headers: dict[str, str] | None = None
+) -> requests.Response:
+    """Build a `requests.Response` with a JSON body."""
+    response = requests.Response()
+    response.url = url
+    response.status_code = status_code
+    response.headers = CaseInsensitiveDict(headers or {})
+    response._content = json.dumps(body).encode() if body is not None else b""
+    return response
+
+
+class FakeSession(requests.Session):
+    """A session answering requests with a handler instead of the network.
+
+    Args:
+        handler (Handler): Called with the method, the URL and the request arguments, returns the status code, the JSON body and the headers.
+    """
+
+    def __init__(self, handler: Handler):
+        super().__init__()
+        self.handler = handler
+        self.lock = threading.Lock()
+        self.calls: list[tuple[str, str, dict[str, Any]]] = []
+
+    def request(self, method: str, url: str, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        with self.lock:
+            self.calls.append((method, url, kwargs))
+        status_code, body, headers = self.handler(method, url, kwargs)
+        return make_response(url, status_code, body, headers)
+
+
+def category_json(category_id: int, class_id: int | None = None) -> dict[str, Any]:
+    """Build the JSON of a category, or of a class when `class_id` is None."""
+    return {
+        "id": category_id,
+        "gameId": 432,
+        "name": "Category {}".format(category_id),
+        "slug": "category-{}".format(category_id),
+        "url": "",
+        "iconUrl": "",
+        "dateModified": "2024-01-01T00:00:00Z",
+        "isClass": class_id is None,
+        "classId": class_id,
+    }
+
+
+@dataclass
+class CatalogMod:
+    """A mod of `FakeCatalog` along with the search filters it matches."""
+
+    mod_id: int
+    date_modified: str = "2024-01-01T00:00:00Z"
+    class_id: int = 6
+    category_id: int = 1
+    game_versions: dict[int, list[str]] = field(default_factory=dict)
+    loaders: list[int] = field(default_factory=list)
+    name: str | None = None
+    summary: str = ""
+    authors: list[tuple[int, str]] = field(default_factory=list)
+    download_count: int = 0
+    popularity_rank: int = 1
+    is_featured: bool = False
+    rating: float | None = None
+
+    def to_json(self) -> dict[str, Any]:
+        """Build the JSON of the mod, with a file index for every game version and loader."""
+        loaders: list[int | None] = [*self.loaders] or [None]
+        indexes = [
+            {
+                "gameVersion": version,
+                "fileId": self.mod_id * 100 + i,
+                "filename": "file.jar",
+                "releaseType": 1,
+                "gameVersionTypeId": type_id,
+                "modLoader": loader,
+            }
+            for i, (type_id, version, loader) in enumerate(
+                (type_id, version, loader)
+                for type_id, versions in self.game_versions.items()
+                for version in versions
+                for loader in loaders
+            )
+        ]
+        return {
+            **mod_json(self.mod_id, self.date_modified),
+            "name": self.name if self.name is not None else "Mod {}".format(self.mod_id),
+            "summary": self.summary,
+            "classId": self.class_id,
+            "primaryCategoryId": self.category_id,
+            "categories": [category_json(self.category_id, self.class_id)],
+            "authors": [{"id": id, "name": name, "url": ""} for id, name in self.authors],
+            "latestFilesIndexes": indexes,
+            "downloadCount": self.download_count,
+            "gamePopularityRank": self.popularity_rank,
+            "isFeatured": self.is_featured,
+            "rating": self.rating,
+        }
+
+    def matches(self, params: dict[str, Any]) -> bool:
+        version_type = params.get("gameVersionTypeId")
+        version = params.get("gameVersion")
+        loader = params.get("modLoaderType")
+        return (
+            params.get("classId") in (None, self.class_id)
+            and params.get("categoryId") in (None, self.category_id)
+            and (version_type is None or version_type in self.game_versions)
+            and (
+                version is None
+                or any(version in versions for versions in self.game_versions.values())
+            )
+            and (loader is None or int(loader) in self.loaders)
+        )
+
+
+class FakeCatalog:
+    """Answers `search_mods`, `get_categories` and `get_game_versions` over a list of mods.
+
+    Search results are sorted by modification date, newest first, and limited to the
+    results window like the API does.
+
+    Args:
+        mods (list[CatalogMod]): The mods of the game.
+        categories (dict[int, list[int]]): The category ids of each class id.
+        game_versions (dict[int, list[str]], optional): The versions of each version type id. Defaults to none.
+        window (int, optional): The size of the results window. Defaults to 10000.
+    """
+
+    def __init__(
+        self,
+        mods: list[CatalogMod],
+        categories: dict[int, list[int]],
+        game_versions: dict[int, list[str]] | None = None,
+        window: int = 10_000,
+    ):
+        self.mods = mods
+        self.categories = categories
+        self.game_versions = game_versions or {}
+        self.window = window
+
+    def __call__(self, method: str, url: str, kwargs: dict[str, Any]) -> tuple[int, Any, dict[str, str]]:
+        path = url.split("/", 3)[3]
+        params = {key: value for key, value in (kwargs.get("params") or {}).items() if value is not None}
+        if path == "v1/mods/search":
+            found = sorted(
+                (mod for mod in self.mods if mod.matches(params)),
+                key=lambda mod: mod.date_modified,
+                reverse=True,
+            )
+            index, size = params.get("index", 0), params.get("pageSize", 50)
+            if index + size > self.window:
+                return 400, {"error": "results window exceeded"}, {}
+            data = [mod.to_json() for mod in found[index : index + size]]
+            pagination = {"index": index, "pageSize": size, "resultCount": len(data), "totalCount": len(found)}
+            return 200, {"data": data, "pagination": pagination}, {}
+        if path == "v1/categories":
+            if params.get("classesOnly"):
+                return 200, {"data": [category_json(class_id) for class_id in self.categories]}, {}
+            class_id = params["classId"]
+            return 200, {"data": [category_json(c, class_id) for c in self.categories[class_id]]}, {}
+        if path == "v1/games/432/versions":
+            data = [{"type": type_id, "versions": versions} for type_id, versions in self.game_versions.items()]
+            return 200, {"data": data}, {}
+        return 404, {"error": path}, {}
+
+
+@contextlib.contextmanager
+def results_window(size: int) -> Iterator[None]:
+    """Shrink the `search_mods` results window, so a few mods exceed it."""
+    with contextlib.ExitStack() as stack:
+        for module in ("cursedforged.api.pagination", "cursedforged.crawl", "cursedforged.sync"):
+            stack.enter_context(mock.patch("{}.MAX_RESULT_WINDOW".format(module), size))
+        yield
@@ -0,0 +1,129 @@
+import tempfile
+import threading
+import unittest
+from urllib.parse import urlencode
+
+from requests.models import RequestEncodingMixin
+
+from cursedforged.api.cache import FileCacheBackend, ResponseCache
+from cursedforged.api.store import EntityStore
+from cursedforged.types import Mod, ModLoaderType, project
+
+from .helpers import mod_json
+
+try:
+    from aiohttp import web
+    from aiohttp.test_utils import TestServer
+
+    from cursedforged.api.aio import AsyncAPIClient
+except ImportError:  # pragma: no cover - optional dependency
+    web = None  # type: ignore[assignment]
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+class AsyncAPIClientTest(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self) -> None:
+        async def get_mod(request: "web.Request") -> "web.Response":
+            if request.headers.get("If-None-Match") == '"v1"':
+                return web.Response(status=304, headers={"ETag": '"v1"'})
+            return web.json_response(
+                {"data": mod_json(int(request.match_info["mod_id"]))}, headers={"ETag": '"v1"'}
+            )
+
+        async def get_mods(request: "web.Request") -> "web.Response":
+            body = await request.json()
+            return web.json_response({"data": [mod_json(mod_id) for mod_id in body["modIds"]]})
+
+        app = web.Application()
+        app.router.add_get("/v1/mods/{mod_id}", get_mod)
+        app.router.add_post("/v1/mods", get_mods)
+        self.server = TestServer(app)
+        await self.server.start_server()
+        self.addAsyncCleanup(self.server.close)
+        self.base_url = str(self.server.make_url("")).rstrip("/")
+
+    async def test_client_can_be_used_after_close(self) -> None:
+        client = AsyncAPIClient("key", base_url=self.base_url)
+        async with client:
+            self.assertEqual((await client.v1.get_mod(1)).data.id, 1)
+
+        self.assertEqual((await client.v1.get_mod(2)).data.id, 2)
+        await client.close()
+
+    async def test_store_is_used_off_the_event_loop(self) -> None:
+        store = EntityStore()
+        self.addCleanup(store.close)
+        threads: set[int] = set()
+        for name in ("get_mods", "put_mods"):
+            method = getattr(store, name)
+
+            def record(*args, method=method):
+                threads.add(threading.get_ident())
+                return method(*args)
+
+            setattr(store, name, record)
+
+        async with AsyncAPIClient("key", base_url=self.base_url, store=store) as client:
+            await client.v1.get_mods([1, 2])
+            mods = (await client.v1.get_mods([2, 3, 1], max_age=60)).data
+
+        self.assertEqual([mod.id for mod in mods], [2, 3, 1])
+        self.assertTrue(threads)
+        self.assertNotIn(threading.get_ident(), threads)
+
+    async def test_stored_mods_are_projected_like_fetched_ones(self) -> None:
+        store = EntityStore()
+        self.addCleanup(store.close)
+        store.put_mods([Mod.model_validate(mod_json(2))])
+        projected = project(Mod, ["id", "name"])
+
+        async with AsyncAPIClient("key", base_url=self.base_url, store=store) as client:
+            mods = (await client.v1.get_mods([1, 2], max_age=60, fields=["id", "name"])).data
+            mod = (await client.v1.get_mod(2, max_age=60, fields=["id", "name"])).data
+
+        self.assertEqual([type(mod) for mod in mods], [projected, projected])
+        self.assertEqual([mod.name for mod in mods], ["Mod 1", "Mod 2"])
+        self.assertIs(type(mod), projected)
+        self.assertIsNone(mod.summary)
+
+    async def test_file_cache_is_used_off_the_event_loop(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        cache = ResponseCache(backend=FileCacheBackend(directory.name), ttls={})
+        threads: set[int] = set()
+        for name in ("lookup", "store", "refresh"):
+            method = getattr(cache, name)
+
+            def record(*args, method=method):
+                threads.add(threading.get_ident())
+                return method(*args)
+
+            setattr(cache, name, record)
+
+        async with AsyncAPIClient("key", base_url=self.base_url, cache=cache) as client:
+            first = await client.v1.get_mod(1)
+            second = await client.v1.get_mod(1)
+
+        self.assertEqual((first.data.id, second.data.id), (1, 1))
+        self.assertEqual((cache.stats.misses, cache.stats.revalidations), (1, 1))
+        self.assertTrue(threads)
+        self.assertNotIn(threading.get_ident(), threads)
+
+
+@unittest.skipIf(web is None, "aiohttp is not installed")
+class BuildParamsTest(unittest.TestCase):
+    def test_params_are_encoded_like_requests(self) -> None:
+        params = {
+            "gameId": 432,
+            "includeAll": True,
+            "sortDescending": False,
+            "modLoaderType": ModLoaderType.FORGE,
+            "gameVersion": "1.20.1",
+            "modLoaderTypes": [1, 4],
+            "slug": None,
+        }
+
+        self.assertEqual(
+            urlencode(AsyncAPIClient._build_params(params)),
+            RequestEncodingMixin._encode_params(params),
+        )
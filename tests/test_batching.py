@@ -0,0 +1,32 @@
+import unittest
+
+from cursedforged.api.batching import chunk_ids, fetch_chunks, in_id_order
+from cursedforged.api.errors import APIError
+
+
+class FetchChunksTest(unittest.TestCase):
+    def test_chunks_are_deduplicated_and_ordered(self) -> None:
+        self.assertEqual(chunk_ids([3, 1, 3, 2, 5, 1], 2), [[3, 1], [2, 5]])
+
+    def test_request_errors_are_reported_by_id(self) -> None:
+        error = APIError(500, "url")
+
+        def fetch_chunk(chunk: list[int]) -> list[int]:
+            if 3 in chunk:
+                raise error
+            return [i * 10 for i in chunk]
+
+        items, errors = fetch_chunks(fetch_chunk, range(1, 7), chunk_size=2)
+
+        self.assertEqual(items, [10, 20, 50, 60])
+        self.assertEqual(errors, {3: error, 4: error})
+
+    def test_other_errors_propagate(self) -> None:
+        def fetch_chunk(chunk: list[int]) -> list[int]:
+            raise TypeError("bug")
+
+        with self.assertRaises(TypeError):
+            fetch_chunks(fetch_chunk, [1, 2, 3], chunk_size=1)
+
+    def test_in_id_order(self) -> None:
+        self.assertEqual(in_id_order([3, 1, 3, 4, 2], {1: "a", 2: "b", 3: "c"}), ["c", "a", "b"])
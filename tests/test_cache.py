@@ -0,0 +1,76 @@
+import os
+import tempfile
+import time
+import unittest
+from unittest import mock
+
+from cursedforged.api.cache import CacheEntry, FileCacheBackend, MemoryCacheBackend
+from cursedforged.types import GetModResponse
+
+from .helpers import mod_json
+
+
+class FileCacheBackendTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.backend = FileCacheBackend(self.directory.name)
+        self.entry = CacheEntry(data={"data": mod_json(1)}, expires_at=time.time() + 60)
+
+    def test_models_are_validated_once_across_reads(self) -> None:
+        self.backend.set("key", self.entry)
+
+        with mock.patch.object(
+            GetModResponse, "model_validate", wraps=GetModResponse.model_validate
+        ) as validate:
+            for _ in range(3):
+                self.assertEqual(self.backend.get("key").to_model(GetModResponse).data.id, 1)
+        self.assertEqual(validate.call_count, 1)
+
+    def test_entries_are_read_from_disk_once(self) -> None:
+        self.backend.set("key", self.entry)
+        fresh = FileCacheBackend(self.directory.name)
+
+        first = fresh.get("key")
+        self.assertIsNot(first, self.entry)
+        self.assertIs(fresh.get("key"), first)
+
+    def test_rewritten_files_are_read_again(self) -> None:
+        self.backend.set("key", self.entry)
+        other = FileCacheBackend(self.directory.name)
+        other.set("key", CacheEntry(data={"data": mod_json(2)}, expires_at=time.time() + 60))
+        path = self.backend._path("key")
+        # Make the rewrite visible even on file systems with a coarse mtime.
+        os.utime(path, ns=(0, 0))
+
+        self.assertEqual(self.backend.get("key").data, {"data": mod_json(2)})
+
+    def test_deleted_entries_are_forgotten(self) -> None:
+        self.backend.set("key", self.entry)
+        self.backend.delete("key")
+        self.assertIsNone(self.backend.get("key"))
+
+        self.backend.set("key", self.entry)
+        os.remove(self.backend._path("key"))
+        self.assertIsNone(self.backend.get("key"))
+
+    def test_memory_is_bounded(self) -> None:
+        backend = FileCacheBackend(self.directory.name, memory_entries=2)
+        for i in range(5):
+            backend.set(str(i), self.entry)
+
+        self.assertEqual(list(backend._decoded), ["3", "4"])
+        self.assertEqual(backend.get("0").data, self.entry.data)
+
+
+class MemoryCacheBackendTest(unittest.TestCase):
+    def test_least_recently_used_entries_are_evicted(self) -> None:
+        backend = MemoryCacheBackend(max_entries=2)
+        entries = [CacheEntry(data=i, expires_at=0) for i in range(3)]
+        backend.set("a", entries[0])
+        backend.set("b", entries[1])
+        backend.get("a")
+        backend.set("c", entries[2])
+
+        self.assertIs(backend.get("a"), entries[0])
+        self.assertIsNone(backend.get("b"))
@@ -0,0 +1,160 @@
+import asyncio
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+
+from cursedforged.api.client import APIClient
+from cursedforged.api.coalesce import AsyncSingleflight
+from cursedforged.api.errors import APIError
+
+from .helpers import FakeSession, mod_json
+
+
+def run_concurrently(calls: list[Callable[[], Any]]) -> list[Any]:
+    """Run the calls on threads of their own, returning their results or exceptions."""
+
+    def run(call: Callable[[], Any]) -> Any:
+        try:
+            return call()
+        except Exception as e:
+            return e
+
+    with ThreadPoolExecutor(max_workers=len(calls)) as executor:
+        return list(executor.map(run, calls))
+
+
+class SingleflightTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.status = 200
+        self.barrier: threading.Barrier | None = None
+        self.session = FakeSession(self.handle)
+        self.client = APIClient("key", client=self.session)
+
+    def wait_for_waiters(self, count: int) -> None:
+        """Hold the request until `count` other callers wait for it."""
+        assert self.client.inflight is not None
+        deadline = time.monotonic() + 5
+        while self.client.inflight.shared < count and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+    def handle(self, method: str, url: str, kwargs: dict[str, Any]) -> tuple[int, Any, dict[str, str]]:
+        if self.barrier is not None:
+            # Only returns once every expected request is in flight at the same time.
+            self.barrier.wait(timeout=5)
+        else:
+            self.wait_for_waiters(7)
+        if self.status != 200:
+            return self.status, {"error": "not found"}, {}
+        return 200, {"data": mod_json(int(url.rsplit("/", 1)[1]))}, {}
+
+    def test_identical_requests_share_one_request(self) -> None:
+        results = run_concurrently([lambda: self.client.v1.get_mod(1)] * 8)
+
+        self.assertEqual(len(self.session.calls), 1)
+        self.assertEqual(self.client.inflight.shared, 7)  # type: ignore[union-attr]
+        self.assertTrue(all(result is results[0] for result in results))
+        self.assertEqual(results[0].data.id, 1)
+
+    def test_error_reaches_every_waiter(self) -> None:
+        self.status = 404
+
+        results = run_concurrently([lambda: self.client.v1.get_mod(1)] * 8)
+
+        self.assertEqual(len(self.session.calls), 1)
+        self.assertIsInstance(results[0], APIError)
+        self.assertEqual(results[0].status_code, 404)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    def test_different_params_are_not_merged(self) -> None:
+        self.barrier = threading.Barrier(2)
+
+        first, second = run_concurrently(
+            [lambda: self.client.v1.get_mod(1), lambda: self.client.v1.get_mod(2)]
+        )
+
+        self.assertEqual(len(self.session.calls), 2)
+        self.assertEqual((first.data.id, second.data.id), (1, 2))
+
+    def test_different_models_are_not_merged(self) -> None:
+        self.barrier = threading.Barrier(2)
+
+        raw, model = run_concurrently(
+            [lambda: self.client.get("v1/mods/1"), lambda: self.client.v1.get_mod(1)]
+        )
+
+        self.assertEqual(len(self.session.calls), 2)
+        self.assertEqual(raw["data"]["id"], 1)
+        self.assertEqual(model.data.id, 1)
+
+    def test_finished_calls_are_not_cached(self) -> None:
+        self.barrier = threading.Barrier(1)
+
+        self.client.v1.get_mod(1)
+        self.client.v1.get_mod(1)
+
+        self.assertEqual(len(self.session.calls), 2)
+        self.assertEqual(self.client.inflight.shared, 0)  # type: ignore[union-attr]
+
+
+class AsyncSingleflightTest(unittest.IsolatedAsyncioTestCase):
+    async def test_identical_calls_share_one_call(self) -> None:
+        inflight = AsyncSingleflight()
+        calls = 0
+
+        async def fetch() -> dict[str, int]:
+            nonlocal calls
+            calls += 1
+            await asyncio.sleep(0.01)
+            return {"id": 1}
+
+        results = await asyncio.gather(*(inflight.do("mod", fetch) for _ in range(8)))
+
+        self.assertEqual(calls, 1)
+        self.assertEqual(inflight.shared, 7)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    async def test_error_reaches_every_waiter(self) -> None:
+        inflight = AsyncSingleflight()
+
+        async def fail() -> None:
+            await asyncio.sleep(0.01)
+            raise ValueError("boom")
+
+        results = await asyncio.gather(
+            *(inflight.do("mod", fail) for _ in range(4)), return_exceptions=True
+        )
+
+        self.assertIsInstance(results[0], ValueError)
+        self.assertTrue(all(result is results[0] for result in results))
+
+    async def test_different_keys_are_not_merged(self) -> None:
+        inflight = AsyncSingleflight()
+
+        async def fetch(value: int) -> int:
+            await asyncio.sleep(0.01)
+            return value
+
+        results = await asyncio.gather(inflight.do(1, lambda: fetch(1)), inflight.do(2, lambda: fetch(2)))
+
+        self.assertEqual(results, [1, 2])
+        self.assertEqual(inflight.shared, 0)
+
+    async def test_cancelled_waiter_does_not_cancel_the_call(self) -> None:
+        inflight = AsyncSingleflight()
+
+        async def fetch() -> int:
+            await asyncio.sleep(0.02)
+            return 1
+
+        first = asyncio.ensure_future(inflight.do("mod", fetch))
+        second = asyncio.ensure_future(inflight.do("mod", fetch))
+        await asyncio.sleep(0)
+        first.cancel()
+
+        self.assertEqual(await second, 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,157 @@
+import os
+import tempfile
+import unittest
+from datetime import datetime, timezone
+
+import pytest
+
+from cursedforged.columnar import PARENT_COLUMN, to_columns
+from cursedforged.types import Mod
+
+from .helpers import category_json, file_json, mod_json
+
+
+def make_mods() -> list[Mod]:
+    """Build a mod with every list filled in, one with empty lists and None fields, and a third."""
+    full = {
+        **mod_json(1, "2024-03-01T12:00:00+02:00"),
+        "logo": {
+            "id": 7,
+            "modId": 1,
+            "title": "logo",
+            "description": "",
+            "thumbnailUrl": "https://example.com/thumb.png",
+            "url": "https://example.com/logo.png",
+        },
+        "links": {"websiteUrl": "https://example.com", "wikiUrl": None, "issuesUrl": None, "sourceUrl": None},
+        "categories": [category_json(5, 6)],
+        "authors": [{"id": 10, "name": "Alice", "url": ""}, {"id": 11, "name": "Bob", "url": ""}],
+        "latestFiles": [file_json(100, 1, ("1.20.1", "Fabric"))],
+        "latestFilesIndexes": [
+            {"gameVersion": "1.20.1", "fileId": 100, "filename": "a.jar", "releaseType": 1, "modLoader": 4},
+            {"gameVersion": "1.19.2", "fileId": 101, "filename": "b.jar", "releaseType": 2},
+        ],
+        "rating": 4.5,
+        "allowModDistribution": True,
+    }
+    empty = mod_json(2)
+    last = {
+        **mod_json(3),
+        "authors": [{"id": 12, "name": "Carol", "url": ""}],
+        "latestFiles": [file_json(300, 3, ())],
+        "rating": 3.0,
+    }
+    return [Mod.model_validate(mod) for mod in (full, empty, last)]
+
+
+class ToColumnsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.mods = make_mods()
+        self.table = to_columns(self.mods)
+
+    def test_scalar_and_nested_columns(self) -> None:
+        columns = self.table.columns
+
+        self.assertEqual(len(self.table), 3)
+        self.assertEqual(columns["id"], [1, 2, 3])
+        self.assertEqual(columns["status"], [4, 4, 4])
+        self.assertEqual(columns["links.website_url"], ["https://example.com", None, None])
+        self.assertEqual(columns["logo.url"], ["https://example.com/logo.png", None, None])
+        self.assertEqual(columns["rating"], [4.5, None, 3.0])
+        self.assertEqual(columns["allow_mod_distribution"], [True, None, None])
+        self.assertEqual(self.table.kinds["id"], ("int", False))
+        self.assertEqual(self.table.kinds["logo.id"], ("int", True))
+        self.assertEqual(self.table.kinds["date_modified"], ("datetime", False))
+
+    def test_list_fields_become_child_tables(self) -> None:
+        authors = self.table.children["authors"]
+        indexes = self.table.children["latest_files_indexes"]
+        versions = self.table.children["latest_files"].children["game_versions"]
+
+        self.assertEqual(authors.columns["name"], ["Alice", "Bob", "Carol"])
+        self.assertEqual(authors.offsets, [0, 2, 2, 3])
+        self.assertEqual(authors.parent_rows(), [0, 0, 2])
+        self.assertEqual(indexes.columns["mod_loader"], [4, None])
+        self.assertEqual(indexes.offsets, [0, 2, 2, 2])
+        self.assertEqual(versions.columns["value"], ["1.20.1", "Fabric"])
+        self.assertEqual(versions.offsets, [0, 2, 2])
+        self.assertEqual(len(self.table.children["screenshots"]), 0)
+        self.assertEqual(self.table.children["screenshots"].offsets, [0, 0, 0, 0])
+
+    def test_empty_collections(self) -> None:
+        with self.assertRaises(ValueError):
+            to_columns([])
+
+        table = to_columns([], Mod)
+
+        self.assertEqual(len(table), 0)
+        self.assertEqual(table.columns["id"], [])
+        self.assertEqual(table.children["authors"].offsets, [0])
+        with self.assertRaises(ValueError):
+            table.parent_rows()
+
+    def test_to_numpy(self) -> None:
+        numpy = pytest.importorskip("numpy")
+
+        array = self.table.to_numpy()
+        authors = self.table.children["authors"].to_numpy()
+        screenshots = self.table.children["screenshots"].to_numpy()
+
+        self.assertEqual(array["id"].tolist(), [1, 2, 3])
+        self.assertEqual(array["id"].dtype, numpy.int64)
+        self.assertEqual(array["rating"][[0, 2]].tolist(), [4.5, 3.0])
+        self.assertTrue(numpy.isnan(array["rating"][1]))
+        self.assertEqual(array["logo.id"][0], 7)
+        self.assertTrue(numpy.isnan(array["logo.id"][1]))
+        self.assertEqual(array["allow_mod_distribution"].tolist(), [True, None, None])
+        self.assertEqual(array["date_modified"][0], numpy.datetime64("2024-03-01T10:00:00", "ms"))
+        self.assertEqual(authors["name"].tolist(), ["Alice", "Bob", "Carol"])
+        self.assertEqual(authors[PARENT_COLUMN].tolist(), [0, 0, 2])
+        self.assertEqual(len(screenshots), 0)
+        self.assertEqual(len(to_columns([], Mod).to_numpy()), 0)
+
+    def test_to_arrow(self) -> None:
+        pytest.importorskip("pyarrow")
+
+        arrow = self.table.to_arrow()
+        authors = self.table.children["authors"].to_arrow()
+
+        self.assertEqual(arrow.num_rows, 3)
+        for name, values in self.table.columns.items():
+            with self.subTest(column=name):
+                self.assertEqual(arrow.column(name).to_pylist(), values)
+        self.assertEqual(
+            arrow.column("date_modified").to_pylist()[0],
+            datetime(2024, 3, 1, 10, tzinfo=timezone.utc),
+        )
+        self.assertEqual(authors.column("id").to_pylist(), [10, 11, 12])
+        self.assertEqual(authors.column(PARENT_COLUMN).to_pylist(), [0, 0, 2])
+
+    def test_write_parquet(self) -> None:
+        pyarrow = pytest.importorskip("pyarrow")
+
+        with tempfile.TemporaryDirectory() as directory:
+            paths = self.table.write_parquet(os.path.join(directory, "export"), "mods")
+
+            names = {os.path.basename(path) for path in paths}
+            self.assertIn("mods.parquet", names)
+            self.assertIn("mods.authors.parquet", names)
+            self.assertIn("mods.screenshots.parquet", names)
+            self.assertIn("mods.latest_files.game_versions.parquet", names)
+
+            mods = pyarrow.parquet.read_table(paths[0])
+            self.assertEqual(mods.column("id").to_pylist(), [1, 2, 3])
+            self.assertEqual(mods.column("rating").to_pylist(), [4.5, None, 3.0])
+            self.assertEqual(mods.column("logo.url").to_pylist(), ["https://example.com/logo.png", None, None])
+
+            versions = pyarrow.parquet.read_table(
+                os.path.join(directory, "export", "mods.latest_files.game_versions.parquet")
+            )
+            self.assertEqual(versions.column("value").to_pylist(), ["1.20.1", "Fabric"])
+            self.assertEqual(versions.column(PARENT_COLUMN).to_pylist(), [0, 0])
+            screenshots = pyarrow.parquet.read_table(os.path.join(directory, "export", "mods.screenshots.parquet"))
+            self.assertEqual(screenshots.num_rows, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
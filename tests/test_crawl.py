@@ -0,0 +1,87 @@
+import unittest
+
+from cursedforged.api.client import APIClient
+from cursedforged.crawl import ModCrawler, Partition
+from cursedforged.types import ModLoaderType
+
+from .helpers import CatalogMod, FakeCatalog, FakeSession, results_window
+
+
+def date(day: int) -> str:
+    return "2024-01-{:02d}T00:00:00Z".format(day)
+
+
+class ModCrawlerTest(unittest.TestCase):
+    def setUp(self) -> None:
+        window = results_window(20)
+        window.__enter__()
+        self.addCleanup(window.__exit__, None, None, None)
+
+    def crawler(self, catalog: FakeCatalog) -> ModCrawler:
+        client = APIClient("key", client=FakeSession(catalog), coalesce=False)
+        return ModCrawler(client.v1, 432, max_concurrency=4, page_size=10)
+
+    def test_splits_until_every_partition_fits(self) -> None:
+        catalog = FakeCatalog(
+            [CatalogMod(i, date(i % 28 + 1), category_id=1 + i % 3) for i in range(1, 46)],
+            {6: [1, 2, 3]},
+            window=20,
+        )
+
+        result = self.crawler(catalog).crawl()
+
+        self.assertEqual(sorted(result.mods), list(range(1, 46)))
+        self.assertEqual(result.truncated, [])
+        self.assertEqual(result.errors, {})
+
+    def test_partition_beyond_the_last_split_is_truncated(self) -> None:
+        mods = [
+            CatalogMod(i, date(1), game_versions={1: ["1.20.1"]}, loaders=[ModLoaderType.FORGE])
+            for i in range(1, 31)
+        ]
+        catalog = FakeCatalog(mods, {6: [1]}, {1: ["1.20.1"]}, window=20)
+
+        result = self.crawler(catalog).crawl()
+
+        forge = Partition(6, 1, 1, "1.20.1", ModLoaderType.FORGE)
+        self.assertEqual(result.truncated, [forge])
+
+    def test_mods_without_a_loader_make_the_version_partition_truncated(self) -> None:
+        # Resource packs have no mod loader, so no loader partition returns them.
+        mods = [
+            CatalogMod(
+                i,
+                date(i % 28 + 1),
+                game_versions={1: ["1.20.1"]},
+                loaders=[ModLoaderType.FABRIC] if i <= 10 else [],
+            )
+            for i in range(1, 31)
+        ]
+        catalog = FakeCatalog(mods, {6: [1]}, {1: ["1.20.1"]}, window=20)
+
+        result = self.crawler(catalog).crawl()
+
+        self.assertEqual(result.truncated, [Partition(6, 1, 1, "1.20.1")])
+        self.assertEqual(result.errors, {})
+
+    def test_overlapping_children_are_not_truncated(self) -> None:
+        # Every mod supports two loaders, so the loader partitions count 40 mods for 20.
+        mods = [
+            CatalogMod(
+                i,
+                date(i % 28 + 1),
+                game_versions={1: ["1.20.1"]},
+                loaders=[ModLoaderType.FORGE if i % 2 else ModLoaderType.FABRIC, ModLoaderType.QUILT],
+            )
+            for i in range(1, 26)
+        ]
+        catalog = FakeCatalog(mods, {6: [1]}, {1: ["1.20.1"]}, window=20)
+
+        result = self.crawler(catalog).crawl()
+
+        self.assertEqual(sorted(result.mods), list(range(1, 26)))
+        self.assertEqual(result.truncated, [Partition(6, 1, 1, "1.20.1", ModLoaderType.QUILT)])
+
+
+if __name__ == "__main__":
+    unittest.main()
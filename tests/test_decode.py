@@ -0,0 +1,79 @@
+import json
+import unittest
+from unittest import mock
+
+from cursedforged.api import decode
+from cursedforged.api.client import APIClient
+from cursedforged.api.decode import ResponseDecoder
+from cursedforged.types import GetModsResponse, SearchModsResponse
+
+from .helpers import FakeSession, category_json, file_json, mod_json
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional dependency
+    orjson = None  # type: ignore[assignment]
+
+
+def search_body() -> bytes:
+    mod = {
+        **mod_json(1),
+        "summary": "Ünïcödé ☃",
+        "categories": [category_json(5, 6)],
+        "authors": [{"id": 10, "name": "Alice", "url": ""}],
+        "latestFiles": [file_json(100, 1, ("1.20.1", "Forge"))],
+        "latestFilesIndexes": [
+            {"gameVersion": "1.20.1", "fileId": 100, "filename": "a.jar", "releaseType": 1, "modLoader": 1}
+        ],
+        "rating": 4.5,
+    }
+    pagination = {"index": 0, "pageSize": 50, "resultCount": 2, "totalCount": 2}
+    return json.dumps({"data": [mod, mod_json(2)], "pagination": pagination}).encode()
+
+
+@unittest.skipIf(orjson is None, "orjson is not installed")
+class ResponseDecoderTest(unittest.TestCase):
+    def test_backends_decode_equal_models(self) -> None:
+        body = search_body()
+
+        from_pydantic = ResponseDecoder("pydantic").decode(body, SearchModsResponse)
+        from_orjson = ResponseDecoder("orjson").decode(body, SearchModsResponse)
+
+        self.assertEqual(from_pydantic, from_orjson)
+        self.assertEqual(from_orjson.data[0].summary, "Ünïcödé ☃")
+        self.assertEqual(from_orjson.data[0].latest_files[0].game_versions, ["1.20.1", "Forge"])
+
+    def test_backends_load_equal_data(self) -> None:
+        body = search_body()
+
+        self.assertEqual(ResponseDecoder("pydantic").loads(body), ResponseDecoder("orjson").loads(body))
+
+    def test_clients_decode_with_their_backend(self) -> None:
+        body = {"data": [mod_json(1)]}
+        results = []
+        for backend in ("pydantic", "orjson"):
+            client = APIClient(
+                "key", client=FakeSession(lambda method, url, kwargs: (200, body, {})), json_backend=backend
+            )
+            results.append(client.v1.get_mods([1]))
+
+        self.assertEqual(results[0], results[1])
+        self.assertIsInstance(results[0], GetModsResponse)
+
+
+class ResponseDecoderBackendTest(unittest.TestCase):
+    def test_unknown_backend_raises(self) -> None:
+        with self.assertRaises(ValueError):
+            ResponseDecoder("ujson")  # type: ignore[arg-type]
+        with self.assertRaises(ValueError):
+            APIClient("key", json_backend="simdjson")  # type: ignore[arg-type]
+
+    def test_orjson_backend_requires_orjson(self) -> None:
+        with mock.patch.object(decode, "orjson", None):
+            with self.assertRaises(ImportError):
+                ResponseDecoder("orjson")
+            self.assertEqual(ResponseDecoder().backend, "pydantic")
+
+
+if __name__ == "__main__":
+    unittest.main()
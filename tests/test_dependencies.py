@@ -0,0 +1,205 @@
+import unittest
+from dataclasses import dataclass, field
+from typing import Any
+
+from cursedforged.api.client import APIClient
+from cursedforged.api.errors import APIError
+from cursedforged.dependencies import DependencyResolver
+from cursedforged.types import File, FileRelationType, ModLoaderType
+
+from .helpers import FakeSession, file_json, mod_json
+
+REQUIRED = FileRelationType.REQUIRED_DEPENDENCY
+OPTIONAL = FileRelationType.OPTIONAL_DEPENDENCY
+INCOMPATIBLE = FileRelationType.INCOMPATIBLE
+
+
+@dataclass
+class GraphMod:
+    """A mod of `DependencyGraph` with its single 1.20.1 Fabric file."""
+
+    mod_id: int
+    dependencies: list[tuple[int, FileRelationType]] = field(default_factory=list)
+    in_latest_files: bool = True
+    """Whether the file is listed in `latest_files`, otherwise it must be fetched."""
+
+    @property
+    def file_id(self) -> int:
+        return self.mod_id * 100
+
+    def file_json(self) -> dict[str, Any]:
+        return {
+            **file_json(self.file_id, self.mod_id),
+            "dependencies": [
+                {"modId": mod_id, "relationType": int(relation)}
+                for mod_id, relation in self.dependencies
+            ],
+        }
+
+    def mod_json(self) -> dict[str, Any]:
+        index = {
+            "gameVersion": "1.20.1",
+            "fileId": self.file_id,
+            "filename": "file-{}.jar".format(self.file_id),
+            "releaseType": 1,
+            "modLoader": int(ModLoaderType.FABRIC),
+        }
+        return {
+            **mod_json(self.mod_id),
+            "latestFiles": [self.file_json()] if self.in_latest_files else [],
+            "latestFilesIndexes": [index],
+        }
+
+
+class DependencyGraph:
+    """Answers `get_mods` and `get_files` over a set of mods.
+
+    The mod requests of `failing` mod ids fail, so do the file requests of `failing_files` mod ids.
+    """
+
+    def __init__(self, *mods: GraphMod):
+        self.mods = {mod.mod_id: mod for mod in mods}
+        self.failing: set[int] = set()
+        self.failing_files: set[int] = set()
+        self.mod_requests: list[list[int]] = []
+        self.file_requests: list[list[int]] = []
+
+    def __call__(self, method: str, url: str, kwargs: dict[str, Any]) -> tuple[int, Any, dict[str, str]]:
+        path = url.split("/", 3)[3]
+        if path == "v1/mods":
+            mod_ids = kwargs["json"]["modIds"]
+            self.mod_requests.append(mod_ids)
+            if self.failing & set(mod_ids):
+                return 503, {"error": "unavailable"}, {}
+            return 200, {"data": [self.mods[i].mod_json() for i in mod_ids if i in self.mods]}, {}
+        if path == "v1/mods/files":
+            file_ids = kwargs["json"]["fileIds"]
+            self.file_requests.append(file_ids)
+            if self.failing_files & {file_id // 100 for file_id in file_ids}:
+                return 503, {"error": "unavailable"}, {}
+            data = [
+                self.mods[file_id // 100].file_json()
+                for file_id in file_ids
+                if file_id // 100 in self.mods
+            ]
+            return 200, {"data": data}, {}
+        return 404, {"error": path}, {}
+
+
+class DependencyResolverTest(unittest.TestCase):
+    def resolver(self, graph: DependencyGraph, **kwargs: Any) -> DependencyResolver:
+        client = APIClient("key", client=FakeSession(graph))
+        return DependencyResolver(client.v1, "1.20.1", ModLoaderType.FABRIC, **kwargs)
+
+    def test_one_batched_call_per_level(self) -> None:
+        graph = DependencyGraph(
+            GraphMod(1, [(2, REQUIRED), (3, REQUIRED), (9, OPTIONAL)]),
+            GraphMod(2, [(4, REQUIRED)]),
+            GraphMod(3, [(4, REQUIRED)]),
+            GraphMod(4),
+            GraphMod(9),
+        )
+
+        resolution = self.resolver(graph).resolve_mods([1])
+
+        self.assertEqual(graph.mod_requests, [[1], [2, 3], [4]])
+        self.assertEqual(graph.file_requests, [])
+        self.assertEqual(sorted(resolution.files), [1, 2, 3, 4])
+        self.assertEqual(resolution.dependents[4], {2, 3})
+        self.assertEqual(resolution.missing, set())
+
+    def test_optional_dependencies_are_followed_when_asked(self) -> None:
+        graph = DependencyGraph(GraphMod(1, [(9, OPTIONAL)]), GraphMod(9))
+
+        resolution = self.resolver(graph, include_optional=True).resolve_mods([1])
+
+        self.assertEqual(sorted(resolution.files), [1, 9])
+
+    def test_cycles_terminate(self) -> None:
+        graph = DependencyGraph(
+            GraphMod(1, [(2, REQUIRED)]), GraphMod(2, [(3, REQUIRED)]), GraphMod(3, [(1, REQUIRED)])
+        )
+
+        resolution = self.resolver(graph).resolve_mods([1])
+
+        self.assertEqual(sorted(resolution.files), [1, 2, 3])
+        self.assertEqual(graph.mod_requests, [[1], [2], [3]])
+        self.assertEqual(resolution.dependents[1], {3})
+
+    def test_root_files_win_over_selected_files(self) -> None:
+        graph = DependencyGraph(GraphMod(1), GraphMod(2, [(1, REQUIRED), (3, REQUIRED)]), GraphMod(3))
+        pinned = File.model_validate(file_json(42, mod_id=1))
+        dependent = File.model_validate(graph.mods[2].file_json())
+
+        resolution = self.resolver(graph).resolve([pinned, dependent])
+
+        self.assertIs(resolution.files[1], pinned)
+        self.assertEqual(graph.mod_requests, [[3]])
+
+    def test_incompatible_mods_of_the_closure_conflict(self) -> None:
+        graph = DependencyGraph(
+            GraphMod(1, [(2, REQUIRED), (3, REQUIRED)]),
+            GraphMod(2, [(3, INCOMPATIBLE), (5, INCOMPATIBLE)]),
+            GraphMod(3),
+        )
+
+        resolution = self.resolver(graph).resolve_mods([1])
+
+        self.assertEqual(resolution.conflicts, [(2, 3)])
+
+    def test_files_missing_from_latest_files_are_fetched_in_one_call(self) -> None:
+        graph = DependencyGraph(
+            GraphMod(1, [(2, REQUIRED), (3, REQUIRED), (4, REQUIRED)]),
+            GraphMod(2, in_latest_files=False),
+            GraphMod(3, in_latest_files=False),
+            GraphMod(4),
+        )
+
+        resolution = self.resolver(graph).resolve_mods([1])
+
+        self.assertEqual(graph.file_requests, [[200, 300]])
+        self.assertEqual({mod_id: file.id for mod_id, file in resolution.files.items()}, {1: 100, 2: 200, 3: 300, 4: 400})
+
+    def test_unknown_mods_and_unmatched_files_are_missing(self) -> None:
+        graph = DependencyGraph(GraphMod(1, [(2, REQUIRED), (7, REQUIRED)]), GraphMod(2))
+        resolver = self.resolver(graph)
+        resolver.game_version = "1.19.2"
+
+        self.assertEqual(resolver.resolve_mods([1]).missing, {1})
+
+        resolver = self.resolver(graph)
+        self.assertEqual(resolver.resolve_mods([1]).missing, {7})
+
+    def test_failed_chunk_is_reported_and_retried(self) -> None:
+        graph = DependencyGraph(GraphMod(1, [(2, REQUIRED)]), GraphMod(2, [(3, REQUIRED)]), GraphMod(3))
+        graph.failing = {2}
+        resolver = self.resolver(graph)
+
+        resolution = resolver.resolve_mods([1])
+
+        self.assertEqual(sorted(resolution.files), [1])
+        self.assertEqual(resolution.missing, set())
+        self.assertIsInstance(resolution.errors[2], APIError)
+
+        graph.failing = set()
+        resolution = resolver.resolve_mods([1])
+
+        self.assertEqual(sorted(resolution.files), [1, 2, 3])
+        self.assertEqual(resolution.errors, {})
+
+    def test_failed_file_chunk_is_reported_and_retried(self) -> None:
+        graph = DependencyGraph(GraphMod(1, [(2, REQUIRED)]), GraphMod(2, in_latest_files=False))
+        graph.failing_files = {2}
+        resolver = self.resolver(graph)
+
+        resolution = resolver.resolve_mods([1])
+
+        self.assertIsInstance(resolution.errors[2], APIError)
+        self.assertNotIn(2, resolution.missing)
+
+        graph.failing_files = set()
+        self.assertEqual(sorted(resolver.resolve_mods([1]).files), [1, 2])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,134 @@
+import hashlib
+import os
+import shutil
+import tempfile
+import unittest
+from typing import Any
+
+import requests
+from requests.structures import CaseInsensitiveDict
+
+from cursedforged.download import (
+    DownloadError,
+    download_file,
+    download_files,
+    target_path,
+)
+from cursedforged.types import File
+
+from .helpers import file_json
+
+CONTENTS = b"0123456789" * 100
+
+
+def make_file(file_id: int, file_name: str, contents: bytes = CONTENTS) -> File:
+    data = file_json(file_id)
+    data["fileName"] = file_name
+    data["fileLength"] = len(contents)
+    data["hashes"] = [{"value": hashlib.sha1(contents).hexdigest(), "algo": 1}]
+    return File.model_validate(data)
+
+
+class DownloadSession(requests.Session):
+    """A session serving CONTENTS for every url, honouring `Range` requests."""
+
+    def __init__(self, headers: dict[str, str] | None = None):
+        super().__init__()
+        self.extra_headers = headers or {}
+        self.requests: list[tuple[str, dict[str, str]]] = []
+
+    def get(self, url: str | bytes, **kwargs: Any) -> requests.Response:  # type: ignore[override]
+        headers = kwargs.get("headers") or {}
+        self.requests.append((str(url), headers))
+        response = requests.Response()
+        response.url = str(url)
+        body = CONTENTS
+        response.status_code = 200
+        if "Range" in headers:
+            body = CONTENTS[int(headers["Range"][len("bytes=") : -1]) :]
+            response.status_code = 206
+        response.headers = CaseInsensitiveDict({"Content-Length": str(len(body)), **self.extra_headers})
+        response._content = body
+        response._content_consumed = True
+        return response
+
+
+class TargetPathTest(unittest.TestCase):
+    def test_directories_are_stripped_from_the_name(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            for name in ("../../evil.jar", "/etc/evil.jar", "..\\..\\evil.jar", "sub/evil.jar"):
+                with self.subTest(name=name):
+                    path = target_path(make_file(1, name), directory)
+                    self.assertEqual(path, os.path.join(directory, "evil.jar"))
+
+    def test_invalid_names_are_rejected(self) -> None:
+        for name in ("", ".", "..", "../..", "mods/"):
+            with self.subTest(name=name):
+                with self.assertRaises(DownloadError):
+                    target_path(make_file(1, name), "mods")
+
+    def test_symlinks_out_of_the_directory_are_rejected(self) -> None:
+        with tempfile.TemporaryDirectory() as directory, tempfile.TemporaryDirectory() as outside:
+            os.symlink(os.path.join(outside, "evil.jar"), os.path.join(directory, "evil.jar"))
+            with self.assertRaises(DownloadError):
+                target_path(make_file(1, "evil.jar"), directory)
+
+
+class DownloadFileTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory)
+
+    def test_download_requests_identity_encoding(self) -> None:
+        session = DownloadSession()
+
+        path = download_file(make_file(1, "a.jar"), self.directory, session)
+
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), CONTENTS)
+        self.assertEqual(session.requests[0][1], {"Accept-Encoding": "identity"})
+
+    def test_partial_download_is_resumed(self) -> None:
+        with open(os.path.join(self.directory, "a.jar.part"), "wb") as f:
+            f.write(CONTENTS[:300])
+        session = DownloadSession()
+
+        path = download_file(make_file(1, "a.jar"), self.directory, session)
+
+        with open(path, "rb") as f:
+            self.assertEqual(f.read(), CONTENTS)
+        self.assertEqual(
+            session.requests[0][1], {"Accept-Encoding": "identity", "Range": "bytes=300-"}
+        )
+
+    def test_encoded_range_is_not_appended(self) -> None:
+        part_path = os.path.join(self.directory, "a.jar.part")
+        with open(part_path, "wb") as f:
+            f.write(CONTENTS[:300])
+        session = DownloadSession({"Content-Encoding": "gzip"})
+
+        with self.assertRaises(DownloadError):
+            download_file(make_file(1, "a.jar"), self.directory, session)
+        self.assertFalse(os.path.exists(part_path))
+
+    def test_wrong_content_length_is_rejected(self) -> None:
+        session = DownloadSession()
+
+        with self.assertRaises(DownloadError):
+            download_file(make_file(1, "a.jar", CONTENTS + b"!"), self.directory, session)
+
+
+class DownloadFilesTest(unittest.TestCase):
+    def test_clashing_names_are_reported(self) -> None:
+        session = DownloadSession()
+        with tempfile.TemporaryDirectory() as directory:
+            results = download_files(
+                [make_file(1, "a.jar"), make_file(2, "sub/a.jar"), make_file(3, "..")],
+                directory,
+                session=session,
+            )
+
+        self.assertEqual(list(results.paths), [1])
+        self.assertEqual(sorted(results.errors), [2, 3])
+        self.assertIsInstance(results.errors[2], DownloadError)
+        self.assertEqual(len(session.requests), 1)
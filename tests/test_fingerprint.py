@@ -0,0 +1,203 @@
+import io
+import os
+import random
+import tempfile
+import unittest
+from unittest import mock
+
+from cursedforged import fingerprint, fingerprint_index
+from cursedforged.fingerprint import (
+    batch_folder_fingerprints,
+    build_folder_fingerprints,
+    fingerprint_bytes,
+    fingerprint_file,
+    fingerprint_stream,
+    list_files,
+    murmurhash2,
+    normalize,
+)
+from cursedforged.fingerprint_index import FingerprintIndex
+from cursedforged.types import FolderFingerprint
+
+
+def reference_murmurhash2(data: bytes, seed: int = 1) -> int:
+    """The word by word MurmurHash2 of the reference implementation."""
+    m = 0x5BD1E995
+    h = (seed ^ len(data)) & 0xFFFFFFFF
+    end = len(data) - len(data) % 4
+    for i in range(0, end, 4):
+        k = int.from_bytes(data[i : i + 4], "little")
+        k = (k * m) & 0xFFFFFFFF
+        k ^= k >> 24
+        k = (k * m) & 0xFFFFFFFF
+        h = ((h * m) & 0xFFFFFFFF) ^ k
+    tail = data[end:]
+    if len(tail) == 3:
+        h ^= tail[2] << 16
+    if len(tail) >= 2:
+        h ^= tail[1] << 8
+    if len(tail) >= 1:
+        h ^= tail[0]
+        h = (h * m) & 0xFFFFFFFF
+    h ^= h >> 13
+    h = (h * m) & 0xFFFFFFFF
+    h ^= h >> 15
+    return h
+
+
+def random_contents(size: int, seed: int) -> bytes:
+    """Random bytes with plenty of whitespace."""
+    rng = random.Random(seed)
+    alphabet = bytes(range(256)) + b"\t\n\r " * 32
+    return bytes(rng.choice(alphabet) for _ in range(size))
+
+
+class MurmurHash2Test(unittest.TestCase):
+    def test_matches_reference_for_every_tail_length(self) -> None:
+        for size in [*range(0, 70), 255, 256, 1023, 4097]:
+            data = random_contents(size, size)
+            for seed in (0, 1, 0xFFFFFFFF):
+                with self.subTest(size=size, seed=seed):
+                    self.assertEqual(murmurhash2(data, seed), reference_murmurhash2(data, seed))
+
+    def test_matches_reference_across_chunks(self) -> None:
+        data = random_contents(1001, 7)
+        for chunk_size in (4, 8, 12, 20):
+            with self.subTest(chunk_size=chunk_size):
+                with mock.patch.object(fingerprint, "_CHUNK_SIZE", chunk_size):
+                    self.assertEqual(murmurhash2(data), reference_murmurhash2(data))
+
+    def test_high_words_do_not_overflow_into_the_next_lane(self) -> None:
+        data = b"\xff" * 64 + b"\x00\xff" * 33
+        self.assertEqual(murmurhash2(data), reference_murmurhash2(data))
+
+
+class FingerprintTest(unittest.TestCase):
+    def test_whitespace_is_ignored(self) -> None:
+        self.assertEqual(normalize(b"a b\tc\r\nd"), b"abcd")
+        self.assertEqual(fingerprint_bytes(b"a b\tc\r\nd"), fingerprint_bytes(b"abcd"))
+        self.assertEqual(fingerprint_bytes(b" \t\r\n"), reference_murmurhash2(b""))
+
+    def test_stream_matches_bytes(self) -> None:
+        for size in (0, 1, 3, 4, 5, 97, 1000):
+            data = random_contents(size, size)
+            expected = reference_murmurhash2(normalize(data))
+            for chunk_size in (1, 3, 4, 7, 64):
+                with self.subTest(size=size, chunk_size=chunk_size):
+                    stream = io.BytesIO(b"skipped" + data)
+                    stream.seek(7)
+                    self.assertEqual(fingerprint_stream(stream, chunk_size), expected)
+
+    def test_file_matches_bytes_with_and_without_mmap(self) -> None:
+        with tempfile.TemporaryDirectory() as directory:
+            for size in (0, 1, 6, 4099):
+                data = random_contents(size, size)
+                path = os.path.join(directory, "{}.bin".format(size))
+                with open(path, "wb") as f:
+                    f.write(data)
+                expected = reference_murmurhash2(normalize(data))
+                with self.subTest(size=size, mmap=False):
+                    self.assertEqual(fingerprint_file(path), expected)
+                with self.subTest(size=size, mmap=True):
+                    with mock.patch.object(fingerprint, "_MMAP_THRESHOLD", 1):
+                        self.assertEqual(fingerprint_file(path, chunk_size=5), expected)
+
+
+class FolderFingerprintsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.addons = os.path.join(directory.name, "AddOns")
+        contents = {
+            "Alpha/Alpha.lua": b"local a = 1",
+            "Alpha/Copy.lua": b"local  a=1",
+            "Alpha/Locales/enUS.xml": random_contents(300, 1),
+            "Beta/Beta.toc": b"## Title: Beta",
+            "Beta/Beta.lua": random_contents(5000, 2),
+        }
+        for name, data in contents.items():
+            path = os.path.join(self.addons, name)
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(path, "wb") as f:
+                f.write(data)
+        os.makedirs(os.path.join(self.addons, "Empty"))
+        self.folders = [os.path.join(self.addons, name) for name in ("Alpha", "Beta", "Empty")]
+
+    def expected(self, extensions: tuple[str, ...] | None = None) -> list[FolderFingerprint]:
+        """Fingerprint every file of every folder on its own."""
+        return [
+            FolderFingerprint(
+                foldername=os.path.basename(folder),
+                fingerprints=sorted(
+                    {fingerprint_file(path) for path in list_files(folder, extensions, recursive=True)}
+                ),
+            )
+            for folder in self.folders
+        ]
+
+    def test_folders_match_per_file_fingerprints(self) -> None:
+        for max_workers in (1, 2):
+            with self.subTest(max_workers=max_workers):
+                folders = build_folder_fingerprints(self.folders, max_workers=max_workers)
+
+                self.assertEqual(folders, self.expected())
+                self.assertEqual([len(folder.fingerprints) for folder in folders], [2, 2, 0])
+
+    def test_extensions_filter_the_files(self) -> None:
+        folders = build_folder_fingerprints(self.folders, extensions=(".lua",), max_workers=1)
+
+        self.assertEqual(folders, self.expected((".lua",)))
+        self.assertEqual([len(folder.fingerprints) for folder in folders], [1, 1, 0])
+
+    def test_second_run_hits_the_fingerprint_index(self) -> None:
+        index = FingerprintIndex()
+        self.addCleanup(index.close)
+        first = build_folder_fingerprints(self.folders, max_workers=1, index=index)
+        self.assertEqual(first, self.expected())
+
+        with mock.patch.object(
+            fingerprint_index, "fingerprint_files", wraps=fingerprint_index.fingerprint_files
+        ) as hashed:
+            second = build_folder_fingerprints(self.folders, max_workers=1, index=index)
+            hashed.assert_not_called()
+
+            changed = os.path.join(self.addons, "Beta", "Beta.toc")
+            with open(changed, "wb") as f:
+                f.write(b"## Title: Beta 2")
+            third = build_folder_fingerprints(self.folders, max_workers=1, index=index)
+            hashed.assert_called_once_with([os.path.abspath(changed)], 1)
+
+        self.assertEqual(second, first)
+        self.assertEqual(third, self.expected())
+        self.assertIn(fingerprint_bytes(b"## Title: Beta 2"), third[1].fingerprints)
+
+
+class BatchFolderFingerprintsTest(unittest.TestCase):
+    @staticmethod
+    def folders(*sizes: int) -> list[FolderFingerprint]:
+        return [
+            FolderFingerprint(foldername=str(i), fingerprints=list(range(size)))
+            for i, size in enumerate(sizes)
+        ]
+
+    @staticmethod
+    def names(batches: list[list[FolderFingerprint]]) -> list[list[str]]:
+        return [[folder.foldername for folder in batch] for batch in batches]
+
+    def test_batches_hold_at_most_max_folders(self) -> None:
+        batches = batch_folder_fingerprints(self.folders(1, 1, 1, 1, 1), max_folders=2)
+
+        self.assertEqual(self.names(batches), [["0", "1"], ["2", "3"], ["4"]])
+
+    def test_batches_hold_at_most_max_fingerprints(self) -> None:
+        batches = batch_folder_fingerprints(self.folders(4, 5, 1, 6, 0), max_fingerprints=10)
+
+        self.assertEqual(self.names(batches), [["0", "1", "2"], ["3", "4"]])
+
+    def test_oversized_folder_gets_its_own_batch(self) -> None:
+        batches = batch_folder_fingerprints(self.folders(2, 30, 2), max_fingerprints=10)
+
+        self.assertEqual(self.names(batches), [["0"], ["1"], ["2"]])
+
+    def test_no_folders(self) -> None:
+        self.assertEqual(batch_folder_fingerprints([]), [])
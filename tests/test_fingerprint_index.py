@@ -0,0 +1,101 @@
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from cursedforged import fingerprint_index
+from cursedforged.api.client import APIClient
+from cursedforged.fingerprint import fingerprint_bytes
+from cursedforged.fingerprint_index import FingerprintIndex
+
+from .helpers import FakeSession, file_json
+
+
+def matches_json(matched: dict[int, int], unmatched: list[int]) -> dict:
+    exact = []
+    for fingerprint, file_id in matched.items():
+        file = file_json(file_id)
+        file["fileFingerprint"] = fingerprint
+        exact.append({"id": 1, "file": file, "latestFiles": []})
+    return {
+        "data": {
+            "isCacheBuilt": True,
+            "exactMatches": exact,
+            "exactFingerprints": list(matched),
+            "partialMatches": [],
+            "partialMatchFingerprints": {},
+            "additionalProperties": [],
+            "installedFingerprints": [],
+            "unmatchedFingerprints": unmatched,
+        }
+    }
+
+
+class FingerprintIndexMatchTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.known: dict[str, dict[int, int]] = {"v1/fingerprints": {}, "v1/fingerprints/432": {}}
+
+        def handler(method, url, kwargs):
+            known = self.known[url.split("/", 3)[3]]
+            fingerprints = kwargs["json"]["fingerprints"]
+            matched = {fingerprint: known[fingerprint] for fingerprint in fingerprints if fingerprint in known}
+            return 200, matches_json(matched, [f for f in fingerprints if f not in known]), {}
+
+        self.session = FakeSession(handler)
+        self.api = APIClient("key", client=self.session).v1
+        self.index = FingerprintIndex()
+
+    def tearDown(self) -> None:
+        self.index.close()
+
+    def test_known_fingerprints_are_not_requested_again(self) -> None:
+        self.known["v1/fingerprints"] = {11: 110}
+
+        first = self.index.match(self.api, [11, 12])
+        second = self.index.match(self.api, [11, 12])
+
+        self.assertEqual(first[11].file.id, 110)
+        self.assertIsNone(first[12])
+        self.assertEqual(second[11].file.id, 110)
+        self.assertEqual(len(self.session.calls), 1)
+
+    def test_misses_expire_after_miss_ttl(self) -> None:
+        self.index.miss_ttl = 0
+        self.index.match(self.api, [12])
+        self.known["v1/fingerprints"] = {12: 120}
+
+        self.assertEqual(self.index.match(self.api, [12])[12].file.id, 120)
+        self.assertEqual(len(self.session.calls), 2)
+
+    def test_matches_are_kept_per_game(self) -> None:
+        self.known["v1/fingerprints"] = {11: 110}
+
+        self.index.match(self.api, [11])
+        by_game = self.index.match(self.api, [11], game_id=432)
+
+        self.assertIsNone(by_game[11])
+        self.assertEqual(self.index.lookup_matches([11])[11].file.id, 110)
+        self.assertEqual(self.session.calls[-1][1], "https://api.curseforge.com/v1/fingerprints/432")
+
+
+class FingerprintIndexFilesTest(unittest.TestCase):
+    def test_only_new_or_changed_files_are_hashed(self) -> None:
+        index = FingerprintIndex()
+        self.addCleanup(index.close)
+        with tempfile.TemporaryDirectory() as directory:
+            paths = [os.path.join(directory, "{}.jar".format(i)) for i in range(3)]
+            for i, path in enumerate(paths):
+                with open(path, "wb") as f:
+                    f.write(b"contents %d" % i)
+            index.fingerprint(paths)
+            with open(paths[1], "wb") as f:
+                f.write(b"changed contents")
+
+            with mock.patch.object(
+                fingerprint_index, "fingerprint_files", wraps=fingerprint_index.fingerprint_files
+            ) as hashed:
+                fingerprints = index.fingerprint(paths)
+
+            hashed.assert_called_once_with([os.path.abspath(paths[1])], None)
+            self.assertEqual(fingerprints[paths[0]], fingerprint_bytes(b"contents 0"))
+            self.assertEqual(fingerprints[paths[1]], fingerprint_bytes(b"changed contents"))
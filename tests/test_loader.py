@@ -0,0 +1,83 @@
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from cursedforged.api.client import APIClient
+from cursedforged.api.errors import APIError
+from cursedforged.api.loader import BatchLoader, _Batcher
+
+from .helpers import FakeSession, mod_json
+
+
+class BatchLoaderTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.status = 200
+        self.batches: list[list[int]] = []
+        self.lock = threading.Lock()
+        self.session = FakeSession(self.handle)
+        self.client = APIClient("key", client=self.session)
+
+    def handle(self, method: str, url: str, kwargs: dict[str, Any]) -> tuple[int, Any, dict[str, str]]:
+        mod_ids = kwargs["json"]["modIds"]
+        with self.lock:
+            self.batches.append(mod_ids)
+        if self.status != 200:
+            return self.status, {"error": "unavailable"}, {}
+        # Mod 13 does not exist.
+        return 200, {"data": [mod_json(mod_id) for mod_id in mod_ids if mod_id != 13]}, {}
+
+    def test_batches_never_exceed_max_batch_size(self) -> None:
+        loader = BatchLoader(self.client.v1, window=0.05, max_batch_size=5)
+        start = threading.Barrier(16)
+
+        def load(mod_id: int) -> int:
+            if mod_id < 116:
+                start.wait(timeout=5)
+            return loader.get_mod(mod_id).data.id
+
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            futures = [executor.submit(load, mod_id) for mod_id in range(100, 200)]
+            results = [future.result(timeout=5) for future in futures]
+
+        self.assertEqual(results, list(range(100, 200)))
+        self.assertTrue(all(len(batch) <= 5 for batch in self.batches), self.batches)
+        self.assertEqual(sorted(sum(self.batches, [])), results)
+
+    def test_missing_id_raises_not_found(self) -> None:
+        loader = BatchLoader(self.client.v1, window=60, max_batch_size=2)
+
+        found, missing = loader.load_mod(12), loader.load_mod(13)
+
+        self.assertEqual(found.result(timeout=5).id, 12)
+        with self.assertRaises(APIError) as raised:
+            missing.result(timeout=5)
+        self.assertEqual(raised.exception.status_code, 404)
+
+    def test_request_error_reaches_every_caller(self) -> None:
+        self.status = 503
+        loader = BatchLoader(self.client.v1, window=60, max_batch_size=3)
+
+        futures = [loader.load_mod(mod_id) for mod_id in (1, 2, 3)]
+
+        errors = {future.exception(timeout=5) for future in futures}
+        self.assertEqual(len(errors), 1)
+        self.assertIsInstance(errors.pop(), APIError)
+        self.assertEqual(len(self.batches), 1)
+
+
+class BatcherTest(unittest.TestCase):
+    def test_unexpected_error_resolves_the_futures_and_propagates(self) -> None:
+        def fetch(keys: list[int]) -> dict[int, int]:
+            raise RuntimeError("bug")
+
+        batcher: _Batcher[int, int] = _Batcher(fetch, KeyError, window=60, max_batch_size=10)
+        future = batcher.load(1)
+
+        with self.assertRaises(RuntimeError):
+            batcher.flush()
+        self.assertIsInstance(future.exception(timeout=0), RuntimeError)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,205 @@
+import os
+import tempfile
+import unittest
+from typing import Any
+from unittest import mock
+
+from cursedforged import minecraft
+from cursedforged.api.client import APIClient
+from cursedforged.minecraft import MinecraftCatalog
+from cursedforged.types import ModLoaderType
+
+from .helpers import FakeSession
+
+FORGE = ModLoaderType.FORGE
+FABRIC = ModLoaderType.FABRIC
+
+
+def version_json(version_id: int, version_string: str) -> dict[str, Any]:
+    return {
+        "id": version_id,
+        "gameVersionId": version_id,
+        "versionString": version_string,
+        "jarDownloadUrl": "",
+        "jsonDownloadUrl": "",
+        "approved": True,
+        "dateModified": "2024-01-01T00:00:00Z",
+        "gameVersionTypeId": 1,
+        "gameVersionStatus": 1,
+        "gameVersionTypeStatus": 1,
+    }
+
+
+def modloader_json(
+    name: str, game_version: str, type: ModLoaderType, day: int, latest: bool = False, recommended: bool = False
+) -> dict[str, Any]:
+    return {
+        "name": name,
+        "gameVersion": game_version,
+        "latest": latest,
+        "recommended": recommended,
+        "dateModified": "2024-01-{:02d}T00:00:00Z".format(day),
+        "type": int(type),
+    }
+
+
+def modloader_details_json(name: str) -> dict[str, Any]:
+    return {
+        "id": 1,
+        "gameVersionId": 1,
+        "minecraftGameVersionId": 1,
+        "forgeVersion": name,
+        "name": name,
+        "type": int(FORGE),
+        "downloadUrl": "",
+        "filename": "{}.jar".format(name),
+        "installMethod": 1,
+        "latest": False,
+        "recommended": False,
+        "approved": True,
+        "dateModified": "2024-01-01T00:00:00Z",
+        "mavenVersionString": name,
+        "versionJson": '{"id": "%s"}' % name,
+        "librariesInstallLocation": "",
+        "minecraftVersion": "1.20.1",
+        "additionalFilesJson": "",
+        "modLoaderGameVersionId": 1,
+        "modLoaderGameVersionTypeId": 1,
+        "modLoaderGameVersionStatus": 1,
+        "modLoaderGameVersionTypeStatus": 1,
+        "mcGameVersionId": 1,
+        "mcGameVersionTypeId": 1,
+        "mcGameVersionStatus": 1,
+        "mcGameVersionTypeStatus": 1,
+    }
+
+
+class MinecraftCatalogTest(unittest.TestCase):
+    def setUp(self) -> None:
+        directory = tempfile.TemporaryDirectory()
+        self.addCleanup(directory.cleanup)
+        self.path = os.path.join(directory.name, "minecraft.db")
+        self.now = 1_000_000.0
+        clock = mock.patch.object(minecraft, "time", mock.Mock(time=lambda: self.now))
+        clock.start()
+        self.addCleanup(clock.stop)
+
+        self.modloaders = [
+            modloader_json("forge-47.2.0", "1.20.1", FORGE, 2, recommended=True),
+            modloader_json("forge-47.2.20", "1.20.1", FORGE, 5, latest=True),
+            modloader_json("forge-47.1.0", "1.20.1", FORGE, 1),
+            modloader_json("fabric-0.14.21", "1.20.1", FABRIC, 3),
+            modloader_json("fabric-0.15.0", "1.20.1", FABRIC, 4),
+            modloader_json("forge-43.3.0", "1.19.2", FORGE, 1, latest=True),
+        ]
+        self.paths: list[str] = []
+        self.catalogs: list[MinecraftCatalog] = []
+        self.session = FakeSession(self.handle)
+        self.client = APIClient("key", client=self.session)
+
+    def handle(self, method: str, url: str, kwargs: dict[str, Any]) -> tuple[int, Any, dict[str, str]]:
+        path = url.split("/", 3)[3]
+        self.paths.append(path)
+        self.assertFalse(any(catalog._lock.locked() for catalog in self.catalogs), path)
+        if path == "v1/minecraft/version":
+            return 200, {"data": [version_json(1, "1.19.2"), version_json(2, "1.20.1")]}, {}
+        if path == "v1/minecraft/modloader":
+            return 200, {"data": self.modloaders}, {}
+        name = path.rsplit("/", 1)[1]
+        return 200, {"data": modloader_details_json(name)}, {}
+
+    def catalog(self, **kwargs: Any) -> MinecraftCatalog:
+        catalog = MinecraftCatalog(self.client.v1, self.path, ttl=3600, **kwargs)
+        self.addCleanup(catalog.close)
+        self.catalogs.append(catalog)
+        return catalog
+
+    def test_lists_are_loaded_once(self) -> None:
+        catalog = self.catalog()
+
+        self.assertEqual([version.version_string for version in catalog.versions()], ["1.19.2", "1.20.1"])
+        self.assertEqual(catalog.version("1.20.1").id, 2)  # type: ignore[union-attr]
+        self.assertIsNone(catalog.version("1.21"))
+        self.assertEqual(len(catalog.modloaders()), 6)
+        self.assertEqual(self.paths, ["v1/minecraft/version", "v1/minecraft/modloader"])
+
+    def test_lists_persist_across_instances_until_they_expire(self) -> None:
+        self.catalog().refresh()
+        self.now += 3000
+
+        self.assertEqual(len(self.catalog().modloaders(mod_loader_type=FABRIC)), 2)
+        self.assertEqual(len(self.paths), 2)
+
+        # Stored 3601 seconds ago, the lists expired.
+        self.now += 601
+        self.assertEqual(len(self.catalog().versions()), 2)
+        self.assertEqual(len(self.paths), 4)
+
+    def test_lists_expire_in_memory(self) -> None:
+        catalog = self.catalog()
+        catalog.refresh()
+        self.modloaders = self.modloaders[:1]
+
+        self.now += 3600
+        self.assertEqual(len(catalog.modloaders()), 6)
+        self.now += 1
+        self.assertEqual(len(catalog.modloaders()), 1)
+        self.assertEqual(len(self.paths), 4)
+
+    def test_force_fetches_fresh_lists(self) -> None:
+        catalog = self.catalog()
+        catalog.refresh()
+        self.modloaders = self.modloaders[:1]
+
+        catalog.refresh(force=True)
+
+        self.assertEqual(len(catalog.modloaders()), 1)
+        self.assertEqual(len(self.paths), 4)
+        # The forced fetch replaced the stored lists too.
+        self.assertEqual(len(self.catalog().modloaders()), 1)
+        self.assertEqual(len(self.paths), 4)
+
+    def test_modloaders_by_game_version_and_type(self) -> None:
+        catalog = self.catalog()
+
+        self.assertEqual(
+            [modloader.name for modloader in catalog.modloaders("1.20.1", FORGE)],
+            ["forge-47.2.0", "forge-47.2.20", "forge-47.1.0"],
+        )
+        self.assertEqual([modloader.name for modloader in catalog.modloaders("1.19.2")], ["forge-43.3.0"])
+        self.assertEqual(catalog.modloaders("1.19.2", FABRIC), [])
+
+    def test_recommended_falls_back_to_latest(self) -> None:
+        catalog = self.catalog()
+
+        self.assertEqual(catalog.recommended("1.20.1", FORGE).name, "forge-47.2.0")  # type: ignore[union-attr]
+        self.assertEqual(catalog.latest("1.20.1", FORGE).name, "forge-47.2.20")  # type: ignore[union-attr]
+        self.assertEqual(catalog.recommended("1.19.2", FORGE).name, "forge-43.3.0")  # type: ignore[union-attr]
+        # Without a latest flag, the most recently modified one is the latest.
+        self.assertEqual(catalog.recommended("1.20.1", FABRIC).name, "fabric-0.15.0")  # type: ignore[union-attr]
+        self.assertIsNone(catalog.recommended("1.18.2", FORGE))
+        self.assertIsNone(catalog.latest("1.18.2", FORGE))
+
+    def test_modloader_details_are_fetched_once_and_persisted(self) -> None:
+        catalog = self.catalog()
+
+        details = catalog.modloader_details(["forge-47.2.0", "forge-47.1.0", "forge-47.2.0"])
+
+        self.assertEqual(list(details), ["forge-47.2.0", "forge-47.1.0"])
+        self.assertEqual(details["forge-47.1.0"].version_data, {"id": "forge-47.1.0"})
+        self.assertEqual(
+            sorted(self.paths),
+            ["v1/minecraft/modloader/forge-47.1.0", "v1/minecraft/modloader/forge-47.2.0"],
+        )
+
+        self.assertEqual(catalog.modloader_detail("forge-47.2.0").name, "forge-47.2.0")
+        self.assertEqual(self.catalog().modloader_detail("forge-47.1.0").name, "forge-47.1.0")
+        self.assertEqual(len(self.paths), 2)
+
+        self.now += 3601
+        self.catalog().modloader_detail("forge-47.1.0")
+        self.assertEqual(len(self.paths), 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,257 @@
+import asyncio
+import threading
+import time
+import unittest
+from datetime import datetime, timedelta, timezone
+from typing import Any
+
+from cursedforged.api.client import APIClient
+from cursedforged.api.pagination import (
+    afetch_all_pages,
+    aiter_pages,
+    fetch_all_pages,
+    iter_pages,
+)
+from cursedforged.types import SearchModsResponse
+
+from .helpers import CatalogMod, FakeCatalog, FakeSession, results_window
+
+
+def catalog(count: int, window: int = 10_000) -> FakeCatalog:
+    """Build a catalog whose search results are ordered by mod id."""
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    mods = [CatalogMod(mod_id, (start - timedelta(minutes=mod_id)).isoformat()) for mod_id in range(count)]
+    return FakeCatalog(mods, {6: [1]}, window=window)
+
+
+class Pages:
+    """Fetches `search_mods` pages from a catalog, recording the requested `(index, page_size)` pairs."""
+
+    def __init__(self, count: int, window: int = 10_000):
+        self.client = APIClient("key", client=FakeSession(catalog(count, window)))
+        self.requests: list[tuple[int, int]] = []
+        self.lock = threading.Lock()
+
+    def __call__(self, index: int, page_size: int) -> SearchModsResponse:
+        with self.lock:
+            self.requests.append((index, page_size))
+        return self.client.v1.search_mods(432, index=index, page_size=page_size)
+
+    async def fetch(self, index: int, page_size: int) -> SearchModsResponse:
+        return self(index, page_size)
+
+
+def mod_ids(pages: Any) -> list[int]:
+    return [mod.id for page in pages for mod in page.data]
+
+
+class IterPagesTest(unittest.TestCase):
+    def test_pages_in_order_until_a_short_page(self) -> None:
+        for prefetch in (True, False):
+            with self.subTest(prefetch=prefetch):
+                pages = Pages(120)
+
+                self.assertEqual(mod_ids(iter_pages(pages, prefetch=prefetch)), list(range(120)))
+                self.assertEqual(pages.requests, [(0, 50), (50, 50), (100, 50)])
+
+    def test_exact_multiple_of_the_page_size_stops_without_an_empty_page(self) -> None:
+        pages = Pages(100)
+
+        self.assertEqual(mod_ids(iter_pages(pages)), list(range(100)))
+        self.assertEqual(pages.requests, [(0, 50), (50, 50)])
+
+    def test_empty_page_stops(self) -> None:
+        pages = Pages(0)
+
+        self.assertEqual(mod_ids(iter_pages(pages)), [])
+        self.assertEqual(pages.requests, [(0, 50)])
+
+    def test_result_window_clamps_the_last_page(self) -> None:
+        with results_window(120):
+            pages = Pages(300, window=120)
+
+            self.assertEqual(mod_ids(iter_pages(pages, page_size=40, start_index=10)), list(range(10, 120)))
+            self.assertEqual(pages.requests, [(10, 40), (50, 40), (90, 30)])
+
+            self.assertEqual(list(iter_pages(pages, start_index=120)), [])
+            self.assertEqual(len(pages.requests), 3)
+
+    def test_page_size_is_capped(self) -> None:
+        pages = Pages(60)
+
+        self.assertEqual(mod_ids(iter_pages(pages, page_size=500)), list(range(60)))
+        self.assertEqual(pages.requests, [(0, 50), (50, 50)])
+
+    def test_next_page_is_requested_while_the_current_one_is_consumed(self) -> None:
+        pages = Pages(120)
+        iterator = iter_pages(pages)
+
+        first = next(iterator)
+        deadline = time.monotonic() + 5
+        while len(pages.requests) < 2 and time.monotonic() < deadline:
+            time.sleep(0.001)
+
+        self.assertEqual([mod.id for mod in first.data], list(range(50)))
+        self.assertEqual(pages.requests, [(0, 50), (50, 50)])
+        self.assertEqual(mod_ids([first, *iterator]), list(range(120)))
+
+    def test_prefetched_pages_keep_their_order(self) -> None:
+        def fetch_page(index: int, page_size: int) -> SearchModsResponse:
+            # The later the page, the faster it is fetched.
+            time.sleep((150 - index) / 10_000)
+            return pages(index, page_size)
+
+        pages = Pages(150)
+
+        self.assertEqual(mod_ids(iter_pages(fetch_page, page_size=10)), list(range(150)))
+
+    def test_without_prefetch_pages_are_requested_on_demand(self) -> None:
+        pages = Pages(120)
+        iterator = iter_pages(pages, prefetch=False)
+
+        first = next(iterator)
+        time.sleep(0.01)
+        self.assertEqual(pages.requests, [(0, 50)])
+        second = next(iterator)
+        self.assertEqual(pages.requests, [(0, 50), (50, 50)])
+        self.assertEqual(mod_ids([first, second, *iterator]), list(range(120)))
+
+
+class AsyncIterPagesTest(unittest.IsolatedAsyncioTestCase):
+    async def test_pages_in_order_until_a_short_page(self) -> None:
+        for prefetch in (True, False):
+            with self.subTest(prefetch=prefetch):
+                pages = Pages(120)
+
+                result = [page async for page in aiter_pages(pages.fetch, prefetch=prefetch)]
+
+                self.assertEqual(mod_ids(result), list(range(120)))
+                self.assertEqual(pages.requests, [(0, 50), (50, 50), (100, 50)])
+
+    async def test_result_window_clamps_the_last_page(self) -> None:
+        with results_window(120):
+            pages = Pages(300, window=120)
+
+            result = [page async for page in aiter_pages(pages.fetch, page_size=40, start_index=10)]
+
+            self.assertEqual(mod_ids(result), list(range(10, 120)))
+            self.assertEqual(pages.requests, [(10, 40), (50, 40), (90, 30)])
+
+    async def test_next_page_is_requested_while_the_current_one_is_consumed(self) -> None:
+        pages = Pages(120)
+        iterator = aiter_pages(pages.fetch)
+
+        first = await anext(iterator)
+        await asyncio.sleep(0)
+
+        self.assertEqual([mod.id for mod in first.data], list(range(50)))
+        self.assertEqual(pages.requests, [(0, 50), (50, 50)])
+        self.assertEqual(mod_ids([first] + [page async for page in iterator]), list(range(120)))
+
+    async def test_prefetched_pages_keep_their_order(self) -> None:
+        pages = Pages(150)
+
+        async def fetch_page(index: int, page_size: int) -> SearchModsResponse:
+            await asyncio.sleep((150 - index) / 10_000)
+            return pages(index, page_size)
+
+        result = [page async for page in aiter_pages(fetch_page, page_size=10)]
+
+        self.assertEqual(mod_ids(result), list(range(150)))
+
+
+class FetchAllPagesTest(unittest.TestCase):
+    def test_pages_are_merged(self) -> None:
+        pages = Pages(120)
+
+        merged = fetch_all_pages(pages)
+
+        self.assertEqual([mod.id for mod in merged.data], list(range(120)))
+        self.assertEqual(merged.pagination.index, 0)
+        self.assertEqual(merged.pagination.page_size, 120)
+        self.assertEqual(merged.pagination.result_count, 120)
+        self.assertEqual(merged.pagination.total_count, 120)
+        self.assertEqual(pages.requests[0], (0, 50))
+        self.assertEqual(sorted(pages.requests[1:]), [(50, 50), (100, 50)])
+
+    def test_single_page_is_returned_as_is(self) -> None:
+        pages = Pages(30)
+
+        merged = fetch_all_pages(pages)
+
+        self.assertEqual(merged.pagination.page_size, 50)
+        self.assertEqual(merged.pagination.result_count, 30)
+        self.assertEqual(pages.requests, [(0, 50)])
+
+    def test_result_window_clamps_the_last_page(self) -> None:
+        with results_window(120):
+            pages = Pages(300, window=120)
+
+            merged = fetch_all_pages(pages, page_size=50)
+
+        self.assertEqual([mod.id for mod in merged.data], list(range(120)))
+        self.assertEqual(merged.pagination.total_count, 300)
+        self.assertEqual(sorted(pages.requests), [(0, 50), (50, 50), (100, 20)])
+
+    def test_concurrency_is_bounded(self) -> None:
+        running = 0
+        peak = 0
+        lock = threading.Lock()
+        pages = Pages(500)
+
+        def fetch_page(index: int, page_size: int) -> SearchModsResponse:
+            nonlocal running, peak
+            with lock:
+                running += 1
+                peak = max(peak, running)
+            time.sleep(0.005)
+            with lock:
+                running -= 1
+            return pages(index, page_size)
+
+        merged = fetch_all_pages(fetch_page, page_size=10, max_concurrency=3)
+
+        self.assertEqual([mod.id for mod in merged.data], list(range(500)))
+        self.assertLessEqual(peak, 3)
+
+
+class AsyncFetchAllPagesTest(unittest.IsolatedAsyncioTestCase):
+    async def test_pages_are_merged(self) -> None:
+        pages = Pages(120)
+
+        merged = await afetch_all_pages(pages.fetch)
+
+        self.assertEqual([mod.id for mod in merged.data], list(range(120)))
+        self.assertEqual(merged.pagination.result_count, 120)
+        self.assertEqual(sorted(pages.requests), [(0, 50), (50, 50), (100, 50)])
+
+    async def test_result_window_clamps_the_last_page(self) -> None:
+        with results_window(120):
+            pages = Pages(300, window=120)
+
+            merged = await afetch_all_pages(pages.fetch)
+
+        self.assertEqual([mod.id for mod in merged.data], list(range(120)))
+        self.assertEqual(sorted(pages.requests), [(0, 50), (50, 50), (100, 20)])
+
+    async def test_concurrency_is_bounded(self) -> None:
+        running = 0
+        peak = 0
+        pages = Pages(500)
+
+        async def fetch_page(index: int, page_size: int) -> SearchModsResponse:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.001)
+            running -= 1
+            return pages(index, page_size)
+
+        merged = await afetch_all_pages(fetch_page, page_size=10, max_concurrency=3)
+
+        self.assertEqual([mod.id for mod in merged.data], list(range(500)))
+        self.assertEqual(peak, 3)
+
+
+if __name__ == "__main__":
+    unittest.main()
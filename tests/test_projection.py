@@ -0,0 +1,97 @@
+import unittest
+
+from cursedforged.types import (
+    GetModResponse,
+    GetModsResponse,
+    Mod,
+    SearchModsResponse,
+    project,
+    project_instance,
+    project_response,
+)
+
+from .helpers import mod_json
+
+
+class ProjectTest(unittest.TestCase):
+    def test_only_the_kept_fields_are_parsed(self) -> None:
+        projected = project(Mod, ["id", "game_id", "date_modified"])
+
+        # The fields left out are never read, so they may even be invalid.
+        mod = projected.model_validate({**mod_json(1), "latestFiles": "invalid", "links": None})
+
+        self.assertIsInstance(mod, Mod)
+        self.assertEqual((mod.id, mod.game_id), (1, 432))
+        self.assertEqual(mod.date_modified, Mod.model_validate(mod_json(1)).date_modified)
+        self.assertIsNone(mod.latest_files)
+        self.assertIsNone(mod.links)
+
+    def test_fields_are_read_from_their_alias_only(self) -> None:
+        projected = project(Mod, ["game_popularity_rank", "summary"])
+
+        mod = projected.model_validate({"gamePopularityRank": 5, "summary": "s", "game_popularity_rank": 9})
+
+        self.assertEqual((mod.game_popularity_rank, mod.summary), (5, "s"))
+
+    def test_fields_left_out_are_excluded_from_dumps_and_repr(self) -> None:
+        mod = project(Mod, ["id", "game_id"]).model_validate(mod_json(1))
+
+        self.assertEqual(mod.model_dump(), {"id": 1, "game_id": 432})
+        self.assertEqual(mod.model_dump(by_alias=True), {"id": 1, "gameId": 432})
+        self.assertEqual(mod.model_dump_json(by_alias=True), '{"id":1,"gameId":432}')
+        self.assertNotIn("summary", repr(mod))
+
+    def test_projections_are_cached(self) -> None:
+        self.assertIs(project(Mod, ["id", "name"]), project(Mod, ("name", "id")))
+        self.assertIsNot(project(Mod, ["id", "name"]), project(Mod, ["id"]))
+
+    def test_unknown_fields_raise(self) -> None:
+        with self.assertRaises(ValueError):
+            project(Mod, ["id", "gameId"])
+
+    def test_project_instance(self) -> None:
+        mod = Mod.model_validate(mod_json(1))
+
+        projected = project_instance(mod, ["id", "game_popularity_rank"])
+
+        self.assertIs(project_instance(mod, None), mod)
+        self.assertIs(type(projected), project(Mod, ["id", "game_popularity_rank"]))
+        self.assertEqual(projected, project(Mod, ["id", "game_popularity_rank"]).model_validate(mod_json(1)))
+        self.assertIsNone(projected.name)
+
+
+class ProjectResponseTest(unittest.TestCase):
+    def test_without_fields_the_response_model_is_kept(self) -> None:
+        self.assertIs(project_response(GetModsResponse, Mod, None), GetModsResponse)
+
+    def test_list_data(self) -> None:
+        response = project_response(SearchModsResponse, Mod, ["id", "name"]).model_validate(
+            {
+                "data": [mod_json(1), {**mod_json(2), "links": "invalid"}],
+                "pagination": {"index": 0, "pageSize": 50, "resultCount": 2, "totalCount": 2},
+            }
+        )
+
+        self.assertIsInstance(response, SearchModsResponse)
+        self.assertEqual([(mod.id, mod.name) for mod in response.data], [(1, "Mod 1"), (2, "Mod 2")])
+        self.assertTrue(all(type(mod) is project(Mod, ["id", "name"]) for mod in response.data))
+        self.assertEqual(response.pagination.total_count, 2)
+        self.assertEqual(
+            response.model_dump(by_alias=True)["data"], [{"id": 1, "name": "Mod 1"}, {"id": 2, "name": "Mod 2"}]
+        )
+
+    def test_single_data(self) -> None:
+        response = project_response(GetModResponse, Mod, ["slug"]).model_validate({"data": mod_json(3)})
+
+        self.assertIsInstance(response, GetModResponse)
+        self.assertEqual(response.data.slug, "mod-3")
+        self.assertIsNone(response.data.id)
+
+    def test_responses_are_cached(self) -> None:
+        self.assertIs(
+            project_response(GetModsResponse, Mod, ["id"]), project_response(GetModsResponse, Mod, {"id"})
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,167 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest import mock
+
+import requests
+
+from cursedforged.api.client import APIClient
+from cursedforged.api.errors import APIError, RateLimitError, parse_retry_after
+from cursedforged.api.ratelimit import RateLimiter, RetryPolicy
+
+from .helpers import FakeSession
+
+
+def scripted(*answers):
+    """A handler answering with each status code, or raising each exception, in turn."""
+    remaining = list(answers)
+
+    def handler(method, url, kwargs):
+        answer = remaining.pop(0) if len(remaining) > 1 else remaining[0]
+        if isinstance(answer, Exception):
+            raise answer
+        status_code, headers = answer if isinstance(answer, tuple) else (answer, {})
+        return status_code, {"data": status_code}, headers
+
+    return handler
+
+
+class RetryTest(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = mock.patch("time.sleep")
+        self.sleep = patcher.start()
+        self.addCleanup(patcher.stop)
+        # Always pick the upper bound of the jittered delay.
+        patcher = mock.patch("cursedforged.api.ratelimit.random.uniform", side_effect=lambda a, b: b)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def client(self, handler, **kwargs) -> tuple[APIClient, FakeSession]:
+        session = FakeSession(handler)
+        return APIClient("key", client=session, coalesce=False, **kwargs), session
+
+    def delays(self) -> list[float]:
+        return [call.args[0] for call in self.sleep.call_args_list]
+
+    def test_transient_errors_are_retried_with_backoff(self) -> None:
+        client, session = self.client(scripted(503, 502, 200), retry=RetryPolicy(backoff_factor=0.5))
+
+        self.assertEqual(client.get("v1/games"), {"data": 200})
+        self.assertEqual(len(session.calls), 3)
+        self.assertEqual(self.delays(), [0.5, 1.0])
+
+    def test_backoff_is_capped(self) -> None:
+        client, _ = self.client(scripted(500), retry=RetryPolicy(4, backoff_factor=1, max_backoff=3))
+
+        with self.assertRaises(APIError):
+            client.get("v1/games")
+        self.assertEqual(self.delays(), [1, 2, 3, 3])
+
+    def test_retries_are_bounded(self) -> None:
+        client, session = self.client(scripted(500), retry=RetryPolicy(max_retries=2))
+
+        with self.assertRaises(APIError) as raised:
+            client.get("v1/games")
+        self.assertEqual(raised.exception.status_code, 500)
+        self.assertEqual(len(session.calls), 3)
+
+    def test_other_errors_are_not_retried(self) -> None:
+        client, session = self.client(scripted(404), retry=RetryPolicy())
+
+        with self.assertRaises(APIError) as raised:
+            client.get("v1/mods/1")
+        self.assertEqual(raised.exception.status_code, 404)
+        self.assertEqual(len(session.calls), 1)
+
+    def test_without_policy_nothing_is_retried(self) -> None:
+        client, session = self.client(scripted(503, 200))
+
+        with self.assertRaises(APIError):
+            client.get("v1/games")
+        self.assertEqual(len(session.calls), 1)
+
+    def test_connection_errors_are_retried(self) -> None:
+        client, session = self.client(scripted(requests.ConnectionError(), 200), retry=RetryPolicy())
+
+        self.assertEqual(client.get("v1/games"), {"data": 200})
+        self.assertEqual(len(session.calls), 2)
+
+    def test_retry_after_takes_precedence(self) -> None:
+        client, _ = self.client(
+            scripted((503, {"Retry-After": "7"}), 200), retry=RetryPolicy(backoff_factor=0)
+        )
+
+        client.get("v1/games")
+        self.assertEqual(self.delays(), [7])
+
+    def test_retry_after_is_not_cut_short_by_max_backoff(self) -> None:
+        client, _ = self.client(
+            scripted((429, {"Retry-After": "50"}), 200),
+            retry=RetryPolicy(backoff_factor=0.5, max_backoff=60),
+        )
+
+        client.get("v1/games")
+        self.assertEqual(self.delays(), [50.5])
+
+    def test_retry_after_beyond_max_backoff_raises(self) -> None:
+        client, session = self.client(
+            scripted((429, {"Retry-After": "120"}), 200), retry=RetryPolicy(max_backoff=60)
+        )
+
+        with self.assertRaises(RateLimitError) as raised:
+            client.get("v1/games")
+        self.assertEqual(raised.exception.retry_after, 120)
+        self.assertEqual(len(session.calls), 1)
+        self.assertEqual(self.delays(), [])
+
+    def test_rate_limited_requests_pause_the_limiter(self) -> None:
+        limiter = RateLimiter(rate=10)
+        client, session = self.client(
+            scripted((429, {"Retry-After": "2"}), 200),
+            retry=RetryPolicy(backoff_factor=0),
+            rate_limiter=limiter,
+        )
+
+        with mock.patch.object(limiter, "pause", wraps=limiter.pause) as pause:
+            self.assertEqual(client.get("v1/games"), {"data": 200})
+        pause.assert_called_once_with(2)
+        self.assertEqual(len(session.calls), 2)
+        # The second attempt waited for the pause, then for its own token at 10 per second.
+        self.assertEqual(len(self.delays()), 1)
+        self.assertAlmostEqual(self.delays()[0], 2.1, delta=0.05)
+
+    def test_exhausted_rate_limit_raises_rate_limit_error(self) -> None:
+        client, _ = self.client(
+            scripted((429, {"Retry-After": "1"})), retry=RetryPolicy(max_retries=1)
+        )
+
+        with self.assertRaises(RateLimitError) as raised:
+            client.get("v1/games")
+        self.assertEqual(raised.exception.retry_after, 1)
+
+
+class RateLimiterTest(unittest.TestCase):
+    def test_tokens_beyond_the_burst_wait(self) -> None:
+        limiter = RateLimiter(rate=10, burst=2)
+
+        self.assertEqual(limiter._reserve(), 0)
+        self.assertEqual(limiter._reserve(), 0)
+        self.assertAlmostEqual(limiter._reserve(), 0.1, places=2)
+        self.assertAlmostEqual(limiter._reserve(), 0.2, places=2)
+
+
+class ParseRetryAfterTest(unittest.TestCase):
+    def test_seconds(self) -> None:
+        self.assertEqual(parse_retry_after("120"), 120)
+        self.assertEqual(parse_retry_after("1.5"), 1.5)
+        self.assertEqual(parse_retry_after("-3"), 0)
+
+    def test_http_date(self) -> None:
+        date = datetime.now(timezone.utc) + timedelta(seconds=30)
+        self.assertAlmostEqual(parse_retry_after(format_datetime(date, usegmt=True)), 30, delta=2)
+        self.assertEqual(parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT"), 0)
+
+    def test_missing_or_invalid(self) -> None:
+        self.assertIsNone(parse_retry_after(None))
+        self.assertIsNone(parse_retry_after(""))
+        self.assertIsNone(parse_retry_after("soon"))
@@ -0,0 +1,246 @@
+import random
+import unittest
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable
+
+from cursedforged.api.client import APIClient
+from cursedforged.search_index import ModSearchIndex, tokenize
+from cursedforged.types import Mod, ModLoaderType, ModsSearchSortField, SortOrder
+
+from .helpers import CatalogMod, FakeCatalog, FakeSession
+
+WORDS = ["storage", "stone", "storm", "iron", "chest", "magic", "tech", "farm", "Drawers"]
+VERSIONS = {1: ["1.19.2", "1.20.1"], 2: ["1.20.9", "1.20.10"]}
+LOADERS = [ModLoaderType.FORGE, ModLoaderType.FABRIC, ModLoaderType.QUILT]
+AUTHORS = [(1, "Alice"), (2, "bob"), (3, "Carol Storms"), (4, "dave")]
+
+REFERENCE_KEYS: dict[ModsSearchSortField, Callable[[Mod], Any]] = {
+    ModsSearchSortField.FEATURED: lambda mod: (mod.is_featured, -mod.game_popularity_rank),
+    ModsSearchSortField.POPULARITY: lambda mod: -mod.game_popularity_rank,
+    ModsSearchSortField.LAST_UPDATED: lambda mod: mod.date_modified,
+    ModsSearchSortField.NAME: lambda mod: mod.name.lower(),
+    ModsSearchSortField.AUTHOR: lambda mod: mod.authors[0].name.lower() if mod.authors else "",
+    ModsSearchSortField.TOTAL_DOWNLOADS: lambda mod: mod.download_count,
+    ModsSearchSortField.CATEGORY: lambda mod: mod.categories[0].name.lower(),
+    ModsSearchSortField.GAME_VERSION: lambda mod: max(
+        (tuple(map(int, index.game_version.split("."))) for index in mod.latest_files_indexes),
+        default=(),
+    ),
+    ModsSearchSortField.EARLY_ACCESS: lambda mod: (False, mod.date_modified),
+    ModsSearchSortField.FEATURED_RELEASED: lambda mod: (mod.is_featured, mod.date_released),
+    ModsSearchSortField.RELEASED_DATE: lambda mod: mod.date_released,
+    ModsSearchSortField.RATING: lambda mod: mod.rating if mod.rating is not None else float("-inf"),
+}
+
+
+def catalog_mods(count: int) -> list[CatalogMod]:
+    """Build varied mods, with ties on every sort field."""
+    rng = random.Random(7)
+    start = datetime(2024, 1, 1, tzinfo=timezone.utc)
+    mods = []
+    for mod_id in range(1, count + 1):
+        type_id = rng.choice(list(VERSIONS))
+        mods.append(
+            CatalogMod(
+                mod_id,
+                (start + timedelta(days=rng.randrange(30))).isoformat(),
+                class_id=rng.choice([6, 12]),
+                category_id=rng.choice([1, 2, 3]),
+                game_versions={type_id: rng.sample(VERSIONS[type_id], rng.randint(0, 2))},
+                loaders=[int(loader) for loader in rng.sample(LOADERS, rng.randint(0, 2))],
+                name=" ".join(rng.sample(WORDS, 2)),
+                summary=" ".join(rng.sample(WORDS, rng.randint(0, 3))),
+                authors=rng.sample(AUTHORS, rng.randint(0, 2)),
+                download_count=rng.randrange(5) * 1000,
+                popularity_rank=rng.randrange(1, 20),
+                is_featured=rng.random() < 0.2,
+                rating=rng.choice([None, 2.5, 4.0, 5.0]),
+            )
+        )
+    return mods
+
+
+def matches(mod: Mod, **filters: Any) -> bool:
+    """Tell whether a mod matches the filters of `search_mods`, by scanning it."""
+    indexes = mod.latest_files_indexes
+    versions = filters.get("game_versions")
+    loaders = filters.get("mod_loader_types")
+    text = " ".join([mod.name, mod.summary, *(author.name for author in mod.authors)])
+    tokens = tokenize(text)
+    return (
+        mod.game_id == 432
+        and filters.get("class_id") in (None, mod.class_id)
+        and (
+            filters.get("category_ids") is None
+            or any(category.id in filters["category_ids"] for category in mod.categories)
+        )
+        and (
+            (versions is None and loaders is None)
+            or any(
+                (versions is None or index.game_version in versions)
+                and (loaders is None or index.mod_loader in loaders)
+                for index in indexes
+            )
+        )
+        and (
+            filters.get("game_version_type_id") is None
+            or any(index.game_version_type_id == filters["game_version_type_id"] for index in indexes)
+        )
+        and (
+            filters.get("author_id") is None
+            or any(author.id == filters["author_id"] for author in mod.authors)
+        )
+        and (
+            filters.get("primary_author_id") is None
+            or (bool(mod.authors) and mod.authors[0].id == filters["primary_author_id"])
+        )
+        and all(
+            any(token.startswith(prefix) for token in tokens)
+            for prefix in tokenize(filters.get("search_filter") or "")
+        )
+    )
+
+
+class ModSearchIndexTest(unittest.TestCase):
+    mods: list[Mod]
+    index: ModSearchIndex
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        catalog = FakeCatalog(catalog_mods(150), {6: [1, 2, 3], 12: [1, 2, 3]})
+        client = APIClient("key", client=FakeSession(catalog))
+        cls.mods = client.v1.search_mods_all(432).data
+        cls.index = ModSearchIndex(cls.mods)
+
+    def expected(
+        self,
+        sort_field: ModsSearchSortField,
+        descending: bool,
+        **filters: Any,
+    ) -> list[int]:
+        key = REFERENCE_KEYS[sort_field]
+        found = [mod for mod in self.mods if matches(mod, **filters)]
+        found.sort(key=lambda mod: (key(mod), mod.id), reverse=descending)
+        return [mod.id for mod in found]
+
+    def search(self, **kwargs: Any) -> list[int]:
+        return [mod.id for mod in self.index.search_mods(432, page_size=None, **kwargs).data]
+
+    def test_every_mod_is_indexed(self) -> None:
+        self.assertEqual(len(self.index), 150)
+        self.assertEqual(len(self.search()), 150)
+
+    def test_every_sort_order_in_both_directions(self) -> None:
+        # No filter walks the precomputed order, a narrow filter sorts the few matches.
+        for filters in ({}, {"category_ids": [2], "class_id": 12, "author_id": 3}):
+            for sort_field in ModsSearchSortField:
+                for sort_order in SortOrder:
+                    with self.subTest(filters=filters, sort_field=sort_field, sort_order=sort_order):
+                        descending = sort_order == SortOrder.DESC
+                        self.assertEqual(
+                            self.search(sort_field=sort_field, sort_order=sort_order, **filters),
+                            self.expected(sort_field, descending, **filters),
+                        )
+
+    def test_default_sort_orders(self) -> None:
+        self.assertEqual(
+            self.search(sort_field=ModsSearchSortField.NAME),
+            self.expected(ModsSearchSortField.NAME, False),
+        )
+        self.assertEqual(
+            self.search(sort_field=ModsSearchSortField.TOTAL_DOWNLOADS),
+            self.expected(ModsSearchSortField.TOTAL_DOWNLOADS, True),
+        )
+        self.assertEqual(self.search(), self.expected(ModsSearchSortField.POPULARITY, True))
+
+    def test_filters(self) -> None:
+        cases: list[dict[str, Any]] = [
+            {"class_id": 6},
+            {"category_ids": [1, 3]},
+            {"game_versions": ["1.20.1"]},
+            {"game_versions": ["1.20.9", "1.19.2"]},
+            {"mod_loader_types": [ModLoaderType.QUILT]},
+            {"game_versions": ["1.20.10"], "mod_loader_types": [ModLoaderType.FORGE, ModLoaderType.FABRIC]},
+            {"game_version_type_id": 2},
+            {"author_id": 1},
+            {"primary_author_id": 2},
+            {"class_id": 12, "category_ids": [2], "game_version_type_id": 1},
+        ]
+        for filters in cases:
+            with self.subTest(filters=filters):
+                self.assertEqual(
+                    self.search(sort_field=ModsSearchSortField.NAME, **filters),
+                    self.expected(ModsSearchSortField.NAME, False, **filters),
+                )
+
+    def test_single_value_filters_are_lists_of_one(self) -> None:
+        self.assertEqual(
+            self.search(category_id=2, game_version="1.20.1", mod_loader_type=ModLoaderType.FABRIC),
+            self.search(category_ids=[2], game_versions=["1.20.1"], mod_loader_types=[ModLoaderType.FABRIC]),
+        )
+        self.assertEqual(self.search(game_version="1.20.1"), self.search(game_version="1.20.1".upper()))
+
+    def test_slug(self) -> None:
+        self.assertEqual(self.search(slug="mod-42"), [42])
+        other_class = 12 if next(m for m in self.mods if m.id == 42).class_id == 6 else 6
+        self.assertEqual(self.search(slug="mod-42", class_id=other_class), [])
+
+    def test_prefixes_match_the_vocabulary(self) -> None:
+        for search_filter in ("sto", "STOR", "storm", "iron che", "carol", "draw", "zzz"):
+            with self.subTest(search_filter=search_filter):
+                self.assertEqual(
+                    self.search(search_filter=search_filter, sort_field=ModsSearchSortField.NAME),
+                    self.expected(ModsSearchSortField.NAME, False, search_filter=search_filter),
+                )
+
+    def test_free_text_ranks_name_matches_first(self) -> None:
+        ranks = {mod_id: rank for rank, mod_id in enumerate(self.expected(ModsSearchSortField.POPULARITY, False))}
+        tokens = tokenize("stone magic")
+        expected = sorted(
+            (mod for mod in self.mods if matches(mod, search_filter="stone magic")),
+            key=lambda mod: (
+                sum(any(t.startswith(token) for t in tokenize(mod.name)) for token in tokens),
+                ranks[mod.id],
+            ),
+            reverse=True,
+        )
+
+        self.assertEqual(self.search(search_filter="stone magic"), [mod.id for mod in expected])
+
+    def test_paging(self) -> None:
+        everything = self.expected(ModsSearchSortField.LAST_UPDATED, True)
+        for index, page_size in ((0, 50), (50, 50), (140, 50), (200, 10), (3, None)):
+            with self.subTest(index=index, page_size=page_size):
+                page = self.index.search_mods(
+                    432, sort_field=ModsSearchSortField.LAST_UPDATED, index=index, page_size=page_size
+                )
+                end = None if page_size is None else index + page_size
+                self.assertEqual([mod.id for mod in page.data], everything[index:end])
+                self.assertEqual(page.pagination.index, index)
+                self.assertEqual(page.pagination.result_count, len(page.data))
+                self.assertEqual(page.pagination.total_count, 150)
+
+    def test_fields_projection(self) -> None:
+        full = self.index.search_mods(432, class_id=6, page_size=5)
+        page = self.index.search_mods(432, class_id=6, page_size=5, fields=["id", "name"])
+
+        self.assertEqual([(mod.id, mod.name) for mod in page.data], [(mod.id, mod.name) for mod in full.data])
+        self.assertTrue(all(mod.summary is None and mod.authors is None for mod in page.data))
+        self.assertEqual(page.pagination, full.pagination)
+
+    def test_replaced_and_removed_mods_leave_the_postings(self) -> None:
+        index = ModSearchIndex(self.mods)
+        renamed = self.mods[0].model_copy(update={"name": "Quantum Quarry", "authors": []})
+
+        index.add([renamed])
+        self.assertEqual([mod.id for mod in index.search_mods(432, search_filter="quant").data], [renamed.id])
+        self.assertNotIn(renamed.id, [mod.id for mod in index.search_mods(432, search_filter=self.mods[0].name).data])
+
+        index.remove([renamed.id, 10_000])
+        self.assertEqual(index.search_mods(432, search_filter="quant").data, [])
+        self.assertEqual(len(index), 149)
+        self.assertNotIn(renamed.id, index)
+
+
+if __name__ == "__main__":
+    unittest.main()
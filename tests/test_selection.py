@@ -0,0 +1,84 @@
+import unittest
+
+from cursedforged.selection import select_file_ids
+from cursedforged.types import FileReleaseType, Mod, ModLoaderType
+
+from .helpers import mod_json
+
+RELEASE = FileReleaseType.RELEASE
+BETA = FileReleaseType.BETA
+ALPHA = FileReleaseType.ALPHA
+FORGE = ModLoaderType.FORGE
+FABRIC = ModLoaderType.FABRIC
+
+
+def make_mod(mod_id: int, *indexes: tuple[int, str, FileReleaseType, ModLoaderType | None]) -> Mod:
+    """Build a mod from `(file_id, game_version, release_type, mod_loader)` file indexes."""
+    return Mod.model_validate(
+        {
+            **mod_json(mod_id),
+            "latestFilesIndexes": [
+                {
+                    "gameVersion": game_version,
+                    "fileId": file_id,
+                    "filename": "file-{}.jar".format(file_id),
+                    "releaseType": int(release_type),
+                    "modLoader": int(mod_loader) if mod_loader is not None else None,
+                }
+                for file_id, game_version, release_type, mod_loader in indexes
+            ],
+        }
+    )
+
+
+class SelectFileIdsTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.mod = make_mod(
+            1,
+            (10, "1.20.1", RELEASE, FORGE),
+            (11, "1.20.1", BETA, FORGE),
+            (12, "1.20.1", ALPHA, FABRIC),
+            (13, "1.19.2", RELEASE, FABRIC),
+            (14, "1.19.2", ALPHA, None),
+        )
+
+    def select(self, **kwargs) -> int | None:
+        return select_file_ids([self.mod], **kwargs)[1]
+
+    def test_releases_are_preferred_over_newer_betas_and_alphas(self) -> None:
+        self.assertEqual(self.select(), 13)
+        self.assertEqual(self.select(game_version="1.20.1"), 10)
+        self.assertEqual(self.select(game_version="1.20.1", mod_loader_type=FABRIC), 12)
+
+    def test_without_preference_the_newest_file_wins(self) -> None:
+        self.assertEqual(self.select(prefer_stable=False), 14)
+        self.assertEqual(self.select(game_version="1.20.1", prefer_stable=False), 12)
+
+    def test_min_release_type_cuts_off_less_stable_files(self) -> None:
+        self.assertEqual(self.select(min_release_type=BETA, prefer_stable=False), 13)
+        self.assertEqual(self.select(game_version="1.20.1", min_release_type=BETA, prefer_stable=False), 11)
+        self.assertEqual(self.select(game_version="1.20.1", mod_loader_type=FABRIC, min_release_type=BETA), None)
+        self.assertEqual(self.select(game_version="1.20.1", min_release_type=RELEASE), 10)
+
+    def test_game_version_and_loader_filters(self) -> None:
+        self.assertEqual(self.select(mod_loader_type=FORGE), 10)
+        self.assertEqual(self.select(mod_loader_type=FABRIC), 13)
+        self.assertEqual(self.select(game_version="1.19.2", mod_loader_type=FORGE), None)
+        self.assertEqual(self.select(game_version="1.18.2"), None)
+
+    def test_main_file_is_the_fallback_without_filters(self) -> None:
+        bare = make_mod(2)
+
+        self.assertEqual(select_file_ids([bare]), {2: 200})
+        self.assertEqual(select_file_ids([bare], game_version="1.20.1"), {2: None})
+        self.assertEqual(select_file_ids([bare], mod_loader_type=FORGE), {2: None})
+        self.assertEqual(select_file_ids([bare], min_release_type=BETA), {2: None})
+
+    def test_every_mod_gets_an_entry(self) -> None:
+        mods = [self.mod, make_mod(2), make_mod(3, (30, "1.20.1", BETA, FORGE))]
+
+        self.assertEqual(select_file_ids(mods, game_version="1.20.1"), {1: 10, 2: None, 3: 30})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+
+from cursedforged.api.client import APIClient
+from cursedforged.api.store import EntityStore
+from cursedforged.types import Mod, project
+
+from .helpers import FakeSession, file_json, mod_json
+
+
+class GetWithMaxAgeTest(unittest.TestCase):
+    def setUp(self) -> None:
+        def handler(method, url, kwargs):
+            if url.endswith("/v1/mods"):
+                return 200, {"data": [mod_json(i) for i in kwargs["json"]["modIds"]]}, {}
+            return 200, {"data": [file_json(i) for i in kwargs["json"]["fileIds"]]}, {}
+
+        self.session = FakeSession(handler)
+        self.store = EntityStore()
+        self.client = APIClient("key", client=self.session, store=self.store)
+
+    def tearDown(self) -> None:
+        self.store.close()
+
+    def test_get_mods_keeps_the_requested_order(self) -> None:
+        self.store.put_mods([Mod.model_validate(mod_json(i)) for i in (2, 4)])
+
+        mods = self.client.v1.get_mods([4, 1, 2, 3], max_age=60).data
+
+        self.assertEqual([mod.id for mod in mods], [4, 1, 2, 3])
+        self.assertEqual(self.session.calls[0][2]["json"]["modIds"], [1, 3])
+
+    def test_get_mods_from_the_store_only(self) -> None:
+        self.store.put_mods([Mod.model_validate(mod_json(i)) for i in (1, 2, 3)])
+
+        mods = self.client.v1.get_mods([3, 1, 2], max_age=60).data
+
+        self.assertEqual([mod.id for mod in mods], [3, 1, 2])
+        self.assertEqual(self.session.calls, [])
+
+    def test_stored_mods_are_projected_like_fetched_ones(self) -> None:
+        self.store.put_mods([Mod.model_validate(mod_json(2))])
+        projected = project(Mod, ["id", "name"])
+
+        mods = self.client.v1.get_mods([1, 2], max_age=60, fields=["id", "name"]).data
+        mod = self.client.v1.get_mod(2, max_age=60, fields=["id", "name"]).data
+
+        self.assertEqual([type(mod) for mod in mods], [projected, projected])
+        self.assertEqual([mod.model_dump() for mod in mods], [{"id": 1, "name": "Mod 1"}, {"id": 2, "name": "Mod 2"}])
+        self.assertIs(type(mod), projected)
+        self.assertIsNone(mod.summary)
+        self.assertEqual(len(self.session.calls), 1)
+
+    def test_get_files_keeps_the_requested_order(self) -> None:
+        self.client.v1.get_files([5])
+
+        files = self.client.v1.get_files([7, 5, 6], max_age=60).data
+
+        self.assertEqual([file.id for file in files], [7, 5, 6])
+        self.assertEqual(self.session.calls[-1][2]["json"]["fileIds"], [7, 6])
@@ -0,0 +1,79 @@
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from cursedforged.api.client import APIClient
+from cursedforged.api.store import EntityStore
+from cursedforged.sync import CatalogSync
+
+from .helpers import CatalogMod, FakeCatalog, FakeSession, results_window
+
+
+def date(day: int) -> str:
+    return (datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(days=day)).isoformat()
+
+
+class CatalogSyncTest(unittest.TestCase):
+    def setUp(self) -> None:
+        # 60 mods over 3 categories of 20, mod i was last modified on day i.
+        self.catalog = FakeCatalog(
+            [CatalogMod(i, date(i), category_id=1 + (i - 1) // 20) for i in range(1, 61)],
+            {6: [1, 2, 3]},
+        )
+        self.session = FakeSession(self.catalog)
+        self.store = EntityStore()
+        self.addCleanup(self.store.close)
+        client = APIClient("key", client=self.session, store=self.store, coalesce=False)
+        self.sync = CatalogSync(client.v1, 432, class_id=6, overlap=timedelta(0), page_size=10)
+        window = results_window(20)
+        window.__enter__()
+        self.addCleanup(window.__exit__, None, None, None)
+
+    def test_first_run_crawls_beyond_the_window_and_saves_the_checkpoint(self) -> None:
+        result = self.sync.run(files=False)
+
+        self.assertTrue(result.complete)
+        self.assertIsNotNone(result.crawl)
+        self.assertEqual(sorted(result.mods), list(range(1, 61)))
+        self.assertEqual(result.checkpoint, datetime.fromisoformat(date(60)))
+        self.assertEqual(self.sync.checkpoint, datetime.fromisoformat(date(60)))
+        self.assertEqual(len(self.store.get_mods(range(1, 61))), 60)
+
+    def test_next_run_only_pages_the_changes(self) -> None:
+        self.sync.run(files=False)
+        for mod in self.catalog.mods[:3]:
+            mod.date_modified = date(100 + mod.mod_id)
+        self.session.calls.clear()
+
+        result = self.sync.run(files=False)
+
+        self.assertTrue(result.complete)
+        self.assertIsNone(result.crawl)
+        self.assertEqual(sorted(result.mods), [1, 2, 3, 60])
+        self.assertEqual(self.sync.checkpoint, datetime.fromisoformat(date(103)))
+        # The first page, and the second one prefetched by iter_pages.
+        self.assertLessEqual(len(self.session.calls), 2)
+
+    def test_naive_since_is_rejected_before_any_request(self) -> None:
+        with self.assertRaises(ValueError):
+            self.sync.run(files=False, since=datetime(2024, 1, 1))
+        self.assertEqual(self.session.calls, [])
+        self.assertIsNone(self.sync.checkpoint)
+
+    def test_first_run_since_a_date(self) -> None:
+        result = self.sync.run(files=False, since=datetime.fromisoformat(date(45)))
+
+        self.assertTrue(result.complete)
+        self.assertIsNone(result.crawl)
+        self.assertEqual(sorted(result.mods), list(range(45, 61)))
+        self.assertEqual(self.sync.checkpoint, datetime.fromisoformat(date(60)))
+
+    def test_truncated_crawl_keeps_the_checkpoint(self) -> None:
+        # 40 mods in a single category, with no further dimension to split on.
+        for mod in self.catalog.mods[:40]:
+            mod.category_id = 1
+
+        result = self.sync.run(files=False)
+
+        self.assertFalse(result.complete)
+        self.assertTrue(result.crawl.truncated)
+        self.assertIsNone(self.sync.checkpoint)
@@ -0,0 +1,143 @@
+import unittest
+
+from cursedforged.types import File, FileIndex, GameVersionsByType, GameVersionType
+from cursedforged.versions import GameVersionIndex, pad_version
+
+from .helpers import file_json
+
+MINECRAFT_1_19 = 73407
+MINECRAFT_1_20 = 75125
+JAVA = 2
+MODLOADER = 68441
+ENVIRONMENT = 75208
+
+
+def version_type(type_id: int, name: str) -> GameVersionType:
+    return GameVersionType.model_validate(
+        {"id": type_id, "gameId": 432, "name": name, "slug": name.lower(), "isSyncable": False, "status": 1}
+    )
+
+
+def make_file(file_id: int, *game_versions: str) -> File:
+    return File.model_validate(file_json(file_id, game_versions=game_versions))
+
+
+class GameVersionIndexTest(unittest.TestCase):
+    def setUp(self) -> None:
+        versions = {
+            MINECRAFT_1_19: ["1.19", "1.19.2", "1.19.4"],
+            MINECRAFT_1_20: ["1.20", "1.20.1", "1.20.4"],
+            JAVA: ["Java 8", "Java 17", "Java 21"],
+            MODLOADER: ["Forge", "Fabric", "NeoForge"],
+            ENVIRONMENT: ["Client", "Server"],
+        }
+        types = {
+            MINECRAFT_1_19: "Minecraft 1.19",
+            MINECRAFT_1_20: "Minecraft 1.20",
+            JAVA: "Java",
+            MODLOADER: "Modloader",
+            ENVIRONMENT: "Environment",
+        }
+        self.index = GameVersionIndex(
+            [GameVersionsByType(type=type_id, versions=names) for type_id, names in versions.items()],
+            [version_type(type_id, name) for type_id, name in types.items()],
+        )
+
+    def test_pad_version(self) -> None:
+        self.assertEqual(pad_version("1.20.1"), "0000000001.0000000020.0000000001")
+        self.assertEqual(pad_version("Java 8"), "0000000008")
+        self.assertEqual(pad_version("Forge"), "0")
+
+    def test_ranges_stay_within_the_family_of_the_bounds(self) -> None:
+        self.assertEqual(
+            self.index.versions("1.19", "1.21"),
+            ["1.19", "1.19.2", "1.19.4", "1.20", "1.20.1", "1.20.4"],
+        )
+        self.assertEqual(self.index.versions("1.20"), ["1.20", "1.20.1", "1.20.4"])
+        self.assertEqual(self.index.versions(upper="1.19.4"), ["1.19", "1.19.2"])
+        self.assertEqual(self.index.versions("Java 11", "Java 21"), ["Java 17"])
+        self.assertEqual(self.index.versions(type_id=MODLOADER), ["Fabric", "Forge", "NeoForge"])
+
+    def test_type_id_filters_within_its_family(self) -> None:
+        self.assertEqual(self.index.versions("1.19", "1.21", type_id=MINECRAFT_1_20), ["1.20", "1.20.1", "1.20.4"])
+
+    def test_ordinals_are_per_family(self) -> None:
+        self.assertLess(self.index.ordinal("1.19.4"), self.index.ordinal("1.20"))
+        self.assertLess(self.index.ordinal("Java 8"), self.index.ordinal("Java 17"))
+        self.assertEqual(self.index.ordinal("Java 8"), 0)
+        self.assertEqual(self.index.family("1.19.2"), "Minecraft")
+        self.assertEqual(self.index.family("1.18"), "Minecraft")
+        self.assertEqual(self.index.family("Java 17"), "Java")
+        self.assertEqual(self.index.family("Java 11"), "Java")
+
+    def test_bounds_of_an_unknown_family(self) -> None:
+        with self.assertRaises(ValueError):
+            self.index.versions("2.0")
+        with self.assertRaises(ValueError):
+            self.index.bounds()
+        self.assertEqual(self.index.bounds("2.0", type_id=MINECRAFT_1_20), (6, 6))
+
+    def test_compatible_ignores_other_families(self) -> None:
+        java_only = make_file(1, "Java 8", "Forge")
+        minecraft = make_file(2, "1.20.1", "Java 17", "Fabric", "Client")
+        old = make_file(3, "1.19.2", "Java 17")
+
+        self.assertEqual(self.index.compatible([java_only, minecraft, old], "1.20", "1.21"), [minecraft])
+        self.assertEqual(self.index.compatible([java_only, minecraft, old], "1.0", "1.21"), [minecraft, old])
+        self.assertEqual(self.index.compatible([java_only, minecraft, old], "Java 17"), [minecraft, old])
+        self.assertEqual(
+            self.index.compatible([java_only, minecraft, old], type_id=MODLOADER), [java_only, minecraft]
+        )
+
+    def test_compatible_file_indexes(self) -> None:
+        indexes = [
+            FileIndex.model_validate(
+                {"gameVersion": version, "fileId": file_id, "filename": "f.jar", "releaseType": 1}
+            )
+            for file_id, version in enumerate(["1.19.4", "1.20.1", "Java 17"])
+        ]
+
+        self.assertEqual([i.file_id for i in self.index.compatible(indexes, "1.19.4", "1.20.2")], [0, 1])
+
+    def test_newest_version_ignores_other_families(self) -> None:
+        file = make_file(1, "1.19.2", "1.20.1", "Java 21", "NeoForge", "Server")
+
+        self.assertEqual(self.index.newest_version(file), "1.20.1")
+        self.assertEqual(self.index.newest_version(file, JAVA), "Java 21")
+        self.assertIsNone(self.index.newest_version(make_file(2, "Java 8", "Forge")))
+
+    def test_without_type_names_every_type_is_a_family(self) -> None:
+        index = GameVersionIndex(
+            [
+                GameVersionsByType(type=MINECRAFT_1_20, versions=["1.20", "1.20.1"]),
+                GameVersionsByType(type=JAVA, versions=["Java 8", "Java 17"]),
+            ]
+        )
+
+        self.assertEqual(index.versions("1.0"), ["1.20", "1.20.1"])
+        self.assertEqual(index.family("1.20.1"), MINECRAFT_1_20)
+
+    def test_sortable_versions_take_precedence(self) -> None:
+        file = File.model_validate(
+            {
+                **file_json(1, game_versions=("1.20.1-pre1",)),
+                "sortableGameVersions": [
+                    {
+                        "gameVersionName": "1.20.1-pre1",
+                        "gameVersionPadded": "0000000001.0000000020.0000000000",
+                        "gameVersion": "1.20.1",
+                        "gameVersionReleaseDate": "2023-06-01T00:00:00Z",
+                        "gameVersionTypeId": MINECRAFT_1_20,
+                    }
+                ],
+            }
+        )
+
+        self.index.add_files([file])
+
+        self.assertEqual(self.index.versions("1.20", "1.20.1"), ["1.20", "1.20.1-pre1"])
+        self.assertEqual(self.index.by_type()[MINECRAFT_1_20], ["1.20", "1.20.1-pre1", "1.20.1", "1.20.4"])
+
+
+if __name__ == "__main__":
+    unittest.main()